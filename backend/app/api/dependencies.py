@@ -0,0 +1,42 @@
+import time
+
+from fastapi import Depends, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.catalog_store import CatalogData, catalog_store
+from app.db import get_async_db
+from app.models import CatalogVersion
+from app.planner.timing import PhaseTimings
+
+
+def get_request_timings(request: Request) -> PhaseTimings:
+    timings = getattr(request.state, "timings", None)
+    if timings is None:
+        timings = PhaseTimings()
+        request.state.timings = timings
+    return timings
+
+
+async def get_catalog_version(
+    db: AsyncSession = Depends(get_async_db),
+    timings: PhaseTimings = Depends(get_request_timings),
+) -> int:
+    started_at = time.perf_counter()
+    result = await db.execute(select(CatalogVersion.version).where(CatalogVersion.id == 1))
+    version = result.scalar_one_or_none()
+    timings.add("db", time.perf_counter() - started_at)
+    if version is None:
+        return 0
+    return version
+
+
+async def get_catalog(
+    db: AsyncSession = Depends(get_async_db),
+    catalog_version: int = Depends(get_catalog_version),
+    timings: PhaseTimings = Depends(get_request_timings),
+) -> CatalogData:
+    started_at = time.perf_counter()
+    catalog = await catalog_store.get(db, catalog_version)
+    timings.add("db", time.perf_counter() - started_at)
+    return catalog
@@ -0,0 +1,39 @@
+import asyncio
+from collections.abc import Awaitable
+from typing import TypeVar
+
+from fastapi import Request, Response
+
+
+DisconnectResult = TypeVar("DisconnectResult")
+
+CLIENT_CLOSED_REQUEST_STATUS = 499
+
+
+class ClientDisconnectedError(Exception):
+    pass
+
+
+async def client_disconnected_handler(request: Request, exc: Exception) -> Response:
+    return Response(status_code=CLIENT_CLOSED_REQUEST_STATUS)
+
+
+async def wait_for_disconnect(request: Request) -> None:
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def cancel_on_disconnect(request: Request, work: Awaitable[DisconnectResult]) -> DisconnectResult:
+    work_task = asyncio.ensure_future(work)
+    disconnect_task = asyncio.ensure_future(wait_for_disconnect(request))
+    try:
+        done, _ = await asyncio.wait({work_task, disconnect_task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        disconnect_task.cancel()
+        if not work_task.done():
+            work_task.cancel()
+    if work_task not in done:
+        raise ClientDisconnectedError()
+    return work_task.result()
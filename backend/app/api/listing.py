@@ -0,0 +1,55 @@
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
+
+
+MAX_PAGE_SIZE = 1000
+
+
+def catalog_etag(catalog_version: int) -> str:
+    return f'W/"catalog-{catalog_version}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+def parse_fields(fields: str | None, allowed_fields: list[str], key_field: str) -> list[str]:
+    if fields is None:
+        return allowed_fields
+
+    requested_fields = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown_fields = sorted(set(requested_fields) - set(allowed_fields))
+    if unknown_fields:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields: {', '.join(unknown_fields)}",
+        )
+
+    selected_fields = [key_field]
+    for field in requested_fields:
+        if field not in selected_fields:
+            selected_fields.append(field)
+    return selected_fields
+
+
+def catalog_page_response(rows: list[dict], limit: int | None, key_field: str, etag: str) -> JSONResponse:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = str(rows[-1][key_field])
+    return JSONResponse(content=rows, headers=headers)
@@ -0,0 +1,67 @@
+import time
+
+from fastapi import Response
+from pydantic import BaseModel
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import observe_request
+from app.planner.solver_pool import SolverRun
+from app.planner.timing import PhaseTimings
+
+
+def server_timing_header(timings: PhaseTimings, total_seconds: float) -> str:
+    entries = [f"{phase};dur={seconds * 1000:.2f}" for phase, seconds in timings.seconds_by_phase.items()]
+    entries.append(f"total;dur={total_seconds * 1000:.2f}")
+    return ", ".join(entries)
+
+
+def record_solver_run(timings: PhaseTimings, solver_run: SolverRun) -> None:
+    timings.add("queue", solver_run.queue_seconds)
+    timings.merge(solver_run.timings)
+
+
+def encode_json_response(content: BaseModel, headers: dict[str, str], timings: PhaseTimings) -> Response:
+    started_at = time.perf_counter()
+    response = Response(content=content.model_dump_json(), media_type="application/json", headers=headers)
+    timings.add("serialize", time.perf_counter() - started_at)
+    return response
+
+
+class RequestTimingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        timings = PhaseTimings()
+        if "state" not in scope:
+            scope["state"] = {}
+        scope["state"]["timings"] = timings
+        status_code = 500
+
+        async def send_with_server_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing_header(timings, time.perf_counter() - started_at))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            route = scope.get("route")
+            route_path = route.path if route is not None else "unmatched"
+            if route_path != "/metrics":
+                observe_request(
+                    route_path,
+                    scope["method"],
+                    status_code,
+                    timings,
+                    time.perf_counter() - started_at,
+                )
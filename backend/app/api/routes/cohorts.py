@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+
+from app.api.dependencies import get_catalog, get_request_timings
+from app.api.disconnect import cancel_on_disconnect
+from app.api.request_timing import encode_json_response, record_solver_run
+from app.catalog_store import CatalogData
+from app.planner.cohort_allocator import allocate_cohort
+from app.planner.section_conflicts import section_conflict_index_cache
+from app.planner.solver_pool import solver_pool
+from app.planner.timing import PhaseTimings
+from app.schemas.planning import CohortAllocationRequest, CohortAllocationResponse
+
+
+router = APIRouter(prefix="/plan/cohort", tags=["cohort-planning"])
+
+
+@router.post("/", response_model=CohortAllocationResponse)
+async def allocate_cohort_sections(
+    request: CohortAllocationRequest,
+    http_request: Request,
+    catalog: CatalogData = Depends(get_catalog),
+    timings: PhaseTimings = Depends(get_request_timings),
+) -> Response:
+    if not request.students:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one student must be provided.",
+        )
+
+    requested_course_codes: set[str] = set()
+    for student in request.students:
+        if not student.course_codes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Student {student.student_id} has no course codes.",
+            )
+        requested_course_codes.update(student.course_codes)
+
+    missing_courses = sorted(requested_course_codes - set(catalog.courses))
+    if missing_courses:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown course codes: {', '.join(missing_courses)}",
+        )
+
+    fingerprint = catalog.section_fingerprints_by_term.get(request.term_id, (0, 0))
+    conflict_index = section_conflict_index_cache.get_or_build(
+        request.term_id,
+        fingerprint,
+        lambda: catalog.sections_by_term.get(request.term_id, []),
+    )
+    sections = conflict_index.sections_for_courses(sorted(requested_course_codes))
+    solver_run = await cancel_on_disconnect(
+        http_request,
+        solver_pool.run(allocate_cohort, request, sections, conflict_index.restricted_to(sections)),
+    )
+    record_solver_run(timings, solver_run)
+    return encode_json_response(
+        solver_run.value,
+        {"X-Solver-Queue-Seconds": f"{solver_run.queue_seconds:.4f}"},
+        timings,
+    )
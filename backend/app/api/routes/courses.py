@@ -1,28 +1,75 @@
-from collections.abc import Sequence
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_db
+from app.api.dependencies import get_catalog, get_catalog_version, get_request_timings
+from app.api.listing import (
+    MAX_PAGE_SIZE,
+    catalog_etag,
+    catalog_page_response,
+    etag_matches,
+    not_modified_response,
+    parse_fields,
+)
+from app.course_search import course_search_index
+from app.db import get_async_db
 from app.models import Course
-from app.schemas.courses import CourseRead
+from app.planner.timing import PhaseTimings
+from app.schemas.courses import CourseListItem, CourseRead, CourseSearchResult
 
 
 router = APIRouter(prefix="/courses", tags=["courses"])
 
 
-@router.get("/", response_model=list[CourseRead])
-def list_courses(db: Session = Depends(get_db)) -> list[CourseRead]:
-    statement = select(Course).order_by(Course.code)
-    result = db.execute(statement)
-    courses: Sequence[Course] = result.scalars().all()
-    return [CourseRead.model_validate(course) for course in courses]
+COURSE_COLUMNS = {
+    "code": Course.code,
+    "name": Course.name,
+    "credits": Course.credits,
+    "description": Course.description,
+}
+
+
+@router.get("/", response_model=list[CourseListItem])
+async def list_courses(
+    request: Request,
+    after: str | None = None,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    catalog_version: int = Depends(get_catalog_version),
+) -> Response:
+    selected_fields = parse_fields(fields, list(COURSE_COLUMNS), "code")
+    etag = catalog_etag(catalog_version)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    statement = select(*[COURSE_COLUMNS[field] for field in selected_fields]).order_by(Course.code)
+    if after is not None:
+        statement = statement.where(Course.code > after)
+    if limit is not None:
+        statement = statement.limit(limit + 1)
+    result = await db.execute(statement)
+    rows = [dict(row._mapping) for row in result]
+    return catalog_page_response(rows, limit, "code", etag)
+
+
+@router.get("/search", response_model=list[CourseSearchResult])
+async def search_courses(
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=10, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db),
+    timings: PhaseTimings = Depends(get_request_timings),
+) -> list[CourseSearchResult]:
+    if course_search_index.needs_refresh():
+        catalog_version = await get_catalog_version(db, timings)
+        catalog = await get_catalog(db, catalog_version, timings)
+        course_search_index.sync(catalog.courses, catalog.version)
+    return [CourseSearchResult.model_validate(match) for match in course_search_index.search(q, limit)]
 
 
 @router.get("/{course_code}", response_model=CourseRead)
-def get_course(course_code: str, db: Session = Depends(get_db)) -> CourseRead:
-    course = db.get(Course, course_code)
+async def get_course(course_code: str, db: AsyncSession = Depends(get_async_db)) -> CourseRead:
+    course = await db.get(Course, course_code)
     if course is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
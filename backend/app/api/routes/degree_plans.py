@@ -1,47 +1,52 @@
-from collections.abc import Sequence
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
-from sqlalchemy.orm import Session
-
-from app.db import get_db
-from app.models import Program, ProgramRequirement, Course, Prerequisite, CourseOffering
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.api.dependencies import get_catalog, get_request_timings
+from app.api.disconnect import cancel_on_disconnect
+from app.api.request_timing import encode_json_response, record_solver_run
+from app.catalog_store import CatalogData
+from app.metrics import observe_admission
+from app.planner.admission import PlanningLane, admit_degree_plan
 from app.planner.degree_planner import (
     CatalogSnapshot,
     RequiredCourse,
     CoursePrerequisite,
     compute_degree_plan,
 )
-from app.schemas.planning import DegreePlanRequest, DegreePlanResponse
+from app.planner.result_cache import degree_plan_cache_key, degree_plan_result_cache
+from app.planner.single_flight import planning_single_flight
+from app.planner.solver_pool import SolverPoolFullError, cheap_solver_pool, solver_pool
+from app.planner.timing import PhaseTimings
+from app.schemas.planning import (
+    DegreePlanBatchItem,
+    DegreePlanBatchRequest,
+    DegreePlanRequest,
+    DegreePlanResponse,
+)
 
 
 router = APIRouter(prefix="/plan/degree", tags=["degree-planning"])
+logger = logging.getLogger(__name__)
 
 
-@router.post("/", response_model=DegreePlanResponse)
-def plan_degree(request: DegreePlanRequest, db: Session = Depends(get_db)) -> DegreePlanResponse:
-    program = db.get(Program, request.program_id)
-    if program is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Program not found",
-        )
+class ProgramNotFoundError(Exception):
+    pass
 
-    course_statement = (
-        select(Course.code, Course.credits)
-        .join(ProgramRequirement, ProgramRequirement.course_code == Course.code)
-        .where(ProgramRequirement.program_id == request.program_id)
-        .where(ProgramRequirement.requirement_type == "REQUIRED")
-        .order_by(Course.code)
-    )
-    course_result = db.execute(course_statement)
-    course_rows: Sequence[tuple[str, float]] = course_result.all()
+
+def build_catalog_snapshot(request: DegreePlanRequest, catalog: CatalogData) -> CatalogSnapshot:
+    if request.program_id not in catalog.programs:
+        raise ProgramNotFoundError(request.program_id)
 
     completed_set = set(request.completed_courses)
     required_courses: list[RequiredCourse] = []
     required_course_codes: set[str] = set()
 
-    for course_code, credits in course_rows:
+    for course_code in catalog.required_course_codes_by_program.get(request.program_id, []):
         if course_code in completed_set:
             continue
         if course_code in required_course_codes:
@@ -50,53 +55,136 @@ def plan_degree(request: DegreePlanRequest, db: Session = Depends(get_db)) -> De
         required_courses.append(
             RequiredCourse(
                 code=course_code,
-                credits=credits,
+                credits=catalog.courses[course_code].credits,
             )
         )
 
-    prerequisite_statement = (
-        select(Prerequisite.course_code, Prerequisite.prereq_code)
-        .where(Prerequisite.course_code.in_(required_course_codes))
-        .order_by(Prerequisite.course_code)
-    )
-    prerequisite_result = db.execute(prerequisite_statement)
-    prerequisite_rows: Sequence[tuple[str, str]] = prerequisite_result.all()
-
     prerequisites: list[CoursePrerequisite] = []
-    for course_code, prereq_code in prerequisite_rows:
-        prerequisites.append(
-            CoursePrerequisite(
-                course_code=course_code,
-                prerequisite_code=prereq_code,
+    for required_course in required_courses:
+        for prereq_code in catalog.prerequisite_codes_by_course.get(required_course.code, []):
+            prerequisites.append(
+                CoursePrerequisite(
+                    course_code=required_course.code,
+                    prerequisite_code=prereq_code,
+                )
             )
-        )
 
     term_index_by_id: dict[str, int] = {term_id: index for index, term_id in enumerate(request.allowed_terms)}
 
-    offering_statement = (
-        select(CourseOffering.course_code, CourseOffering.term_id)
-        .where(CourseOffering.course_code.in_(required_course_codes))
-        .where(CourseOffering.term_id.in_(request.allowed_terms))
-        .order_by(CourseOffering.course_code)
-    )
-    offering_result = db.execute(offering_statement)
-    offering_rows: Sequence[tuple[str, str]] = offering_result.all()
-
     offered_term_indices_by_course: dict[str, set[int]] = {}
-    for course_code, term_id in offering_rows:
-        term_index = term_index_by_id.get(term_id)
-        if term_index is None:
-            continue
-        if course_code not in offered_term_indices_by_course:
-            offered_term_indices_by_course[course_code] = set()
-        offered_term_indices_by_course[course_code].add(term_index)
-
-    catalog = CatalogSnapshot(
+    for required_course in required_courses:
+        for term_id in catalog.offered_terms_by_course.get(required_course.code, set()):
+            term_index = term_index_by_id.get(term_id)
+            if term_index is None:
+                continue
+            if required_course.code not in offered_term_indices_by_course:
+                offered_term_indices_by_course[required_course.code] = set()
+            offered_term_indices_by_course[required_course.code].add(term_index)
+
+    return CatalogSnapshot(
         required_courses=required_courses,
         prerequisites=prerequisites,
         offered_term_indices_by_course=offered_term_indices_by_course,
         completed_courses=completed_set,
     )
 
-    response = compute_degree_plan(request, catalog)
-    return response
+
+@router.post("/", response_model=DegreePlanResponse)
+async def plan_degree(
+    request: DegreePlanRequest,
+    http_request: Request,
+    catalog: CatalogData = Depends(get_catalog),
+    timings: PhaseTimings = Depends(get_request_timings),
+) -> Response:
+    cache_key = degree_plan_cache_key(request, catalog.version)
+    cached_response = degree_plan_result_cache.get(cache_key)
+    if cached_response is not None:
+        return encode_json_response(cached_response, {}, timings)
+
+    build_started_at = time.perf_counter()
+    try:
+        catalog_snapshot = build_catalog_snapshot(request, catalog)
+    except ProgramNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Program not found",
+        )
+    timings.add("build", time.perf_counter() - build_started_at)
+    admission = admit_degree_plan(request, catalog_snapshot)
+    observe_admission("degree", admission)
+
+    solver_run = await cancel_on_disconnect(
+        http_request,
+        planning_single_flight.run(
+            cache_key,
+            lambda: admission.pool.run(compute_degree_plan, request, catalog_snapshot),
+        ),
+    )
+    record_solver_run(timings, solver_run)
+    response = solver_run.value
+    degree_plan_result_cache.put(cache_key, response)
+    return encode_json_response(
+        response,
+        {"X-Solver-Queue-Seconds": f"{solver_run.queue_seconds:.4f}"},
+        timings,
+    )
+
+
+@router.post("/batch")
+async def plan_degree_batch(
+    batch: DegreePlanBatchRequest,
+    catalog: CatalogData = Depends(get_catalog),
+    timings: PhaseTimings = Depends(get_request_timings),
+) -> StreamingResponse:
+    concurrency_by_lane: dict[PlanningLane, asyncio.Semaphore] = {
+        "cheap": asyncio.Semaphore(cheap_solver_pool.max_workers),
+        "expensive": asyncio.Semaphore(solver_pool.max_workers),
+    }
+
+    async def plan_batch_item(index: int, request: DegreePlanRequest) -> DegreePlanBatchItem:
+        cache_key = degree_plan_cache_key(request, catalog.version)
+        cached_response = degree_plan_result_cache.get(cache_key)
+        if cached_response is not None:
+            return DegreePlanBatchItem(index=index, status="OK", response=cached_response)
+
+        try:
+            catalog_snapshot = build_catalog_snapshot(request, catalog)
+        except ProgramNotFoundError:
+            return DegreePlanBatchItem(index=index, status="NOT_FOUND", detail="Program not found")
+        admission = admit_degree_plan(request, catalog_snapshot)
+        observe_admission("degree", admission)
+
+        async with concurrency_by_lane[admission.lane]:
+            try:
+                solver_run = await planning_single_flight.run(
+                    cache_key,
+                    lambda: admission.pool.run(compute_degree_plan, request, catalog_snapshot),
+                )
+            except SolverPoolFullError:
+                return DegreePlanBatchItem(index=index, status="UNAVAILABLE", detail="Planner is at capacity.")
+        record_solver_run(timings, solver_run)
+
+        degree_plan_result_cache.put(cache_key, solver_run.value)
+        return DegreePlanBatchItem(index=index, status="OK", response=solver_run.value)
+
+    async def plan_item(index: int, request: DegreePlanRequest) -> DegreePlanBatchItem:
+        try:
+            return await plan_batch_item(index, request)
+        except Exception:
+            logger.exception("Degree plan batch item %d failed", index)
+            return DegreePlanBatchItem(index=index, status="ERROR", detail="Planning failed.")
+
+    async def encode_items() -> AsyncIterator[str]:
+        tasks = [asyncio.ensure_future(plan_item(index, request)) for index, request in enumerate(batch.requests)]
+        try:
+            for task in tasks:
+                item = await task
+                serialize_started_at = time.perf_counter()
+                encoded_item = item.model_dump_json() + "\n"
+                timings.add("serialize", time.perf_counter() - serialize_started_at)
+                yield encoded_item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(encode_items(), media_type="application/x-ndjson")
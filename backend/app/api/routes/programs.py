@@ -1,28 +1,58 @@
-from collections.abc import Sequence
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import select
-from sqlalchemy.orm import Session
-
-from app.db import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_catalog_version
+from app.api.listing import (
+    MAX_PAGE_SIZE,
+    catalog_etag,
+    catalog_page_response,
+    etag_matches,
+    not_modified_response,
+    parse_fields,
+)
+from app.db import get_async_db
 from app.models import Program
-from app.schemas.programs import ProgramRead
+from app.schemas.programs import ProgramListItem, ProgramRead
 
 
 router = APIRouter(prefix="/programs", tags=["programs"])
 
 
-@router.get("/", response_model=list[ProgramRead])
-def list_programs(db: Session = Depends(get_db)) -> list[ProgramRead]:
-    statement = select(Program).order_by(Program.id)
-    result = db.execute(statement)
-    programs: Sequence[Program] = result.scalars().all()
-    return [ProgramRead.model_validate(program) for program in programs]
+PROGRAM_COLUMNS = {
+    "id": Program.id,
+    "name": Program.name,
+    "description": Program.description,
+}
+
+
+@router.get("/", response_model=list[ProgramListItem])
+async def list_programs(
+    request: Request,
+    after: str | None = None,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    catalog_version: int = Depends(get_catalog_version),
+) -> Response:
+    selected_fields = parse_fields(fields, list(PROGRAM_COLUMNS), "id")
+    etag = catalog_etag(catalog_version)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    statement = select(*[PROGRAM_COLUMNS[field] for field in selected_fields]).order_by(Program.id)
+    if after is not None:
+        statement = statement.where(Program.id > after)
+    if limit is not None:
+        statement = statement.limit(limit + 1)
+    result = await db.execute(statement)
+    rows = [dict(row._mapping) for row in result]
+    return catalog_page_response(rows, limit, "id", etag)
 
 
 @router.get("/{program_id}", response_model=ProgramRead)
-def get_program(program_id: str, db: Session = Depends(get_db)) -> ProgramRead:
-    program = db.get(Program, program_id)
+async def get_program(program_id: str, db: AsyncSession = Depends(get_async_db)) -> ProgramRead:
+    program = await db.get(Program, program_id)
     if program is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
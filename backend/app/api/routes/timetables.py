@@ -1,61 +1,177 @@
-from collections.abc import Sequence
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from anyio import to_thread
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
-from app.db import get_db
-from app.models import Course, Section
-from app.planner.timetable_planner import TimetableSectionInput, compute_timetable
-from app.schemas.planning import TimetableRequest, TimetableResponse
+from app.api.dependencies import get_catalog, get_request_timings
+from app.api.disconnect import cancel_on_disconnect
+from app.api.request_timing import record_solver_run
+from app.api.timetable_encoding import encode_timetable_response
+from app.catalog_store import CatalogData
+from app.metrics import observe_admission
+from app.planner.admission import BUSY_TIMETABLE_WARNING, admit_timetable, degrade_timetable_request
+from app.planner.cancellation import SolveCancellation
+from app.planner.result_cache import timetable_cache_key, timetable_result_cache
+from app.planner.section_conflicts import section_conflict_index_cache
+from app.planner.single_flight import planning_single_flight
+from app.planner.timing import PhaseTimings
+from app.planner.timetable_planner import (
+    SectionConflictIndex,
+    TimetableSectionInput,
+    compute_timetable,
+    resolve_time_budget_seconds,
+    stream_timetable,
+)
+from app.schemas.planning import (
+    TimetableRequest,
+    TimetableResponse,
+    TimetableStreamEvent,
+    TimetableStreamOption,
+    TimetableStreamSummary,
+)
 
 
 router = APIRouter(prefix="/plan/timetable", tags=["timetable-planning"])
 
 
-@router.post("/", response_model=TimetableResponse)
-def plan_timetable(request: TimetableRequest, db: Session = Depends(get_db)) -> TimetableResponse:
+def load_timetable_sections(
+    request: TimetableRequest,
+    catalog: CatalogData,
+) -> tuple[list[TimetableSectionInput], SectionConflictIndex]:
     if not request.course_codes:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="At least one course code must be provided.",
         )
 
-    course_statement = (
-        select(Course.code)
-        .where(Course.code.in_(request.course_codes))
-        .order_by(Course.code)
-    )
-    course_result = db.execute(course_statement)
-    existing_course_codes: Sequence[str] = [row[0] for row in course_result.all()]
-    missing_courses = sorted(set(request.course_codes) - set(existing_course_codes))
+    missing_courses = sorted(set(request.course_codes) - set(catalog.courses))
     if missing_courses:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Unknown course codes: {', '.join(missing_courses)}",
         )
 
-    section_statement = (
-        select(Section)
-        .where(Section.term_id == request.term_id)
-        .where(Section.course_code.in_(request.course_codes))
-        .order_by(Section.course_code, Section.kind, Section.start_time_minutes)
+    fingerprint = catalog.section_fingerprints_by_term.get(request.term_id, (0, 0))
+    conflict_index = section_conflict_index_cache.get_or_build(
+        request.term_id,
+        fingerprint,
+        lambda: catalog.sections_by_term.get(request.term_id, []),
+    )
+    sections = conflict_index.sections_for_courses(request.course_codes)
+    return sections, conflict_index.restricted_to(sections)
+
+
+@router.post("/", response_model=TimetableResponse)
+async def plan_timetable(
+    request: TimetableRequest,
+    http_request: Request,
+    response_format: Literal["full", "compact"] = Query(default="full", alias="format"),
+    catalog: CatalogData = Depends(get_catalog),
+    timings: PhaseTimings = Depends(get_request_timings),
+) -> Response:
+    cache_key = timetable_cache_key(request, catalog.version)
+    cached_response = timetable_result_cache.get(cache_key)
+    if cached_response is not None:
+        return encode_timetable_response(cached_response, response_format, {}, timings)
+
+    sections, conflict_index = load_timetable_sections(request, catalog)
+    admission = admit_timetable(request, sections, conflict_index)
+    observe_admission("timetable", admission)
+    planning_request = request
+    if admission.busy:
+        planning_request = degrade_timetable_request(request)
+    planning_cache_key = timetable_cache_key(planning_request, catalog.version)
+    flight_key = (planning_cache_key, resolve_time_budget_seconds(planning_request))
+
+    solver_run = await cancel_on_disconnect(
+        http_request,
+        planning_single_flight.run(
+            flight_key,
+            lambda: admission.pool.run(compute_timetable, planning_request, sections, conflict_index),
+        ),
+    )
+    record_solver_run(timings, solver_run)
+    response = solver_run.value
+    if response.status == "COMPLETE":
+        timetable_result_cache.put(planning_cache_key, response)
+    if planning_request != request:
+        response = response.model_copy(update={"warnings": [*response.warnings, BUSY_TIMETABLE_WARNING]})
+    return encode_timetable_response(
+        response,
+        response_format,
+        {"X-Solver-Queue-Seconds": f"{solver_run.queue_seconds:.4f}"},
+        timings,
     )
-    section_result = db.execute(section_statement)
-    section_models: Sequence[Section] = section_result.scalars().all()
-
-    sections: list[TimetableSectionInput] = []
-    for section_model in section_models:
-        sections.append(
-            TimetableSectionInput(
-                section_id=str(section_model.id),
-                course_code=section_model.course_code,
-                kind=section_model.kind,
-                day_of_week=section_model.day_of_week,
-                start_time_minutes=section_model.start_time_minutes,
-                end_time_minutes=section_model.end_time_minutes,
-            )
+
+
+@router.post("/stream")
+def stream_plan_timetable(
+    request: TimetableRequest,
+    catalog: CatalogData = Depends(get_catalog),
+    timings: PhaseTimings = Depends(get_request_timings),
+) -> StreamingResponse:
+    cache_key = timetable_cache_key(request, catalog.version)
+    cached_response = timetable_result_cache.get(cache_key)
+    if cached_response is not None:
+        return StreamingResponse(
+            encode_timetable_events(replay_timetable_response(cached_response)),
+            media_type="application/x-ndjson",
         )
 
-    response = compute_timetable(request, sections)
-    return response
+    sections, conflict_index = load_timetable_sections(request, catalog)
+    admission = admit_timetable(request, sections, conflict_index)
+    observe_admission("timetable", admission)
+    planning_request = request
+    if admission.busy:
+        planning_request = degrade_timetable_request(request)
+        cache_key = timetable_cache_key(planning_request, catalog.version)
+    slot = admission.pool.acquire()
+    cancellation = SolveCancellation()
+
+    async def encode_events() -> AsyncIterator[str]:
+        events = stream_timetable(planning_request, sections, conflict_index, timings, cancellation)
+        streamed_response = TimetableResponse(options=[])
+        try:
+            while True:
+                event = await to_thread.run_sync(next, events, None, abandon_on_cancel=True)
+                if event is None:
+                    break
+                if isinstance(event, TimetableStreamOption):
+                    streamed_response.options.append(event.option)
+                else:
+                    streamed_response.status = event.status
+                    streamed_response.warnings = event.warnings
+                    if planning_request != request:
+                        event = event.model_copy(update={"warnings": [*event.warnings, BUSY_TIMETABLE_WARNING]})
+                serialize_started_at = time.perf_counter()
+                encoded_event = event.model_dump_json() + "\n"
+                timings.add("serialize", time.perf_counter() - serialize_started_at)
+                yield encoded_event
+        except BaseException:
+            cancellation.cancel()
+            raise
+        finally:
+            slot.release()
+        if streamed_response.status == "COMPLETE":
+            timetable_result_cache.put(cache_key, streamed_response)
+
+    return StreamingResponse(
+        encode_events(),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(slot.release),
+    )
+
+
+def encode_timetable_events(events: Iterator[TimetableStreamEvent]) -> Iterator[str]:
+    for event in events:
+        yield event.model_dump_json() + "\n"
+
+
+def replay_timetable_response(response: TimetableResponse) -> Iterator[TimetableStreamEvent]:
+    for option in response.options:
+        yield TimetableStreamOption(option=option)
+    yield TimetableStreamSummary(status=response.status, warnings=response.warnings)
@@ -0,0 +1,86 @@
+import time
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+from app.planner.timing import PhaseTimings
+from app.schemas.planning import TimetableResponse
+
+
+def compact_timetable_payload(response: TimetableResponse) -> dict:
+    section_index_by_id: dict[str, int] = {}
+    section_ids: list[str] = []
+    course_codes: list[str] = []
+    kinds: list[str] = []
+    days_of_week: list[str] = []
+    start_times_minutes: list[int] = []
+    end_times_minutes: list[int] = []
+    alternative_section_ids: list[list[str]] = []
+
+    option_section_indices: list[list[int]] = []
+    option_penalties: list[float | None] = []
+    option_statuses: list[str] = []
+    option_solver_stats: list[dict | None] = []
+    for option in response.options:
+        section_indices: list[int] = []
+        for section in option.sections:
+            section_index = section_index_by_id.get(section.section_id)
+            if section_index is None:
+                section_index = len(section_ids)
+                section_index_by_id[section.section_id] = section_index
+                section_ids.append(section.section_id)
+                course_codes.append(section.course_code)
+                kinds.append(section.kind)
+                days_of_week.append(section.day_of_week)
+                start_times_minutes.append(section.start_time_minutes)
+                end_times_minutes.append(section.end_time_minutes)
+                alternative_section_ids.append(section.alternative_section_ids)
+            section_indices.append(section_index)
+        option_section_indices.append(section_indices)
+        option_penalties.append(option.objective.total_penalty)
+        option_statuses.append(option.objective.status)
+        solver_stats = option.objective.solver_stats
+        option_solver_stats.append(solver_stats.model_dump() if solver_stats is not None else None)
+
+    options = {
+        "section_indices": option_section_indices,
+        "total_penalty": option_penalties,
+        "status": option_statuses,
+    }
+    if any(solver_stats is not None for solver_stats in option_solver_stats):
+        options["solver_stats"] = option_solver_stats
+
+    return {
+        "format": "compact",
+        "status": response.status,
+        "warnings": response.warnings,
+        "sections": {
+            "section_id": section_ids,
+            "course_code": course_codes,
+            "kind": kinds,
+            "day_of_week": days_of_week,
+            "start_time_minutes": start_times_minutes,
+            "end_time_minutes": end_times_minutes,
+            "alternative_section_ids": alternative_section_ids,
+        },
+        "options": options,
+    }
+
+
+def encode_timetable_response(
+    response: TimetableResponse,
+    response_format: str,
+    headers: dict[str, str],
+    timings: PhaseTimings,
+) -> Response:
+    started_at = time.perf_counter()
+    if response_format == "compact":
+        encoded_response = ORJSONResponse(content=compact_timetable_payload(response), headers=headers)
+    else:
+        encoded_response = Response(
+            content=response.model_dump_json(),
+            media_type="application/json",
+            headers=headers,
+        )
+    timings.add("serialize", time.perf_counter() - started_at)
+    return encoded_response
@@ -0,0 +1,100 @@
+import argparse
+import math
+import random
+import time
+
+from app.planner.cohort_allocator import allocate_cohort, group_cohort_demand
+from app.planner.timetable_planner import TimetableSectionInput, build_section_conflict_index
+from app.schemas.planning import CohortAllocationRequest, CohortStudentRequest, TimetablePreferences
+
+
+DAYS_OF_WEEK = ["MON", "TUE", "WED", "THU", "FRI"]
+START_TIMES = [510, 600, 690, 780, 870, 960]
+
+
+def generate_term_sections(
+    course_count: int,
+    sections_per_course: int,
+    demand_by_course: dict[str, int],
+    random_generator: random.Random,
+) -> list[TimetableSectionInput]:
+    sections: list[TimetableSectionInput] = []
+    for course_number in range(course_count):
+        course_code = f"C{course_number:03d}"
+        section_capacity = math.ceil(demand_by_course.get(course_code, 0) * 1.2 / sections_per_course)
+        for section_number in range(sections_per_course):
+            start_time_minutes = random_generator.choice(START_TIMES)
+            sections.append(
+                TimetableSectionInput(
+                    section_id=f"{course_code}-LEC-{section_number:03d}",
+                    course_code=course_code,
+                    kind="LEC",
+                    day_of_week=random_generator.choice(DAYS_OF_WEEK),
+                    start_time_minutes=start_time_minutes,
+                    end_time_minutes=start_time_minutes + 80,
+                    capacity=section_capacity,
+                )
+            )
+    return sections
+
+
+def generate_cohort_request(
+    student_count: int,
+    course_count: int,
+    bundle_count: int,
+    courses_per_student: int,
+    random_generator: random.Random,
+) -> CohortAllocationRequest:
+    course_codes = [f"C{course_number:03d}" for course_number in range(course_count)]
+    bundles = [random_generator.sample(course_codes, courses_per_student) for _ in range(bundle_count)]
+    preference_choices = [
+        TimetablePreferences(),
+        TimetablePreferences(earliest_time_minutes=600),
+        TimetablePreferences(avoid_friday=True),
+    ]
+    students = [
+        CohortStudentRequest(
+            student_id=f"S{student_number:05d}",
+            course_codes=random_generator.choice(bundles),
+            preferences=random_generator.choice(preference_choices),
+        )
+        for student_number in range(student_count)
+    ]
+    return CohortAllocationRequest(term_id="BENCH", students=students)
+
+
+def run_benchmark(student_count: int, seed: int) -> None:
+    random_generator = random.Random(seed)
+    course_count = 40
+    sections_per_course = 6
+    courses_per_student = 5
+    request = generate_cohort_request(student_count, course_count, 60, courses_per_student, random_generator)
+    demand_by_course: dict[str, int] = {}
+    for student in request.students:
+        for course_code in student.course_codes:
+            demand_by_course[course_code] = demand_by_course.get(course_code, 0) + 1
+    sections = generate_term_sections(course_count, sections_per_course, demand_by_course, random_generator)
+    conflict_index = build_section_conflict_index("BENCH", (len(sections), 0), sections)
+
+    started_at = time.perf_counter()
+    response = allocate_cohort(request, sections, conflict_index)
+    elapsed_seconds = time.perf_counter() - started_at
+
+    print(
+        f"students={student_count} sections={len(sections)} groups={len(group_cohort_demand(request))} "
+        f"status={response.status} unassigned={response.unassigned_count} "
+        f"seconds={elapsed_seconds:.3f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark joint cohort section allocation.")
+    parser.add_argument("--students", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--seed", type=int, default=7)
+    arguments = parser.parse_args()
+    for student_count in arguments.students:
+        run_benchmark(student_count, arguments.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from app.benchmarks.synthetic_catalog import SyntheticCatalog, SyntheticCatalogShape, generate_synthetic_catalog
+from app.planner.degree_planner import compute_degree_plan
+from app.planner.timetable_planner import TimetableSectionInput, compute_timetable
+from app.planner.timing import PhaseTimings
+from app.schemas.planning import DegreePlanRequest, TimetablePreferences, TimetableRequest
+
+
+PHASES = ["build", "solve", "extract", "total"]
+
+
+@dataclass
+class PlannerBenchmarkCase:
+    name: str
+    shape: SyntheticCatalogShape
+    timetable_course_count: int
+
+
+@dataclass
+class PlannerBenchmarkInputs:
+    catalog: SyntheticCatalog
+    degree_plan_request: DegreePlanRequest
+    timetable_request: TimetableRequest
+    timetable_sections: list[TimetableSectionInput]
+
+
+@dataclass
+class PlannerBenchmarkResult:
+    case_name: str
+    planner: str
+    status: str
+    seconds_by_phase: dict[str, float]
+
+
+@dataclass
+class PlannerRegression:
+    case_name: str
+    planner: str
+    phase: str
+    baseline_seconds: float
+    measured_seconds: float
+
+
+BENCHMARK_CASES = [
+    PlannerBenchmarkCase(
+        name="small",
+        shape=SyntheticCatalogShape(
+            course_count=20,
+            prerequisite_depth=4,
+            prerequisite_fan_out=2,
+            term_count=8,
+            offering_density=0.5,
+            sections_per_course=4,
+            overlap_rate=0.2,
+        ),
+        timetable_course_count=4,
+    ),
+    PlannerBenchmarkCase(
+        name="medium",
+        shape=SyntheticCatalogShape(
+            course_count=60,
+            prerequisite_depth=6,
+            prerequisite_fan_out=2,
+            term_count=10,
+            offering_density=0.5,
+            sections_per_course=8,
+            overlap_rate=0.3,
+        ),
+        timetable_course_count=6,
+    ),
+    PlannerBenchmarkCase(
+        name="large",
+        shape=SyntheticCatalogShape(
+            course_count=150,
+            prerequisite_depth=8,
+            prerequisite_fan_out=3,
+            term_count=12,
+            offering_density=0.4,
+            sections_per_course=16,
+            overlap_rate=0.4,
+        ),
+        timetable_course_count=8,
+    ),
+    PlannerBenchmarkCase(
+        name="xlarge",
+        shape=SyntheticCatalogShape(
+            course_count=400,
+            prerequisite_depth=10,
+            prerequisite_fan_out=3,
+            term_count=12,
+            offering_density=0.4,
+            sections_per_course=24,
+            overlap_rate=0.4,
+        ),
+        timetable_course_count=10,
+    ),
+]
+
+
+def build_degree_plan_request(catalog: SyntheticCatalog) -> DegreePlanRequest:
+    credits_by_level: dict[int, float] = {}
+    for course in catalog.courses:
+        level = catalog.level_by_course[course.code]
+        credits_by_level[level] = credits_by_level.get(level, 0.0) + course.credits
+    max_credits_per_term = math.ceil(max(credits_by_level.values()) * 2) / 2
+    return DegreePlanRequest(
+        program_id="SYNTHETIC",
+        completed_courses=[],
+        allowed_terms=catalog.term_ids,
+        min_credits_per_term=0.0,
+        max_credits_per_term=max_credits_per_term,
+    )
+
+
+def build_timetable_request(catalog: SyntheticCatalog, course_count: int) -> TimetableRequest:
+    term_id = catalog.term_ids[0]
+    offered_codes = sorted({section.course_code for section in catalog.sections_by_term[term_id]})
+    random_generator = random.Random(catalog.shape.seed)
+    course_codes = sorted(random_generator.sample(offered_codes, min(course_count, len(offered_codes))))
+    return TimetableRequest(
+        term_id=term_id,
+        course_codes=course_codes,
+        preferences=TimetablePreferences(earliest_time_minutes=600, latest_time_minutes=1020, avoid_friday=True),
+    )
+
+
+def median_phase_seconds(samples: list[PhaseTimings], total_seconds: list[float]) -> dict[str, float]:
+    seconds_by_phase: dict[str, float] = {}
+    for phase in PHASES:
+        if phase == "total":
+            seconds_by_phase[phase] = statistics.median(total_seconds)
+        else:
+            seconds_by_phase[phase] = statistics.median(
+                sample.seconds_by_phase.get(phase, 0.0) for sample in samples
+            )
+    return seconds_by_phase
+
+
+def build_benchmark_inputs(case: PlannerBenchmarkCase, seed: int) -> PlannerBenchmarkInputs:
+    catalog = generate_synthetic_catalog(replace(case.shape, seed=seed))
+    timetable_request = build_timetable_request(catalog, case.timetable_course_count)
+    return PlannerBenchmarkInputs(
+        catalog=catalog,
+        degree_plan_request=build_degree_plan_request(catalog),
+        timetable_request=timetable_request,
+        timetable_sections=catalog.term_sections(timetable_request.term_id, timetable_request.course_codes),
+    )
+
+
+def run_benchmark_case(case: PlannerBenchmarkCase, repeat: int, seed: int) -> list[PlannerBenchmarkResult]:
+    inputs = build_benchmark_inputs(case, seed)
+    catalog = inputs.catalog
+    degree_plan_request = inputs.degree_plan_request
+    timetable_request = inputs.timetable_request
+    timetable_sections = inputs.timetable_sections
+
+    degree_plan_samples: list[PhaseTimings] = []
+    degree_plan_totals: list[float] = []
+    degree_plan_status = ""
+    timetable_samples: list[PhaseTimings] = []
+    timetable_totals: list[float] = []
+    timetable_status = ""
+    compute_degree_plan(degree_plan_request, catalog.catalog_snapshot())
+    compute_timetable(timetable_request, timetable_sections)
+    for _ in range(repeat):
+        timings = PhaseTimings()
+        started_at = time.perf_counter()
+        degree_plan_response = compute_degree_plan(degree_plan_request, catalog.catalog_snapshot(), timings)
+        degree_plan_totals.append(time.perf_counter() - started_at)
+        degree_plan_samples.append(timings)
+        degree_plan_status = degree_plan_response.objective.status
+
+        timings = PhaseTimings()
+        started_at = time.perf_counter()
+        timetable_response = compute_timetable(timetable_request, timetable_sections, None, timings)
+        timetable_totals.append(time.perf_counter() - started_at)
+        timetable_samples.append(timings)
+        timetable_status = f"{timetable_response.status} options={len(timetable_response.options)}"
+
+    return [
+        PlannerBenchmarkResult(
+            case_name=case.name,
+            planner="degree_plan",
+            status=degree_plan_status,
+            seconds_by_phase=median_phase_seconds(degree_plan_samples, degree_plan_totals),
+        ),
+        PlannerBenchmarkResult(
+            case_name=case.name,
+            planner="timetable",
+            status=timetable_status,
+            seconds_by_phase=median_phase_seconds(timetable_samples, timetable_totals),
+        ),
+    ]
+
+
+def results_to_baseline(results: list[PlannerBenchmarkResult]) -> dict[str, dict[str, dict[str, float]]]:
+    baseline: dict[str, dict[str, dict[str, float]]] = {}
+    for result in results:
+        if result.case_name not in baseline:
+            baseline[result.case_name] = {}
+        baseline[result.case_name][result.planner] = {
+            phase: round(seconds, 6) for phase, seconds in result.seconds_by_phase.items()
+        }
+    return baseline
+
+
+def find_regressions(
+    results: list[PlannerBenchmarkResult],
+    baseline: dict[str, dict[str, dict[str, float]]],
+    max_slowdown: float,
+    min_regression_seconds: float,
+) -> list[PlannerRegression]:
+    regressions: list[PlannerRegression] = []
+    for result in results:
+        baseline_phases = baseline.get(result.case_name, {}).get(result.planner)
+        if baseline_phases is None:
+            continue
+        for phase, measured_seconds in result.seconds_by_phase.items():
+            if phase not in baseline_phases:
+                continue
+            baseline_seconds = baseline_phases[phase]
+            if measured_seconds - baseline_seconds < min_regression_seconds:
+                continue
+            if measured_seconds > baseline_seconds * (1 + max_slowdown):
+                regressions.append(
+                    PlannerRegression(
+                        case_name=result.case_name,
+                        planner=result.planner,
+                        phase=phase,
+                        baseline_seconds=baseline_seconds,
+                        measured_seconds=measured_seconds,
+                    )
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the degree and timetable planners on synthetic catalogs.")
+    parser.add_argument("--cases", nargs="+", choices=[case.name for case in BENCHMARK_CASES])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, help="Fail when a phase is slower than this saved baseline.")
+    parser.add_argument("--save-baseline", type=Path, help="Write the measured medians as a new baseline.")
+    parser.add_argument("--max-slowdown", type=float, default=0.25, help="Allowed slowdown as a fraction.")
+    parser.add_argument(
+        "--min-regression-seconds",
+        type=float,
+        default=0.002,
+        help="Ignore slowdowns smaller than this many seconds.",
+    )
+    arguments = parser.parse_args()
+
+    results: list[PlannerBenchmarkResult] = []
+    for case in BENCHMARK_CASES:
+        if arguments.cases and case.name not in arguments.cases:
+            continue
+        for result in run_benchmark_case(case, max(arguments.repeat, 1), arguments.seed):
+            results.append(result)
+            phase_columns = " ".join(
+                f"{phase}={result.seconds_by_phase[phase] * 1000:.2f}ms" for phase in PHASES
+            )
+            print(f"{result.case_name:8} {result.planner:12} {phase_columns} status={result.status}")
+
+    if arguments.save_baseline is not None:
+        arguments.save_baseline.write_text(json.dumps(results_to_baseline(results), indent=2, sort_keys=True) + "\n")
+        print(f"Saved baseline to {arguments.save_baseline}")
+
+    if arguments.baseline is not None:
+        baseline = json.loads(arguments.baseline.read_text())
+        regressions = find_regressions(
+            results,
+            baseline,
+            arguments.max_slowdown,
+            arguments.min_regression_seconds,
+        )
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression.case_name} {regression.planner} {regression.phase}: "
+                f"{regression.baseline_seconds * 1000:.2f}ms -> {regression.measured_seconds * 1000:.2f}ms"
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
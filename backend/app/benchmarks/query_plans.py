@@ -0,0 +1,184 @@
+import argparse
+import sys
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, Select
+from sqlalchemy.dialects import postgresql
+
+from app.catalog_store import (
+    COURSES_STATEMENT,
+    OFFERINGS_STATEMENT,
+    PREREQUISITES_STATEMENT,
+    PROGRAMS_STATEMENT,
+    REQUIRED_COURSES_STATEMENT,
+    SECTIONS_STATEMENT,
+)
+from app.db import engine
+from app.migrations import Migration, discover_migrations
+
+
+PROGRAM_COUNT = 200
+COURSE_COUNT = 20000
+REQUIREMENTS_PER_PROGRAM = 40
+PREREQUISITES_PER_COURSE = 2
+TERM_COUNT = 6
+SECTIONS_PER_OFFERING = 4
+
+SEED_STATEMENTS = [
+    f"""
+    INSERT INTO programs (id, name)
+    SELECT 'QP-P' || n, 'Query Plan Program ' || n
+    FROM generate_series(1, {PROGRAM_COUNT}) AS n
+    """,
+    f"""
+    INSERT INTO courses (code, name, credits)
+    SELECT 'QP' || n, 'Query Plan Course ' || n, 0.5
+    FROM generate_series(1, {COURSE_COUNT}) AS n
+    """,
+    f"""
+    INSERT INTO program_requirements (program_id, course_code, requirement_type)
+    SELECT
+      'QP-P' || p,
+      'QP' || (1 + (p * {REQUIREMENTS_PER_PROGRAM} + r) % {COURSE_COUNT}),
+      CASE WHEN r % 4 = 0 THEN 'ELECTIVE' ELSE 'REQUIRED' END
+    FROM generate_series(1, {PROGRAM_COUNT}) AS p, generate_series(1, {REQUIREMENTS_PER_PROGRAM}) AS r
+    """,
+    f"""
+    INSERT INTO prerequisites (course_code, prereq_code)
+    SELECT 'QP' || c, 'QP' || (1 + (c + k * 7919) % {COURSE_COUNT})
+    FROM generate_series(1, {COURSE_COUNT}) AS c, generate_series(1, {PREREQUISITES_PER_COURSE}) AS k
+    """,
+    f"""
+    INSERT INTO course_offerings (course_code, term_id)
+    SELECT 'QP' || c, 'QP-T' || t
+    FROM generate_series(1, {COURSE_COUNT}) AS c, generate_series(1, {TERM_COUNT}) AS t
+    """,
+    f"""
+    INSERT INTO sections (
+      course_code, term_id, section_code, kind, day_of_week, start_time_minutes, end_time_minutes, capacity
+    )
+    SELECT
+      'QP' || c,
+      'QP-T' || t,
+      'QP' || c || '-' || s,
+      'LEC',
+      (ARRAY['MON', 'TUE', 'WED', 'THU', 'FRI'])[1 + (c + s) % 5],
+      510 + 90 * ((c + s) % 6),
+      590 + 90 * ((c + s) % 6),
+      100
+    FROM
+      generate_series(1, {COURSE_COUNT}) AS c,
+      generate_series(1, {TERM_COUNT}) AS t,
+      generate_series(1, {SECTIONS_PER_OFFERING}) AS s
+    """,
+    "ANALYZE programs, courses, program_requirements, prerequisites, course_offerings, sections",
+]
+
+
+@dataclass
+class CatalogQuery:
+    name: str
+    statement: Select
+
+
+@dataclass
+class QueryPlanResult:
+    name: str
+    node_types: list[str]
+    row_count: int
+    execution_seconds: float
+
+
+class DatabaseNotMigratedError(Exception):
+    pass
+
+
+CATALOG_QUERIES = [
+    CatalogQuery(name="programs", statement=PROGRAMS_STATEMENT),
+    CatalogQuery(name="courses", statement=COURSES_STATEMENT),
+    CatalogQuery(name="required courses", statement=REQUIRED_COURSES_STATEMENT),
+    CatalogQuery(name="prerequisites", statement=PREREQUISITES_STATEMENT),
+    CatalogQuery(name="offerings", statement=OFFERINGS_STATEMENT),
+    CatalogQuery(name="sections", statement=SECTIONS_STATEMENT),
+]
+
+
+def find_pending_migrations(connection: Connection) -> list[Migration]:
+    migrations = discover_migrations()
+    if connection.exec_driver_sql("SELECT to_regclass('schema_migrations')").scalar_one() is None:
+        return migrations
+    applied_versions = set(connection.exec_driver_sql("SELECT version FROM schema_migrations").scalars())
+    return [migration for migration in migrations if migration.version not in applied_versions]
+
+
+def collect_node_types(plan: dict) -> list[str]:
+    node_types = [plan["Node Type"]]
+    for child_plan in plan.get("Plans", []):
+        node_types.extend(collect_node_types(child_plan))
+    return node_types
+
+
+def explain_catalog_query(connection: Connection, query: CatalogQuery) -> QueryPlanResult:
+    compiled_statement = query.statement.compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"literal_binds": True},
+    )
+    explain_output = connection.exec_driver_sql(f"EXPLAIN (ANALYZE, FORMAT JSON) {compiled_statement}").scalar_one()
+    plan = explain_output[0]["Plan"]
+    return QueryPlanResult(
+        name=query.name,
+        node_types=collect_node_types(plan),
+        row_count=plan["Actual Rows"],
+        execution_seconds=explain_output[0]["Execution Time"] / 1000,
+    )
+
+
+def check_query_plans() -> list[QueryPlanResult]:
+    results: list[QueryPlanResult] = []
+    with engine.connect() as connection:
+        pending_migrations = find_pending_migrations(connection)
+        if pending_migrations:
+            raise DatabaseNotMigratedError(
+                ", ".join(f"{migration.version}_{migration.name}" for migration in pending_migrations)
+            )
+        transaction = connection.begin()
+        try:
+            for seed_statement in SEED_STATEMENTS:
+                connection.exec_driver_sql(seed_statement)
+            for query in CATALOG_QUERIES:
+                results.append(explain_catalog_query(connection, query))
+        finally:
+            transaction.rollback()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Explain the catalog snapshot load on a large synthetic catalog.")
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        help="Fail when the catalog queries together take longer than this.",
+    )
+    arguments = parser.parse_args()
+
+    try:
+        results = check_query_plans()
+    except DatabaseNotMigratedError as error:
+        print(f"Database has pending migrations: {error}. Run python -m app.migrations first.")
+        sys.exit(2)
+
+    total_seconds = 0.0
+    for result in results:
+        total_seconds += result.execution_seconds
+        print(
+            f"{result.name:18} {result.execution_seconds * 1000:9.2f}ms {result.row_count:8} rows "
+            f"via {' > '.join(result.node_types)}"
+        )
+    print(f"{'total':18} {total_seconds * 1000:9.2f}ms")
+    if arguments.max_seconds is not None and total_seconds > arguments.max_seconds:
+        print(f"Catalog snapshot load took longer than {arguments.max_seconds:.2f}s.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
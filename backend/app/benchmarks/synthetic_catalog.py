@@ -0,0 +1,123 @@
+import random
+from dataclasses import dataclass
+
+from app.planner.degree_planner import CatalogSnapshot, CoursePrerequisite, RequiredCourse
+from app.planner.timetable_planner import TimetableSectionInput
+
+
+DAYS_OF_WEEK = ["MON", "TUE", "WED", "THU", "FRI"]
+GRID_START_TIMES = [510 + 60 * hour for hour in range(11)]
+PEAK_SLOTS = [("TUE", 630), ("TUE", 690), ("THU", 630), ("THU", 690), ("WED", 750)]
+SECTION_LENGTH_MINUTES = 50
+COURSE_CREDIT_CHOICES = [0.25, 0.5, 0.5, 0.5, 1.0]
+
+
+@dataclass(frozen=True)
+class SyntheticCatalogShape:
+    course_count: int
+    prerequisite_depth: int
+    prerequisite_fan_out: int
+    term_count: int
+    offering_density: float
+    sections_per_course: int
+    overlap_rate: float
+    seed: int = 0
+
+
+@dataclass
+class SyntheticCatalog:
+    shape: SyntheticCatalogShape
+    courses: list[RequiredCourse]
+    level_by_course: dict[str, int]
+    prerequisites: list[CoursePrerequisite]
+    term_ids: list[str]
+    offered_term_indices_by_course: dict[str, set[int]]
+    sections_by_term: dict[str, list[TimetableSectionInput]]
+
+    def catalog_snapshot(self) -> CatalogSnapshot:
+        return CatalogSnapshot(
+            required_courses=list(self.courses),
+            prerequisites=list(self.prerequisites),
+            offered_term_indices_by_course=self.offered_term_indices_by_course,
+            completed_courses=set(),
+        )
+
+    def term_sections(self, term_id: str, course_codes: list[str]) -> list[TimetableSectionInput]:
+        requested_codes = set(course_codes)
+        return [section for section in self.sections_by_term[term_id] if section.course_code in requested_codes]
+
+
+def generate_synthetic_catalog(shape: SyntheticCatalogShape) -> SyntheticCatalog:
+    if shape.course_count < 1:
+        raise ValueError("course_count must be at least 1")
+    if shape.prerequisite_depth < 1:
+        raise ValueError("prerequisite_depth must be at least 1")
+    if shape.term_count < 1:
+        raise ValueError("term_count must be at least 1")
+
+    random_generator = random.Random(shape.seed)
+    depth = min(shape.prerequisite_depth, shape.course_count)
+
+    courses: list[RequiredCourse] = []
+    level_by_course: dict[str, int] = {}
+    codes_by_level: list[list[str]] = [[] for _ in range(depth)]
+    for course_number in range(shape.course_count):
+        course_code = f"SYN{course_number:05d}"
+        level = course_number * depth // shape.course_count
+        courses.append(RequiredCourse(code=course_code, credits=random_generator.choice(COURSE_CREDIT_CHOICES)))
+        level_by_course[course_code] = level
+        codes_by_level[level].append(course_code)
+
+    prerequisites: list[CoursePrerequisite] = []
+    for course in courses:
+        level = level_by_course[course.code]
+        if level == 0:
+            continue
+        candidate_codes = [code for lower_level in codes_by_level[:level] for code in lower_level]
+        prerequisite_codes = {random_generator.choice(codes_by_level[level - 1])}
+        fan_out = min(shape.prerequisite_fan_out, len(candidate_codes))
+        while len(prerequisite_codes) < fan_out:
+            prerequisite_codes.add(random_generator.choice(candidate_codes))
+        for prerequisite_code in sorted(prerequisite_codes):
+            prerequisites.append(CoursePrerequisite(course_code=course.code, prerequisite_code=prerequisite_code))
+
+    term_ids = [f"SYN-T{term_number:02d}" for term_number in range(shape.term_count)]
+    offered_term_indices_by_course: dict[str, set[int]] = {}
+    for course in courses:
+        anchor_term_index = min(level_by_course[course.code], shape.term_count - 1)
+        offered_term_indices = {anchor_term_index}
+        for term_index in range(shape.term_count):
+            if random_generator.random() < shape.offering_density:
+                offered_term_indices.add(term_index)
+        offered_term_indices_by_course[course.code] = offered_term_indices
+
+    sections_by_term: dict[str, list[TimetableSectionInput]] = {term_id: [] for term_id in term_ids}
+    for course in courses:
+        for term_index in sorted(offered_term_indices_by_course[course.code]):
+            term_id = term_ids[term_index]
+            for section_number in range(shape.sections_per_course):
+                if random_generator.random() < shape.overlap_rate:
+                    day_of_week, start_time_minutes = random_generator.choice(PEAK_SLOTS)
+                else:
+                    day_of_week = random_generator.choice(DAYS_OF_WEEK)
+                    start_time_minutes = random_generator.choice(GRID_START_TIMES)
+                sections_by_term[term_id].append(
+                    TimetableSectionInput(
+                        section_id=f"{course.code}-{term_id}-{section_number:03d}",
+                        course_code=course.code,
+                        kind="LEC",
+                        day_of_week=day_of_week,
+                        start_time_minutes=start_time_minutes,
+                        end_time_minutes=start_time_minutes + SECTION_LENGTH_MINUTES,
+                    )
+                )
+
+    return SyntheticCatalog(
+        shape=shape,
+        courses=courses,
+        level_by_course=level_by_course,
+        prerequisites=prerequisites,
+        term_ids=term_ids,
+        offered_term_indices_by_course=offered_term_indices_by_course,
+        sections_by_term=sections_by_term,
+    )
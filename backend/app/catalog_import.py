@@ -0,0 +1,350 @@
+import argparse
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from psycopg import Cursor
+from sqlalchemy import Engine
+
+from app.db import engine
+
+
+COPY_CHUNK_BYTES = 1 << 20
+
+
+@dataclass
+class CatalogImportTable:
+    name: str
+    columns: list[str]
+    required_columns: list[str]
+
+
+CATALOG_IMPORT_TABLES = [
+    CatalogImportTable(
+        name="programs",
+        columns=["id", "name", "description"],
+        required_columns=["id", "name"],
+    ),
+    CatalogImportTable(
+        name="courses",
+        columns=["code", "name", "credits", "description"],
+        required_columns=["code", "name", "credits"],
+    ),
+    CatalogImportTable(
+        name="course_offerings",
+        columns=["course_code", "term_id"],
+        required_columns=["course_code", "term_id"],
+    ),
+    CatalogImportTable(
+        name="prerequisites",
+        columns=["course_code", "prereq_code"],
+        required_columns=["course_code", "prereq_code"],
+    ),
+    CatalogImportTable(
+        name="program_requirements",
+        columns=["program_id", "course_code", "requirement_type"],
+        required_columns=["program_id", "course_code"],
+    ),
+    CatalogImportTable(
+        name="sections",
+        columns=[
+            "course_code",
+            "term_id",
+            "section_code",
+            "kind",
+            "day_of_week",
+            "start_time_minutes",
+            "end_time_minutes",
+            "location",
+            "capacity",
+        ],
+        required_columns=[
+            "course_code",
+            "term_id",
+            "section_code",
+            "kind",
+            "day_of_week",
+            "start_time_minutes",
+            "end_time_minutes",
+        ],
+    ),
+]
+
+CREATE_STAGING_TABLES = """
+CREATE TEMP TABLE import_programs (
+  id TEXT NOT NULL,
+  name TEXT NOT NULL,
+  description TEXT
+) ON COMMIT DROP;
+
+CREATE TEMP TABLE import_courses (
+  code TEXT NOT NULL,
+  name TEXT NOT NULL,
+  credits REAL NOT NULL,
+  description TEXT
+) ON COMMIT DROP;
+
+CREATE TEMP TABLE import_course_offerings (
+  course_code TEXT NOT NULL,
+  term_id TEXT NOT NULL
+) ON COMMIT DROP;
+
+CREATE TEMP TABLE import_prerequisites (
+  course_code TEXT NOT NULL,
+  prereq_code TEXT NOT NULL
+) ON COMMIT DROP;
+
+CREATE TEMP TABLE import_program_requirements (
+  program_id TEXT NOT NULL,
+  course_code TEXT NOT NULL,
+  requirement_type TEXT
+) ON COMMIT DROP;
+
+CREATE TEMP TABLE import_sections (
+  course_code TEXT NOT NULL,
+  term_id TEXT NOT NULL,
+  section_code TEXT NOT NULL,
+  kind TEXT NOT NULL,
+  day_of_week TEXT NOT NULL,
+  start_time_minutes INT NOT NULL,
+  end_time_minutes INT NOT NULL,
+  location TEXT,
+  capacity INT
+) ON COMMIT DROP;
+"""
+
+UPSERT_STATEMENTS = [
+    (
+        "programs",
+        """
+        INSERT INTO programs (id, name, description)
+        SELECT DISTINCT ON (id) id, name, description
+        FROM import_programs
+        ORDER BY id
+        ON CONFLICT (id) DO UPDATE
+        SET name = EXCLUDED.name, description = EXCLUDED.description
+        WHERE (programs.name, programs.description) IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.description)
+        """,
+    ),
+    (
+        "courses",
+        """
+        INSERT INTO courses (code, name, credits, description)
+        SELECT DISTINCT ON (code) code, name, credits, description
+        FROM import_courses
+        ORDER BY code
+        ON CONFLICT (code) DO UPDATE
+        SET name = EXCLUDED.name, credits = EXCLUDED.credits, description = EXCLUDED.description
+        WHERE (courses.name, courses.credits, courses.description)
+          IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.credits, EXCLUDED.description)
+        """,
+    ),
+    (
+        "course_offerings",
+        """
+        INSERT INTO course_offerings (course_code, term_id)
+        SELECT DISTINCT course_code, term_id
+        FROM import_course_offerings
+        ON CONFLICT (course_code, term_id) DO NOTHING
+        """,
+    ),
+    (
+        "prerequisites",
+        """
+        INSERT INTO prerequisites (course_code, prereq_code)
+        SELECT DISTINCT course_code, prereq_code
+        FROM import_prerequisites
+        ON CONFLICT (course_code, prereq_code) DO NOTHING
+        """,
+    ),
+    (
+        "program_requirements",
+        """
+        INSERT INTO program_requirements (program_id, requirement_type, course_code)
+        SELECT DISTINCT program_id, COALESCE(requirement_type, 'REQUIRED'), course_code
+        FROM import_program_requirements
+        ON CONFLICT (program_id, requirement_type, course_code) DO NOTHING
+        """,
+    ),
+    (
+        "sections",
+        """
+        INSERT INTO sections (
+          course_code, term_id, section_code, kind, day_of_week,
+          start_time_minutes, end_time_minutes, location, capacity
+        )
+        SELECT DISTINCT ON (term_id, course_code, section_code)
+          course_code, term_id, section_code, kind, day_of_week,
+          start_time_minutes, end_time_minutes, location, capacity
+        FROM import_sections
+        ORDER BY term_id, course_code, section_code
+        ON CONFLICT (term_id, course_code, section_code) DO UPDATE
+        SET kind = EXCLUDED.kind,
+            day_of_week = EXCLUDED.day_of_week,
+            start_time_minutes = EXCLUDED.start_time_minutes,
+            end_time_minutes = EXCLUDED.end_time_minutes,
+            location = EXCLUDED.location,
+            capacity = EXCLUDED.capacity
+        WHERE (
+          sections.kind, sections.day_of_week, sections.start_time_minutes,
+          sections.end_time_minutes, sections.location, sections.capacity
+        ) IS DISTINCT FROM (
+          EXCLUDED.kind, EXCLUDED.day_of_week, EXCLUDED.start_time_minutes,
+          EXCLUDED.end_time_minutes, EXCLUDED.location, EXCLUDED.capacity
+        )
+        """,
+    ),
+]
+
+PRUNE_STATEMENTS = [
+    (
+        "sections",
+        """
+        DELETE FROM sections
+        WHERE term_id IN (SELECT DISTINCT term_id FROM import_sections)
+          AND NOT EXISTS (
+            SELECT 1 FROM import_sections
+            WHERE import_sections.term_id = sections.term_id
+              AND import_sections.course_code = sections.course_code
+              AND import_sections.section_code = sections.section_code
+          )
+        """,
+    ),
+    (
+        "course_offerings",
+        """
+        DELETE FROM course_offerings
+        WHERE term_id IN (SELECT DISTINCT term_id FROM import_course_offerings)
+          AND NOT EXISTS (
+            SELECT 1 FROM import_course_offerings
+            WHERE import_course_offerings.term_id = course_offerings.term_id
+              AND import_course_offerings.course_code = course_offerings.course_code
+          )
+        """,
+    ),
+]
+
+
+@dataclass
+class CatalogImportSummary:
+    staged_rows: dict[str, int] = field(default_factory=dict)
+    written_rows: dict[str, int] = field(default_factory=dict)
+    pruned_rows: dict[str, int] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+
+def read_csv_columns(path: Path, table: CatalogImportTable) -> list[str]:
+    with path.open(newline="", encoding="utf-8") as file:
+        header = next(csv.reader(file), [])
+    columns = [column.strip() for column in header]
+    unknown_columns = sorted(set(columns) - set(table.columns))
+    if unknown_columns:
+        raise ValueError(f"{path.name} has unknown columns: {', '.join(unknown_columns)}")
+    missing_columns = sorted(set(table.required_columns) - set(columns))
+    if missing_columns:
+        raise ValueError(f"{path.name} is missing columns: {', '.join(missing_columns)}")
+    return columns
+
+
+def copy_csv_file(cursor: Cursor, path: Path, table: CatalogImportTable) -> None:
+    columns = read_csv_columns(path, table)
+    copy_statement = (
+        f"COPY import_{table.name} ({', '.join(columns)}) "
+        "FROM STDIN WITH (FORMAT csv, HEADER true, ENCODING 'UTF8')"
+    )
+    with path.open("rb") as file, cursor.copy(copy_statement) as copy:
+        while True:
+            chunk = file.read(COPY_CHUNK_BYTES)
+            if not chunk:
+                break
+            copy.write(chunk)
+
+
+def copy_json_rows(cursor: Cursor, rows: list[dict], table: CatalogImportTable) -> None:
+    copy_statement = f"COPY import_{table.name} ({', '.join(table.columns)}) FROM STDIN"
+    with cursor.copy(copy_statement) as copy:
+        for row in rows:
+            missing_columns = [column for column in table.required_columns if row.get(column) is None]
+            if missing_columns:
+                raise ValueError(f"{table.name} row is missing {', '.join(missing_columns)}: {row}")
+            copy.write_row([row.get(column) for column in table.columns])
+
+
+def stage_catalog_export(cursor: Cursor, source: Path) -> None:
+    if source.is_dir():
+        for table in CATALOG_IMPORT_TABLES:
+            path = source / f"{table.name}.csv"
+            if path.exists():
+                copy_csv_file(cursor, path, table)
+        return
+
+    with source.open(encoding="utf-8") as file:
+        catalog_export = json.load(file)
+    unknown_tables = sorted(set(catalog_export) - {table.name for table in CATALOG_IMPORT_TABLES})
+    if unknown_tables:
+        raise ValueError(f"{source.name} has unknown tables: {', '.join(unknown_tables)}")
+    for table in CATALOG_IMPORT_TABLES:
+        if table.name in catalog_export:
+            copy_json_rows(cursor, catalog_export[table.name], table)
+
+
+def import_catalog(
+    source: Path,
+    replace_terms: bool = False,
+    target_engine: Engine = engine,
+) -> CatalogImportSummary:
+    started_at = time.perf_counter()
+    summary = CatalogImportSummary()
+    connection = target_engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        try:
+            cursor.execute(CREATE_STAGING_TABLES)
+            stage_catalog_export(cursor, source)
+            for table in CATALOG_IMPORT_TABLES:
+                cursor.execute(f"ANALYZE import_{table.name}")
+                cursor.execute(f"SELECT count(*) FROM import_{table.name}")
+                summary.staged_rows[table.name] = cursor.fetchone()[0]
+            for table_name, upsert_statement in UPSERT_STATEMENTS:
+                cursor.execute(upsert_statement)
+                summary.written_rows[table_name] = cursor.rowcount
+            if replace_terms:
+                for table_name, prune_statement in PRUNE_STATEMENTS:
+                    cursor.execute(prune_statement)
+                    summary.pruned_rows[table_name] = cursor.rowcount
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+    finally:
+        connection.close()
+    summary.elapsed_seconds = time.perf_counter() - started_at
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk-load a catalog export into the database.")
+    parser.add_argument("source", type=Path, help="Directory of <table>.csv files or a JSON export file.")
+    parser.add_argument(
+        "--replace-terms",
+        action="store_true",
+        help="Delete sections and offerings in the imported terms that are missing from the export.",
+    )
+    arguments = parser.parse_args()
+
+    summary = import_catalog(arguments.source, replace_terms=arguments.replace_terms)
+    for table in CATALOG_IMPORT_TABLES:
+        line = (
+            f"{table.name}: staged {summary.staged_rows.get(table.name, 0)}, "
+            f"written {summary.written_rows.get(table.name, 0)}"
+        )
+        if table.name in summary.pruned_rows:
+            line += f", pruned {summary.pruned_rows[table.name]}"
+        print(line)
+    print(f"Imported catalog in {summary.elapsed_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
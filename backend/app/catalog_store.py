@@ -0,0 +1,165 @@
+import asyncio
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Course, CourseOffering, Prerequisite, Program, ProgramRequirement, Section
+from app.planner.timetable_planner import TimetableSectionInput
+
+
+@dataclass
+class ProgramRecord:
+    id: str
+    name: str
+    description: str | None
+
+
+@dataclass
+class CourseRecord:
+    code: str
+    name: str
+    credits: float
+    description: str | None
+
+
+@dataclass
+class CatalogData:
+    version: int
+    programs: dict[str, ProgramRecord]
+    courses: dict[str, CourseRecord]
+    required_course_codes_by_program: dict[str, list[str]]
+    prerequisite_codes_by_course: dict[str, list[str]]
+    offered_terms_by_course: dict[str, set[str]]
+    sections_by_term: dict[str, list[TimetableSectionInput]]
+    section_fingerprints_by_term: dict[str, tuple[int, int]]
+
+
+PROGRAMS_STATEMENT = select(Program.id, Program.name, Program.description).order_by(Program.id)
+COURSES_STATEMENT = select(Course.code, Course.name, Course.credits, Course.description).order_by(Course.code)
+REQUIRED_COURSES_STATEMENT = (
+    select(ProgramRequirement.program_id, ProgramRequirement.course_code)
+    .where(ProgramRequirement.requirement_type == "REQUIRED")
+    .order_by(ProgramRequirement.program_id, ProgramRequirement.course_code)
+)
+PREREQUISITES_STATEMENT = select(Prerequisite.course_code, Prerequisite.prereq_code).order_by(
+    Prerequisite.course_code, Prerequisite.prereq_code
+)
+OFFERINGS_STATEMENT = select(CourseOffering.course_code, CourseOffering.term_id)
+SECTIONS_STATEMENT = select(
+    Section.id,
+    Section.course_code,
+    Section.term_id,
+    Section.kind,
+    Section.day_of_week,
+    Section.start_time_minutes,
+    Section.end_time_minutes,
+    Section.capacity,
+).order_by(Section.term_id, Section.course_code, Section.kind, Section.start_time_minutes)
+
+
+async def load_catalog_data(db: AsyncSession, version: int) -> CatalogData:
+    programs: dict[str, ProgramRecord] = {}
+    for program_id, name, description in await db.execute(PROGRAMS_STATEMENT):
+        programs[program_id] = ProgramRecord(id=program_id, name=name, description=description)
+
+    courses: dict[str, CourseRecord] = {}
+    for code, name, credits, description in await db.execute(COURSES_STATEMENT):
+        courses[code] = CourseRecord(code=code, name=name, credits=credits, description=description)
+
+    required_course_codes_by_program: dict[str, list[str]] = {}
+    for program_id, course_code in await db.execute(REQUIRED_COURSES_STATEMENT):
+        if program_id not in required_course_codes_by_program:
+            required_course_codes_by_program[program_id] = []
+        course_codes = required_course_codes_by_program[program_id]
+        if not course_codes or course_codes[-1] != course_code:
+            course_codes.append(course_code)
+
+    prerequisite_codes_by_course: dict[str, list[str]] = {}
+    for course_code, prereq_code in await db.execute(PREREQUISITES_STATEMENT):
+        if course_code not in prerequisite_codes_by_course:
+            prerequisite_codes_by_course[course_code] = []
+        prerequisite_codes_by_course[course_code].append(prereq_code)
+
+    offered_terms_by_course: dict[str, set[str]] = {}
+    for course_code, term_id in await db.execute(OFFERINGS_STATEMENT):
+        if course_code not in offered_terms_by_course:
+            offered_terms_by_course[course_code] = set()
+        offered_terms_by_course[course_code].add(term_id)
+
+    sections_by_term: dict[str, list[TimetableSectionInput]] = {}
+    for (
+        section_id,
+        course_code,
+        term_id,
+        kind,
+        day_of_week,
+        start_time_minutes,
+        end_time_minutes,
+        capacity,
+    ) in await db.execute(SECTIONS_STATEMENT):
+        if term_id not in sections_by_term:
+            sections_by_term[term_id] = []
+        sections_by_term[term_id].append(
+            TimetableSectionInput(
+                section_id=str(section_id),
+                course_code=course_code,
+                kind=kind,
+                day_of_week=day_of_week,
+                start_time_minutes=start_time_minutes,
+                end_time_minutes=end_time_minutes,
+                capacity=capacity,
+            )
+        )
+
+    section_fingerprints_by_term: dict[str, tuple[int, int]] = {}
+    for term_id, term_sections in sections_by_term.items():
+        section_fingerprints_by_term[term_id] = (
+            len(term_sections),
+            hash(
+                tuple(
+                    (
+                        section.section_id,
+                        section.course_code,
+                        section.kind,
+                        section.day_of_week,
+                        section.start_time_minutes,
+                        section.end_time_minutes,
+                        section.capacity,
+                    )
+                    for section in term_sections
+                )
+            ),
+        )
+
+    return CatalogData(
+        version=version,
+        programs=programs,
+        courses=courses,
+        required_course_codes_by_program=required_course_codes_by_program,
+        prerequisite_codes_by_course=prerequisite_codes_by_course,
+        offered_terms_by_course=offered_terms_by_course,
+        sections_by_term=sections_by_term,
+        section_fingerprints_by_term=section_fingerprints_by_term,
+    )
+
+
+class CatalogStore:
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.catalog: CatalogData | None = None
+
+    async def get(self, db: AsyncSession, version: int) -> CatalogData:
+        catalog = self.catalog
+        if catalog is not None and catalog.version == version:
+            return catalog
+        async with self.lock:
+            if self.catalog is None or self.catalog.version != version:
+                self.catalog = await load_catalog_data(db, version)
+            return self.catalog
+
+    def clear(self) -> None:
+        self.catalog = None
+
+
+catalog_store = CatalogStore()
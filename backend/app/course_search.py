@@ -0,0 +1,206 @@
+import heapq
+import re
+import time
+from dataclasses import dataclass, field
+
+from app.catalog_store import CourseRecord
+from app.core.config import settings
+
+
+NGRAM_SIZE = 3
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+@dataclass
+class CodeTrieNode:
+    children: dict[str, "CodeTrieNode"] = field(default_factory=dict)
+    course_codes: set[str] = field(default_factory=set)
+
+
+@dataclass
+class CourseSearchDocument:
+    code: str
+    name: str
+    credits: float
+    description: str | None
+    name_grams: set[str]
+    description_grams: set[str]
+
+
+@dataclass
+class CourseSearchMatch:
+    code: str
+    name: str
+    credits: float
+    score: float
+
+
+def normalize_code(code: str) -> str:
+    return "".join(character for character in code.lower() if character.isalnum())
+
+
+def text_ngrams(text: str) -> set[str]:
+    grams: set[str] = set()
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        padded_token = " " + token
+        if len(padded_token) <= NGRAM_SIZE:
+            grams.add(padded_token)
+            continue
+        for start in range(len(padded_token) - NGRAM_SIZE + 1):
+            grams.add(padded_token[start : start + NGRAM_SIZE])
+    return grams
+
+
+def matching_codes(postings: dict[str, set[str]], grams: set[str]) -> set[str]:
+    posting_sets: list[set[str]] = []
+    for gram in grams:
+        if gram not in postings:
+            return set()
+        posting_sets.append(postings[gram])
+    posting_sets.sort(key=len)
+    return posting_sets[0].intersection(*posting_sets[1:])
+
+
+class CourseSearchIndex:
+    def __init__(self) -> None:
+        self.version: int | None = None
+        self.checked_at = 0.0
+        self.documents: dict[str, CourseSearchDocument] = {}
+        self.code_trie = CodeTrieNode()
+        self.name_postings: dict[str, set[str]] = {}
+        self.description_postings: dict[str, set[str]] = {}
+
+    def needs_refresh(self) -> bool:
+        if self.version is None:
+            return True
+        return time.monotonic() - self.checked_at >= settings.course_search_refresh_seconds
+
+    def sync(self, courses: dict[str, CourseRecord], version: int) -> None:
+        self.checked_at = time.monotonic()
+        if self.version == version:
+            return
+
+        for code in list(self.documents):
+            if code not in courses:
+                self.remove_course(code)
+        for code, course in courses.items():
+            document = self.documents.get(code)
+            if document is not None:
+                if (
+                    document.name == course.name
+                    and document.credits == course.credits
+                    and document.description == course.description
+                ):
+                    continue
+                self.remove_course(code)
+            self.add_course(course)
+        self.version = version
+
+    def add_course(self, course: CourseRecord) -> None:
+        document = CourseSearchDocument(
+            code=course.code,
+            name=course.name,
+            credits=course.credits,
+            description=course.description,
+            name_grams=text_ngrams(course.name),
+            description_grams=text_ngrams(course.description or ""),
+        )
+        self.documents[course.code] = document
+
+        node = self.code_trie
+        for character in normalize_code(course.code):
+            if character not in node.children:
+                node.children[character] = CodeTrieNode()
+            node = node.children[character]
+        node.course_codes.add(course.code)
+
+        for gram in document.name_grams:
+            if gram not in self.name_postings:
+                self.name_postings[gram] = set()
+            self.name_postings[gram].add(course.code)
+        for gram in document.description_grams:
+            if gram not in self.description_postings:
+                self.description_postings[gram] = set()
+            self.description_postings[gram].add(course.code)
+
+    def remove_course(self, code: str) -> None:
+        document = self.documents.pop(code)
+
+        path = [self.code_trie]
+        for character in normalize_code(code):
+            path.append(path[-1].children[character])
+        path[-1].course_codes.discard(code)
+        normalized_code = normalize_code(code)
+        for depth in range(len(normalized_code), 0, -1):
+            node = path[depth]
+            if node.children or node.course_codes:
+                break
+            del path[depth - 1].children[normalized_code[depth - 1]]
+
+        for gram in document.name_grams:
+            postings = self.name_postings[gram]
+            postings.discard(code)
+            if not postings:
+                del self.name_postings[gram]
+        for gram in document.description_grams:
+            postings = self.description_postings[gram]
+            postings.discard(code)
+            if not postings:
+                del self.description_postings[gram]
+
+    def codes_with_prefix(self, prefix: str, limit: int) -> list[str]:
+        node = self.code_trie
+        for character in prefix:
+            node = node.children.get(character)
+            if node is None:
+                return []
+
+        codes: list[str] = []
+        stack = [node]
+        while stack and len(codes) < limit:
+            node = stack.pop()
+            codes.extend(sorted(node.course_codes))
+            for character in sorted(node.children, reverse=True):
+                stack.append(node.children[character])
+        return codes[:limit]
+
+    def search(self, query: str, limit: int) -> list[CourseSearchMatch]:
+        scores: dict[str, float] = {}
+
+        normalized_query = normalize_code(query)
+        if normalized_query:
+            for rank, code in enumerate(self.codes_with_prefix(normalized_query, limit)):
+                if normalize_code(code) == normalized_query:
+                    scores[code] = 100.0
+                else:
+                    scores[code] = 50.0 - rank / limit
+
+        query_grams = text_ngrams(query)
+        if query_grams:
+            lowered_query = query.strip().lower()
+            for code in matching_codes(self.name_postings, query_grams):
+                score = 20.0
+                if self.documents[code].name.lower().startswith(lowered_query):
+                    score += 5.0
+                scores[code] = max(scores.get(code, 0.0), score)
+            if len(scores) < limit:
+                for code in matching_codes(self.description_postings, query_grams):
+                    if code not in scores:
+                        scores[code] = 5.0
+
+        ranked_codes = heapq.nsmallest(limit, scores, key=lambda code: (-scores[code], code))
+        matches: list[CourseSearchMatch] = []
+        for code in ranked_codes:
+            document = self.documents[code]
+            matches.append(
+                CourseSearchMatch(
+                    code=document.code,
+                    name=document.name,
+                    credits=document.credits,
+                    score=round(scores[code], 3),
+                )
+            )
+        return matches
+
+
+course_search_index = CourseSearchIndex()
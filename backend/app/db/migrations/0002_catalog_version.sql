@@ -0,0 +1,37 @@
+CREATE TABLE IF NOT EXISTS catalog_version (
+  id INT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+  version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO catalog_version (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_catalog_version() RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER programs_catalog_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON programs
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version();
+
+CREATE OR REPLACE TRIGGER courses_catalog_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON courses
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version();
+
+CREATE OR REPLACE TRIGGER course_offerings_catalog_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON course_offerings
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version();
+
+CREATE OR REPLACE TRIGGER prerequisites_catalog_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON prerequisites
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version();
+
+CREATE OR REPLACE TRIGGER program_requirements_catalog_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON program_requirements
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version();
+
+CREATE OR REPLACE TRIGGER sections_catalog_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON sections
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version();
@@ -0,0 +1 @@
+ALTER TABLE sections ADD COLUMN IF NOT EXISTS capacity INT CHECK (capacity IS NULL OR capacity >= 0);
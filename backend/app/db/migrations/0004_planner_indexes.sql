@@ -0,0 +1,8 @@
+CREATE INDEX IF NOT EXISTS sections_term_id_course_code_idx
+  ON sections (term_id, course_code);
+
+CREATE INDEX IF NOT EXISTS program_requirements_program_id_requirement_type_idx
+  ON program_requirements (program_id, requirement_type);
+
+CREATE INDEX IF NOT EXISTS prerequisites_course_code_idx
+  ON prerequisites (course_code);
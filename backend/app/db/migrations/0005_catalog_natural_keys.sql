@@ -0,0 +1,32 @@
+DELETE FROM prerequisites AS duplicate
+USING prerequisites AS kept
+WHERE duplicate.ctid > kept.ctid
+  AND duplicate.course_code = kept.course_code
+  AND duplicate.prereq_code = kept.prereq_code;
+
+DELETE FROM program_requirements AS duplicate
+USING program_requirements AS kept
+WHERE duplicate.ctid > kept.ctid
+  AND duplicate.program_id = kept.program_id
+  AND duplicate.requirement_type = kept.requirement_type
+  AND duplicate.course_code = kept.course_code;
+
+DELETE FROM sections AS duplicate
+USING sections AS kept
+WHERE duplicate.ctid > kept.ctid
+  AND duplicate.term_id = kept.term_id
+  AND duplicate.course_code = kept.course_code
+  AND duplicate.section_code = kept.section_code;
+
+CREATE UNIQUE INDEX IF NOT EXISTS prerequisites_natural_key
+  ON prerequisites (course_code, prereq_code);
+
+CREATE UNIQUE INDEX IF NOT EXISTS program_requirements_natural_key
+  ON program_requirements (program_id, requirement_type, course_code);
+
+CREATE UNIQUE INDEX IF NOT EXISTS sections_natural_key
+  ON sections (term_id, course_code, section_code);
+
+DROP INDEX IF EXISTS prerequisites_course_code_idx;
+DROP INDEX IF EXISTS program_requirements_program_id_requirement_type_idx;
+DROP INDEX IF EXISTS sections_term_id_course_code_idx;
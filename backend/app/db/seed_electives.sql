@@ -1,311 +0,0 @@
-DELETE FROM sections WHERE course_code LIKE 'CS4E%' OR course_code LIKE 'DATA4E%' OR course_code LIKE 'MATH3E%' OR course_code LIKE 'HUM1E%';
-DELETE FROM course_offerings WHERE course_code LIKE 'CS4E%' OR course_code LIKE 'DATA4E%' OR course_code LIKE 'MATH3E%' OR course_code LIKE 'HUM1E%';
-DELETE FROM program_requirements WHERE course_code LIKE 'CS4E%' OR course_code LIKE 'DATA4E%' OR course_code LIKE 'MATH3E%' OR course_code LIKE 'HUM1E%';
-DELETE FROM prerequisites WHERE course_code LIKE 'CS4E%' OR course_code LIKE 'DATA4E%' OR course_code LIKE 'MATH3E%' OR course_code LIKE 'HUM1E%';
-DELETE FROM courses WHERE code LIKE 'CS4E%' OR code LIKE 'DATA4E%' OR code LIKE 'MATH3E%' OR code LIKE 'HUM1E%';
-
-INSERT INTO courses (code, name, credits, description) VALUES
-('CS4E01','Game AI Foundations',0.5,'Elective'),
-('CS4E02','Applied Computer Vision',0.5,'Elective'),
-('CS4E03','Practical Machine Learning Systems',0.5,'Elective'),
-('CS4E04','Cloud Architecture Patterns',0.5,'Elective'),
-('CS4E05','Distributed Systems in Practice',0.5,'Elective'),
-('CS4E06','Database Internals',0.5,'Elective'),
-('CS4E07','Search Engines and Ranking',0.5,'Elective'),
-('CS4E08','Secure Software Engineering',0.5,'Elective'),
-('CS4E09','Network Security Lab',0.5,'Elective'),
-('CS4E10','Mobile App Engineering',0.5,'Elective'),
-('CS4E11','GPU Programming Basics',0.5,'Elective'),
-('CS4E12','High Performance Computing',0.5,'Elective'),
-('CS4E13','Programming Languages Studio',0.5,'Elective'),
-('CS4E14','Compilers: From Source to Machine',0.5,'Elective'),
-('CS4E15','Operating Systems Extensions',0.5,'Elective'),
-('CS4E16','Human-Computer Interaction Studio',0.5,'Elective'),
-('CS4E17','Product Engineering for Startups',0.5,'Elective'),
-('CS4E18','API Design and Reliability',0.5,'Elective'),
-('CS4E19','Streaming Systems with Kafka',0.5,'Elective'),
-('CS4E20','Algorithmic Problem Solving II',0.5,'Elective'),
-('DATA4E01','Data Visualization Storytelling',0.5,'Elective'),
-('DATA4E02','Time Series Analytics',0.5,'Elective'),
-('DATA4E03','Anomaly Detection Methods',0.5,'Elective'),
-('DATA4E04','Feature Engineering Workshop',0.5,'Elective'),
-('DATA4E05','Experimentation and A/B Testing',0.5,'Elective'),
-('DATA4E06','Recommender Systems',0.5,'Elective'),
-('DATA4E07','Natural Language Processing',0.5,'Elective'),
-('DATA4E08','Data Pipelines and ETL',0.5,'Elective'),
-('DATA4E09','Analytics Engineering with SQL',0.5,'Elective'),
-('DATA4E10','Model Monitoring and MLOps',0.5,'Elective'),
-('MATH3E01','Optimization for Engineers',0.5,'Elective'),
-('MATH3E02','Graph Theory Applications',0.5,'Elective'),
-('MATH3E03','Combinatorics in Computing',0.5,'Elective'),
-('MATH3E04','Probability for Data Science',0.5,'Elective'),
-('MATH3E05','Statistical Inference Studio',0.5,'Elective'),
-('MATH3E06','Numerical Methods',0.5,'Elective'),
-('MATH3E07','Linear Algebra for ML',0.5,'Elective'),
-('MATH3E08','Discrete Optimization Lab',0.5,'Elective'),
-('MATH3E09','Stochastic Processes',0.5,'Elective'),
-('MATH3E10','Convex Optimization',0.5,'Elective'),
-('HUM1E01','Technology and Society',0.5,'Elective'),
-('HUM1E02','Ethics of AI',0.5,'Elective'),
-('HUM1E03','Privacy, Policy, and Platforms',0.5,'Elective'),
-('HUM1E04','Writing for Technical Audiences',0.5,'Elective'),
-('HUM1E05','Economics for Product Builders',0.5,'Elective'),
-('HUM1E06','Design Thinking Studio',0.5,'Elective'),
-('HUM1E07','Leadership for Engineers',0.5,'Elective'),
-('HUM1E08','Innovation and Entrepreneurship',0.5,'Elective'),
-('HUM1E09','Communication in Teams',0.5,'Elective'),
-('HUM1E10','Critical Thinking in Computing',0.5,'Elective');
-
-INSERT INTO course_offerings (course_code, term_id) VALUES
-('CS4E01','2026-F'),('CS4E01','2027-W'),
-('CS4E02','2026-F'),('CS4E02','2027-W'),
-('CS4E03','2026-F'),('CS4E03','2027-W'),
-('CS4E04','2026-F'),('CS4E04','2027-W'),
-('CS4E05','2026-F'),('CS4E05','2027-W'),
-('CS4E06','2026-F'),('CS4E06','2027-W'),
-('CS4E07','2026-F'),('CS4E07','2027-W'),
-('CS4E08','2026-F'),('CS4E08','2027-W'),
-('CS4E09','2026-F'),('CS4E09','2027-W'),
-('CS4E10','2026-F'),('CS4E10','2027-W'),
-('CS4E11','2026-F'),('CS4E11','2027-W'),
-('CS4E12','2026-F'),('CS4E12','2027-W'),
-('CS4E13','2026-F'),('CS4E13','2027-W'),
-('CS4E14','2026-F'),('CS4E14','2027-W'),
-('CS4E15','2026-F'),('CS4E15','2027-W'),
-('CS4E16','2026-F'),('CS4E16','2027-W'),
-('CS4E17','2026-F'),('CS4E17','2027-W'),
-('CS4E18','2026-F'),('CS4E18','2027-W'),
-('CS4E19','2026-F'),('CS4E19','2027-W'),
-('CS4E20','2026-F'),('CS4E20','2027-W'),
-('DATA4E01','2026-F'),('DATA4E01','2027-W'),
-('DATA4E02','2026-F'),('DATA4E02','2027-W'),
-('DATA4E03','2026-F'),('DATA4E03','2027-W'),
-('DATA4E04','2026-F'),('DATA4E04','2027-W'),
-('DATA4E05','2026-F'),('DATA4E05','2027-W'),
-('DATA4E06','2026-F'),('DATA4E06','2027-W'),
-('DATA4E07','2026-F'),('DATA4E07','2027-W'),
-('DATA4E08','2026-F'),('DATA4E08','2027-W'),
-('DATA4E09','2026-F'),('DATA4E09','2027-W'),
-('DATA4E10','2026-F'),('DATA4E10','2027-W'),
-('MATH3E01','2026-F'),('MATH3E01','2027-W'),
-('MATH3E02','2026-F'),('MATH3E02','2027-W'),
-('MATH3E03','2026-F'),('MATH3E03','2027-W'),
-('MATH3E04','2026-F'),('MATH3E04','2027-W'),
-('MATH3E05','2026-F'),('MATH3E05','2027-W'),
-('MATH3E06','2026-F'),('MATH3E06','2027-W'),
-('MATH3E07','2026-F'),('MATH3E07','2027-W'),
-('MATH3E08','2026-F'),('MATH3E08','2027-W'),
-('MATH3E09','2026-F'),('MATH3E09','2027-W'),
-('MATH3E10','2026-F'),('MATH3E10','2027-W'),
-('HUM1E01','2026-F'),('HUM1E01','2027-W'),
-('HUM1E02','2026-F'),('HUM1E02','2027-W'),
-('HUM1E03','2026-F'),('HUM1E03','2027-W'),
-('HUM1E04','2026-F'),('HUM1E04','2027-W'),
-('HUM1E05','2026-F'),('HUM1E05','2027-W'),
-('HUM1E06','2026-F'),('HUM1E06','2027-W'),
-('HUM1E07','2026-F'),('HUM1E07','2027-W'),
-('HUM1E08','2026-F'),('HUM1E08','2027-W'),
-('HUM1E09','2026-F'),('HUM1E09','2027-W'),
-('HUM1E10','2026-F'),('HUM1E10','2027-W');
-
-INSERT INTO sections (course_code, term_id, section_code, kind, day_of_week, start_time_minutes, end_time_minutes, location) VALUES
-('CS4E01','2026-F','LEC 001','LEC','MON',570,650,'MC 101'),
-('CS4E01','2026-F','LEC 002','LEC','WED',900,980,'MC 101'),
-('CS4E01','2027-W','LEC 001','LEC','TUE',600,680,'MC 101'),
-('CS4E01','2027-W','LEC 002','LEC','THU',930,1010,'MC 101'),
-('CS4E02','2026-F','LEC 001','LEC','TUE',600,680,'MC 203'),
-('CS4E02','2026-F','LEC 002','LEC','THU',840,920,'MC 203'),
-('CS4E02','2027-W','LEC 001','LEC','MON',630,710,'MC 203'),
-('CS4E02','2027-W','LEC 002','LEC','WED',870,950,'MC 203'),
-('CS4E03','2026-F','LEC 001','LEC','WED',630,710,'DC 1350'),
-('CS4E03','2026-F','LEC 002','LEC','MON',840,920,'DC 1350'),
-('CS4E03','2027-W','LEC 001','LEC','THU',570,650,'DC 1350'),
-('CS4E03','2027-W','LEC 002','LEC','TUE',900,980,'DC 1350'),
-('CS4E04','2026-F','LEC 001','LEC','THU',570,650,'RCH 207'),
-('CS4E04','2026-F','LEC 002','LEC','TUE',930,1010,'RCH 207'),
-('CS4E04','2027-W','LEC 001','LEC','WED',600,680,'RCH 207'),
-('CS4E04','2027-W','LEC 002','LEC','MON',960,1040,'RCH 207'),
-('CS4E05','2026-F','LEC 001','LEC','FRI',600,680,'EIT 3142'),
-('CS4E05','2026-F','LEC 002','LEC','MON',780,860,'EIT 3142'),
-('CS4E05','2027-W','LEC 001','LEC','FRI',570,650,'EIT 3142'),
-('CS4E05','2027-W','LEC 002','LEC','TUE',810,890,'EIT 3142'),
-('CS4E06','2026-F','LEC 001','LEC','MON',660,740,'MC 4020'),
-('CS4E06','2026-F','LEC 002','LEC','WED',990,1070,'MC 4020'),
-('CS4E06','2027-W','LEC 001','LEC','TUE',690,770,'MC 4020'),
-('CS4E06','2027-W','LEC 002','LEC','THU',1020,1100,'MC 4020'),
-('CS4E07','2026-F','LEC 001','LEC','TUE',660,740,'MC 3002'),
-('CS4E07','2026-F','LEC 002','LEC','THU',900,980,'MC 3002'),
-('CS4E07','2027-W','LEC 001','LEC','MON',690,770,'MC 3002'),
-('CS4E07','2027-W','LEC 002','LEC','WED',930,1010,'MC 3002'),
-('CS4E08','2026-F','LEC 001','LEC','WED',690,770,'DC 2568'),
-('CS4E08','2026-F','LEC 002','LEC','MON',900,980,'DC 2568'),
-('CS4E08','2027-W','LEC 001','LEC','THU',660,740,'DC 2568'),
-('CS4E08','2027-W','LEC 002','LEC','TUE',990,1070,'DC 2568'),
-('CS4E09','2026-F','LEC 001','LEC','THU',660,740,'EIT 1013'),
-('CS4E09','2026-F','LEC 002','LEC','TUE',1020,1100,'EIT 1013'),
-('CS4E09','2027-W','LEC 001','LEC','WED',690,770,'EIT 1013'),
-('CS4E09','2027-W','LEC 002','LEC','MON',1050,1130,'EIT 1013'),
-('CS4E10','2026-F','LEC 001','LEC','MON',720,800,'MC 2066'),
-('CS4E10','2026-F','LEC 002','LEC','WED',930,1010,'MC 2066'),
-('CS4E10','2027-W','LEC 001','LEC','TUE',750,830,'MC 2066'),
-('CS4E10','2027-W','LEC 002','LEC','THU',960,1040,'MC 2066'),
-('CS4E11','2026-F','LEC 001','LEC','TUE',720,800,'DC 1302'),
-('CS4E11','2026-F','LEC 002','LEC','THU',960,1040,'DC 1302'),
-('CS4E11','2027-W','LEC 001','LEC','MON',750,830,'DC 1302'),
-('CS4E11','2027-W','LEC 002','LEC','WED',990,1070,'DC 1302'),
-('CS4E12','2026-F','LEC 001','LEC','WED',750,830,'MC 1085'),
-('CS4E12','2026-F','LEC 002','LEC','MON',990,1070,'MC 1085'),
-('CS4E12','2027-W','LEC 001','LEC','THU',720,800,'MC 1085'),
-('CS4E12','2027-W','LEC 002','LEC','TUE',1020,1100,'MC 1085'),
-('CS4E13','2026-F','LEC 001','LEC','THU',720,800,'RCH 101'),
-('CS4E13','2026-F','LEC 002','LEC','TUE',930,1010,'RCH 101'),
-('CS4E13','2027-W','LEC 001','LEC','WED',750,830,'RCH 101'),
-('CS4E13','2027-W','LEC 002','LEC','MON',960,1040,'RCH 101'),
-('CS4E14','2026-F','LEC 001','LEC','FRI',720,800,'EIT 4040'),
-('CS4E14','2026-F','LEC 002','LEC','MON',870,950,'EIT 4040'),
-('CS4E14','2027-W','LEC 001','LEC','FRI',690,770,'EIT 4040'),
-('CS4E14','2027-W','LEC 002','LEC','TUE',900,980,'EIT 4040'),
-('CS4E15','2026-F','LEC 001','LEC','MON',780,860,'MC 2018'),
-('CS4E15','2026-F','LEC 002','LEC','WED',1050,1130,'MC 2018'),
-('CS4E15','2027-W','LEC 001','LEC','TUE',810,890,'MC 2018'),
-('CS4E15','2027-W','LEC 002','LEC','THU',1080,1160,'MC 2018'),
-('CS4E16','2026-F','LEC 001','LEC','TUE',780,860,'MC 3003'),
-('CS4E16','2026-F','LEC 002','LEC','THU',1020,1100,'MC 3003'),
-('CS4E16','2027-W','LEC 001','LEC','MON',810,890,'MC 3003'),
-('CS4E16','2027-W','LEC 002','LEC','WED',1050,1130,'MC 3003'),
-('CS4E17','2026-F','LEC 001','LEC','WED',810,890,'DC 3317'),
-('CS4E17','2026-F','LEC 002','LEC','MON',960,1040,'DC 3317'),
-('CS4E17','2027-W','LEC 001','LEC','THU',780,860,'DC 3317'),
-('CS4E17','2027-W','LEC 002','LEC','TUE',990,1070,'DC 3317'),
-('CS4E18','2026-F','LEC 001','LEC','THU',780,860,'EIT 1001'),
-('CS4E18','2026-F','LEC 002','LEC','TUE',1080,1160,'EIT 1001'),
-('CS4E18','2027-W','LEC 001','LEC','WED',810,890,'EIT 1001'),
-('CS4E18','2027-W','LEC 002','LEC','MON',1110,1190,'EIT 1001'),
-('CS4E19','2026-F','LEC 001','LEC','MON',840,920,'MC 1056'),
-('CS4E19','2026-F','LEC 002','LEC','WED',1140,1220,'MC 1056'),
-('CS4E19','2027-W','LEC 001','LEC','TUE',870,950,'MC 1056'),
-('CS4E19','2027-W','LEC 002','LEC','THU',1170,1250,'MC 1056'),
-('CS4E20','2026-F','LEC 001','LEC','TUE',840,920,'MC 4061'),
-('CS4E20','2026-F','LEC 002','LEC','THU',990,1070,'MC 4061'),
-('CS4E20','2027-W','LEC 001','LEC','MON',870,950,'MC 4061'),
-('CS4E20','2027-W','LEC 002','LEC','WED',1020,1100,'MC 4061'),
-('DATA4E01','2026-F','LEC 001','LEC','WED',570,650,'DP 301'),
-('DATA4E01','2026-F','LEC 002','LEC','MON',930,1010,'DP 301'),
-('DATA4E01','2027-W','LEC 001','LEC','THU',600,680,'DP 301'),
-('DATA4E01','2027-W','LEC 002','LEC','TUE',960,1040,'DP 301'),
-('DATA4E02','2026-F','LEC 001','LEC','THU',600,680,'DP 201'),
-('DATA4E02','2026-F','LEC 002','LEC','TUE',870,950,'DP 201'),
-('DATA4E02','2027-W','LEC 001','LEC','WED',630,710,'DP 201'),
-('DATA4E02','2027-W','LEC 002','LEC','MON',900,980,'DP 201'),
-('DATA4E03','2026-F','LEC 001','LEC','FRI',630,710,'DP 101'),
-('DATA4E03','2026-F','LEC 002','LEC','MON',840,920,'DP 101'),
-('DATA4E03','2027-W','LEC 001','LEC','FRI',600,680,'DP 101'),
-('DATA4E03','2027-W','LEC 002','LEC','TUE',810,890,'DP 101'),
-('DATA4E04','2026-F','LEC 001','LEC','MON',600,680,'MC 3020'),
-('DATA4E04','2026-F','LEC 002','LEC','WED',840,920,'MC 3020'),
-('DATA4E04','2027-W','LEC 001','LEC','TUE',630,710,'MC 3020'),
-('DATA4E04','2027-W','LEC 002','LEC','THU',870,950,'MC 3020'),
-('DATA4E05','2026-F','LEC 001','LEC','TUE',600,680,'MC 4040'),
-('DATA4E05','2026-F','LEC 002','LEC','THU',930,1010,'MC 4040'),
-('DATA4E05','2027-W','LEC 001','LEC','MON',630,710,'MC 4040'),
-('DATA4E05','2027-W','LEC 002','LEC','WED',960,1040,'MC 4040'),
-('DATA4E06','2026-F','LEC 001','LEC','WED',600,680,'DC 2585'),
-('DATA4E06','2026-F','LEC 002','LEC','MON',900,980,'DC 2585'),
-('DATA4E06','2027-W','LEC 001','LEC','THU',630,710,'DC 2585'),
-('DATA4E06','2027-W','LEC 002','LEC','TUE',930,1010,'DC 2585'),
-('DATA4E07','2026-F','LEC 001','LEC','THU',630,710,'DC 1301'),
-('DATA4E07','2026-F','LEC 002','LEC','TUE',990,1070,'DC 1301'),
-('DATA4E07','2027-W','LEC 001','LEC','WED',660,740,'DC 1301'),
-('DATA4E07','2027-W','LEC 002','LEC','MON',1020,1100,'DC 1301'),
-('DATA4E08','2026-F','LEC 001','LEC','MON',660,740,'EIT 2020'),
-('DATA4E08','2026-F','LEC 002','LEC','WED',1020,1100,'EIT 2020'),
-('DATA4E08','2027-W','LEC 001','LEC','TUE',690,770,'EIT 2020'),
-('DATA4E08','2027-W','LEC 002','LEC','THU',1050,1130,'EIT 2020'),
-('DATA4E09','2026-F','LEC 001','LEC','TUE',660,740,'EIT 1015'),
-('DATA4E09','2026-F','LEC 002','LEC','THU',900,980,'EIT 1015'),
-('DATA4E09','2027-W','LEC 001','LEC','MON',690,770,'EIT 1015'),
-('DATA4E09','2027-W','LEC 002','LEC','WED',930,1010,'EIT 1015'),
-('DATA4E10','2026-F','LEC 001','LEC','WED',660,740,'MC 2038'),
-('DATA4E10','2026-F','LEC 002','LEC','MON',930,1010,'MC 2038'),
-('DATA4E10','2027-W','LEC 001','LEC','THU',690,770,'MC 2038'),
-('DATA4E10','2027-W','LEC 002','LEC','TUE',960,1040,'MC 2038'),
-('MATH3E01','2026-F','LEC 001','LEC','THU',570,650,'MC 2017'),
-('MATH3E01','2026-F','LEC 002','LEC','TUE',900,980,'MC 2017'),
-('MATH3E01','2027-W','LEC 001','LEC','WED',600,680,'MC 2017'),
-('MATH3E01','2027-W','LEC 002','LEC','MON',930,1010,'MC 2017'),
-('MATH3E02','2026-F','LEC 001','LEC','FRI',570,650,'MC 2018'),
-('MATH3E02','2026-F','LEC 002','LEC','MON',810,890,'MC 2018'),
-('MATH3E02','2027-W','LEC 001','LEC','FRI',600,680,'MC 2018'),
-('MATH3E02','2027-W','LEC 002','LEC','TUE',840,920,'MC 2018'),
-('MATH3E03','2026-F','LEC 001','LEC','MON',600,680,'MC 2065'),
-('MATH3E03','2026-F','LEC 002','LEC','WED',960,1040,'MC 2065'),
-('MATH3E03','2027-W','LEC 001','LEC','TUE',630,710,'MC 2065'),
-('MATH3E03','2027-W','LEC 002','LEC','THU',990,1070,'MC 2065'),
-('MATH3E04','2026-F','LEC 001','LEC','TUE',600,680,'MC 2066'),
-('MATH3E04','2026-F','LEC 002','LEC','THU',870,950,'MC 2066'),
-('MATH3E04','2027-W','LEC 001','LEC','MON',630,710,'MC 2066'),
-('MATH3E04','2027-W','LEC 002','LEC','WED',900,980,'MC 2066'),
-('MATH3E05','2026-F','LEC 001','LEC','WED',600,680,'MC 1085'),
-('MATH3E05','2026-F','LEC 002','LEC','MON',1020,1100,'MC 1085'),
-('MATH3E05','2027-W','LEC 001','LEC','THU',630,710,'MC 1085'),
-('MATH3E05','2027-W','LEC 002','LEC','TUE',1050,1130,'MC 1085'),
-('MATH3E06','2026-F','LEC 001','LEC','THU',630,710,'MC 3001'),
-('MATH3E06','2026-F','LEC 002','LEC','TUE',930,1010,'MC 3001'),
-('MATH3E06','2027-W','LEC 001','LEC','WED',660,740,'MC 3001'),
-('MATH3E06','2027-W','LEC 002','LEC','MON',960,1040,'MC 3001'),
-('MATH3E07','2026-F','LEC 001','LEC','MON',660,740,'MC 3002'),
-('MATH3E07','2026-F','LEC 002','LEC','WED',900,980,'MC 3002'),
-('MATH3E07','2027-W','LEC 001','LEC','TUE',690,770,'MC 3002'),
-('MATH3E07','2027-W','LEC 002','LEC','THU',930,1010,'MC 3002'),
-('MATH3E08','2026-F','LEC 001','LEC','TUE',660,740,'MC 3003'),
-('MATH3E08','2026-F','LEC 002','LEC','THU',990,1070,'MC 3003'),
-('MATH3E08','2027-W','LEC 001','LEC','MON',690,770,'MC 3003'),
-('MATH3E08','2027-W','LEC 002','LEC','WED',1020,1100,'MC 3003'),
-('MATH3E09','2026-F','LEC 001','LEC','WED',660,740,'MC 4060'),
-('MATH3E09','2026-F','LEC 002','LEC','MON',930,1010,'MC 4060'),
-('MATH3E09','2027-W','LEC 001','LEC','THU',690,770,'MC 4060'),
-('MATH3E09','2027-W','LEC 002','LEC','TUE',960,1040,'MC 4060'),
-('MATH3E10','2026-F','LEC 001','LEC','THU',660,740,'MC 4061'),
-('MATH3E10','2026-F','LEC 002','LEC','TUE',900,980,'MC 4061'),
-('MATH3E10','2027-W','LEC 001','LEC','WED',690,770,'MC 4061'),
-('MATH3E10','2027-W','LEC 002','LEC','MON',930,1010,'MC 4061'),
-('HUM1E01','2026-F','LEC 001','LEC','MON',570,650,'HH 1101'),
-('HUM1E01','2026-F','LEC 002','LEC','WED',840,920,'HH 1101'),
-('HUM1E01','2027-W','LEC 001','LEC','TUE',600,680,'HH 1101'),
-('HUM1E01','2027-W','LEC 002','LEC','THU',870,950,'HH 1101'),
-('HUM1E02','2026-F','LEC 001','LEC','TUE',570,650,'HH 1102'),
-('HUM1E02','2026-F','LEC 002','LEC','THU',930,1010,'HH 1102'),
-('HUM1E02','2027-W','LEC 001','LEC','MON',600,680,'HH 1102'),
-('HUM1E02','2027-W','LEC 002','LEC','WED',960,1040,'HH 1102'),
-('HUM1E03','2026-F','LEC 001','LEC','WED',570,650,'HH 1103'),
-('HUM1E03','2026-F','LEC 002','LEC','MON',900,980,'HH 1103'),
-('HUM1E03','2027-W','LEC 001','LEC','THU',600,680,'HH 1103'),
-('HUM1E03','2027-W','LEC 002','LEC','TUE',930,1010,'HH 1103'),
-('HUM1E04','2026-F','LEC 001','LEC','THU',570,650,'HH 1104'),
-('HUM1E04','2026-F','LEC 002','LEC','TUE',840,920,'HH 1104'),
-('HUM1E04','2027-W','LEC 001','LEC','WED',600,680,'HH 1104'),
-('HUM1E04','2027-W','LEC 002','LEC','MON',870,950,'HH 1104'),
-('HUM1E05','2026-F','LEC 001','LEC','FRI',570,650,'HH 1105'),
-('HUM1E05','2026-F','LEC 002','LEC','MON',780,860,'HH 1105'),
-('HUM1E05','2027-W','LEC 001','LEC','FRI',600,680,'HH 1105'),
-('HUM1E05','2027-W','LEC 002','LEC','TUE',810,890,'HH 1105'),
-('HUM1E06','2026-F','LEC 001','LEC','MON',600,680,'HH 1106'),
-('HUM1E06','2026-F','LEC 002','LEC','WED',930,1010,'HH 1106'),
-('HUM1E06','2027-W','LEC 001','LEC','TUE',630,710,'HH 1106'),
-('HUM1E06','2027-W','LEC 002','LEC','THU',960,1040,'HH 1106'),
-('HUM1E07','2026-F','LEC 001','LEC','TUE',600,680,'HH 1107'),
-('HUM1E07','2026-F','LEC 002','LEC','THU',840,920,'HH 1107'),
-('HUM1E07','2027-W','LEC 001','LEC','MON',630,710,'HH 1107'),
-('HUM1E07','2027-W','LEC 002','LEC','WED',870,950,'HH 1107'),
-('HUM1E08','2026-F','LEC 001','LEC','WED',600,680,'HH 1108'),
-('HUM1E08','2026-F','LEC 002','LEC','MON',990,1070,'HH 1108'),
-('HUM1E08','2027-W','LEC 001','LEC','THU',630,710,'HH 1108'),
-('HUM1E08','2027-W','LEC 002','LEC','TUE',1020,1100,'HH 1108'),
-('HUM1E09','2026-F','LEC 001','LEC','THU',600,680,'HH 1109'),
-('HUM1E09','2026-F','LEC 002','LEC','TUE',930,1010,'HH 1109'),
-('HUM1E09','2027-W','LEC 001','LEC','WED',630,710,'HH 1109'),
-('HUM1E09','2027-W','LEC 002','LEC','MON',960,1040,'HH 1109'),
-('HUM1E10','2026-F','LEC 001','LEC','MON',630,710,'HH 1110'),
-('HUM1E10','2026-F','LEC 002','LEC','WED',900,980,'HH 1110'),
-('HUM1E10','2027-W','LEC 001','LEC','TUE',660,740,'HH 1110'),
-('HUM1E10','2027-W','LEC 002','LEC','THU',930,1010,'HH 1110');
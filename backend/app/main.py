@@ -1,20 +1,49 @@
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.core.config import settings
 from app.api.routes.programs import router as programs_router
 from app.api.routes.courses import router as courses_router
+from app.api.routes.cohorts import router as cohorts_router
 from app.api.routes.degree_plans import router as degree_plans_router
 from app.api.routes.timetables import router as timetables_router
+from app.api.disconnect import ClientDisconnectedError, client_disconnected_handler
+from app.api.request_timing import RequestTimingMiddleware
+from app.planner.solver_pool import SolverPoolFullError, cheap_solver_pool, solver_pool
 import app.models  # noqa: F401
 
 
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    yield
+    cheap_solver_pool.shutdown()
+    solver_pool.shutdown()
+
+
+async def solver_pool_full_handler(request: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Planner is at capacity. Retry shortly."},
+        headers={"Retry-After": str(settings.solver_pool_retry_after_seconds)},
+    )
+
+
 def create_application() -> FastAPI:
     application = FastAPI(
         title=settings.app_name,
         version="0.1.0",
+        lifespan=lifespan,
     )
 
+    application.add_exception_handler(SolverPoolFullError, solver_pool_full_handler)
+    application.add_exception_handler(ClientDisconnectedError, client_disconnected_handler)
+
+    application.add_middleware(RequestTimingMiddleware)
     application.add_middleware(
         CORSMiddleware,
         allow_origins=[
@@ -24,17 +53,23 @@ def create_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", "Server-Timing", "X-Next-Cursor", "X-Solver-Queue-Seconds"],
     )
 
     application.include_router(programs_router)
     application.include_router(courses_router)
     application.include_router(degree_plans_router)
     application.include_router(timetables_router)
+    application.include_router(cohorts_router)
 
     @application.get("/health")
     async def health_check() -> dict:
         return {"status": "ok", "environment": settings.environment}
 
+    @application.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
     @application.get("/")
     async def root() -> dict:
         return {"message": "CourseCraft backend is running"}
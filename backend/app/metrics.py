@@ -0,0 +1,129 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.planner.admission import PlanningAdmission
+from app.planner.result_cache import PlanningResultCache, degree_plan_result_cache, timetable_result_cache
+from app.planner.single_flight import planning_single_flight
+from app.planner.solver_pool import SolverPool, cheap_solver_pool, solver_pool
+from app.planner.timing import PhaseTimings
+
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+COST_BUCKETS = (10.0, 50.0, 100.0, 500.0, 1000.0, 2000.0, 5000.0, 10000.0, 50000.0, 100000.0)
+
+request_seconds = Histogram(
+    "coursecraft_request_seconds",
+    "Time spent handling HTTP requests.",
+    ["route", "method", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+request_phase_seconds = Histogram(
+    "coursecraft_request_phase_seconds",
+    "Time spent in each phase of an HTTP request.",
+    ["route", "phase"],
+    buckets=LATENCY_BUCKETS,
+)
+
+solver_in_flight = Gauge(
+    "coursecraft_solver_in_flight",
+    "Solves running or queued in the solver pool.",
+    ["lane"],
+)
+solver_pool_workers = Gauge(
+    "coursecraft_solver_pool_workers",
+    "Worker processes in the solver pool.",
+    ["lane"],
+)
+solver_pool_capacity = Gauge(
+    "coursecraft_solver_pool_capacity",
+    "Solves the solver pool accepts before rejecting requests.",
+    ["lane"],
+)
+solver_pool_usage_ratio = Gauge(
+    "coursecraft_solver_pool_usage_ratio",
+    "Share of solver pool capacity in use.",
+    ["lane"],
+)
+
+
+def register_solver_pool_gauges(lane: str, pool: SolverPool) -> None:
+    solver_in_flight.labels(lane=lane).set_function(lambda: pool.in_flight)
+    solver_pool_workers.labels(lane=lane).set_function(lambda: pool.max_workers)
+    solver_pool_capacity.labels(lane=lane).set_function(lambda: pool.capacity)
+    solver_pool_usage_ratio.labels(lane=lane).set_function(lambda: pool.in_flight / pool.capacity)
+
+
+register_solver_pool_gauges("cheap", cheap_solver_pool)
+register_solver_pool_gauges("expensive", solver_pool)
+
+planning_admissions = Counter(
+    "coursecraft_planning_admissions_total",
+    "Planning requests admitted to a solver lane.",
+    ["planner", "lane", "busy"],
+)
+planning_cost = Histogram(
+    "coursecraft_planning_cost",
+    "Estimated cost of admitted planning requests.",
+    ["planner"],
+    buckets=COST_BUCKETS,
+)
+
+planning_cache_entries = Gauge(
+    "coursecraft_planning_cache_entries",
+    "Planning results held in the result cache.",
+    ["cache"],
+)
+planning_cache_hits = Gauge(
+    "coursecraft_planning_cache_hits",
+    "Planning result cache hits since startup.",
+    ["cache"],
+)
+planning_cache_misses = Gauge(
+    "coursecraft_planning_cache_misses",
+    "Planning result cache misses since startup.",
+    ["cache"],
+)
+planning_cache_evictions = Gauge(
+    "coursecraft_planning_cache_evictions",
+    "Planning results evicted or expired since startup.",
+    ["cache"],
+)
+
+
+def register_planning_cache_gauges(cache_name: str, cache: PlanningResultCache) -> None:
+    planning_cache_entries.labels(cache=cache_name).set_function(lambda: cache.stats()["entries"])
+    planning_cache_hits.labels(cache=cache_name).set_function(lambda: cache.stats()["hits"])
+    planning_cache_misses.labels(cache=cache_name).set_function(lambda: cache.stats()["misses"])
+    planning_cache_evictions.labels(cache=cache_name).set_function(lambda: cache.stats()["evictions"])
+
+
+register_planning_cache_gauges("timetable", timetable_result_cache)
+register_planning_cache_gauges("degree_plan", degree_plan_result_cache)
+
+single_flight_solves = Gauge(
+    "coursecraft_single_flight_solves",
+    "Shared planning solves currently in progress.",
+)
+single_flight_solves.set_function(lambda: len(planning_single_flight.calls))
+
+single_flight_waiters = Gauge(
+    "coursecraft_single_flight_waiters",
+    "Requests waiting on a shared planning solve.",
+)
+single_flight_waiters.set_function(lambda: planning_single_flight.waiters)
+
+single_flight_coalesced = Gauge(
+    "coursecraft_single_flight_coalesced",
+    "Requests that joined an identical in-progress solve since startup.",
+)
+single_flight_coalesced.set_function(lambda: planning_single_flight.coalesced)
+
+
+def observe_request(route: str, method: str, status_code: int, timings: PhaseTimings, total_seconds: float) -> None:
+    request_seconds.labels(route=route, method=method, status=str(status_code)).observe(total_seconds)
+    for phase, seconds in timings.seconds_by_phase.items():
+        request_phase_seconds.labels(route=route, phase=phase).observe(seconds)
+
+
+def observe_admission(planner: str, admission: PlanningAdmission) -> None:
+    planning_admissions.labels(planner=planner, lane=admission.lane, busy=str(admission.busy).lower()).inc()
+    planning_cost.labels(planner=planner).observe(admission.cost)
@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy import Engine
+
+from app.db import engine
+
+
+MIGRATIONS_DIRECTORY = Path(__file__).resolve().parent / "db" / "migrations"
+MIGRATION_LOCK_ID = 4_127_301
+
+
+@dataclass
+class Migration:
+    version: str
+    name: str
+    path: Path
+
+
+def discover_migrations(directory: Path = MIGRATIONS_DIRECTORY) -> list[Migration]:
+    migrations: list[Migration] = []
+    seen_versions: set[str] = set()
+    for path in sorted(directory.glob("*.sql")):
+        version, _, name = path.stem.partition("_")
+        if not version.isdigit() or not name:
+            raise ValueError(f"Migration file name must look like 0001_description.sql: {path.name}")
+        if version in seen_versions:
+            raise ValueError(f"Duplicate migration version {version}: {path.name}")
+        seen_versions.add(version)
+        migrations.append(Migration(version=version, name=name, path=path))
+    return migrations
+
+
+def apply_migrations(target_engine: Engine = engine) -> list[Migration]:
+    migrations = discover_migrations()
+    applied_migrations: list[Migration] = []
+    connection = target_engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version TEXT PRIMARY KEY, "
+            "name TEXT NOT NULL, "
+            "applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+        )
+        connection.commit()
+
+        cursor.execute("SELECT version FROM schema_migrations")
+        applied_versions = {row[0] for row in cursor.fetchall()}
+        connection.commit()
+
+        for migration in migrations:
+            if migration.version in applied_versions:
+                continue
+            try:
+                cursor.execute(migration.path.read_text())
+                cursor.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                    (migration.version, migration.name),
+                )
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            applied_migrations.append(migration)
+    finally:
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+            connection.commit()
+        finally:
+            connection.close()
+    return applied_migrations
+
+
+def main() -> None:
+    applied_migrations = apply_migrations()
+    if not applied_migrations:
+        print("Database schema is up to date.")
+    for migration in applied_migrations:
+        print(f"Applied migration {migration.version}_{migration.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,12 @@
-from app.models.catalog import Program, Course, CourseOffering, Prerequisite, ProgramRequirement, Section
+from app.models.catalog import (
+    Program,
+    Course,
+    CourseOffering,
+    Prerequisite,
+    ProgramRequirement,
+    Section,
+    CatalogVersion,
+)
 
 __all__ = [
     "Program",
@@ -7,4 +15,5 @@ __all__ = [
     "Prerequisite",
     "ProgramRequirement",
     "Section",
+    "CatalogVersion",
 ]
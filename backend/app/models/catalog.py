@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Float, ForeignKey, Integer, String, Text, text
+from sqlalchemy import BigInteger, Float, ForeignKey, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -106,3 +106,11 @@ class Section(Base):
     start_time_minutes: Mapped[int] = mapped_column(Integer, nullable=False)
     end_time_minutes: Mapped[int] = mapped_column(Integer, nullable=False)
     location: Mapped[str | None] = mapped_column(Text, nullable=True)
+    capacity: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+
+class CatalogVersion(Base):
+    __tablename__ = "catalog_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from typing import Literal
+
+from app.core.config import settings
+from app.planner.degree_planner import CatalogSnapshot
+from app.planner.solver_pool import SolverPool, cheap_solver_pool, solver_pool
+from app.planner.timetable_planner import SectionConflictIndex, TimetableSectionInput
+from app.schemas.planning import DegreePlanRequest, TimetableRequest
+
+
+PlanningLane = Literal["cheap", "expensive"]
+
+BUSY_TIMETABLE_WARNING = "The planner is busy, so fewer timetable options were searched for. Retry later for more."
+
+
+@dataclass
+class PlanningAdmission:
+    cost: float
+    lane: PlanningLane
+
+    @property
+    def pool(self) -> SolverPool:
+        if self.lane == "cheap":
+            return cheap_solver_pool
+        return solver_pool
+
+    @property
+    def busy(self) -> bool:
+        return self.lane == "expensive" and solver_pool.saturated
+
+
+def estimate_timetable_cost(
+    request: TimetableRequest,
+    sections: list[TimetableSectionInput],
+    conflict_index: SectionConflictIndex,
+) -> float:
+    conflict_count = sum(len(conflicting_ids) for conflicting_ids in conflict_index.conflicting_section_ids.values())
+    overlapping_pair_count = conflict_count // 2
+    max_solutions = request.max_solutions if request.max_solutions is not None else 25
+    max_solutions = min(max(max_solutions, 1), 100)
+    return float((len(sections) + overlapping_pair_count) * max_solutions)
+
+
+def estimate_degree_plan_cost(request: DegreePlanRequest, catalog_snapshot: CatalogSnapshot) -> float:
+    term_count = len(request.allowed_terms)
+    if request.max_terms is not None and request.max_terms < term_count:
+        term_count = request.max_terms
+    course_count = len(catalog_snapshot.required_courses)
+    prerequisite_count = len(catalog_snapshot.prerequisites)
+    return float(course_count * term_count + prerequisite_count * term_count)
+
+
+def admit(cost: float, expensive_cost: float) -> PlanningAdmission:
+    if cost < expensive_cost:
+        return PlanningAdmission(cost=cost, lane="cheap")
+    return PlanningAdmission(cost=cost, lane="expensive")
+
+
+def admit_timetable(
+    request: TimetableRequest,
+    sections: list[TimetableSectionInput],
+    conflict_index: SectionConflictIndex,
+) -> PlanningAdmission:
+    return admit(estimate_timetable_cost(request, sections, conflict_index), settings.timetable_expensive_cost)
+
+
+def admit_degree_plan(request: DegreePlanRequest, catalog_snapshot: CatalogSnapshot) -> PlanningAdmission:
+    return admit(estimate_degree_plan_cost(request, catalog_snapshot), settings.degree_plan_expensive_cost)
+
+
+def degrade_timetable_request(request: TimetableRequest) -> TimetableRequest:
+    max_solutions = request.max_solutions if request.max_solutions is not None else 25
+    time_budget_seconds = (
+        request.time_budget_seconds
+        if request.time_budget_seconds is not None
+        else settings.timetable_default_time_budget_seconds
+    )
+    if time_budget_seconds <= 0:
+        time_budget_seconds = settings.timetable_default_time_budget_seconds
+    return request.model_copy(
+        update={
+            "max_solutions": min(max_solutions, settings.busy_timetable_max_solutions),
+            "time_budget_seconds": min(time_budget_seconds, settings.busy_timetable_time_budget_seconds),
+        }
+    )
@@ -0,0 +1,47 @@
+import time
+from threading import Lock, Thread
+
+from ortools.sat.python import cp_model
+
+
+STOP_RETRY_SECONDS = 0.02
+
+
+class SolveCancellation:
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.cancelled = False
+        self.active_solvers: list[cp_model.CpSolver] = []
+
+    def cancel(self) -> None:
+        with self.lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+        Thread(target=self.stop_active_solvers, daemon=True).start()
+
+    def stop_active_solvers(self) -> None:
+        while True:
+            with self.lock:
+                solvers = list(self.active_solvers)
+            if not solvers:
+                return
+            for solver in solvers:
+                solver.StopSearch()
+            time.sleep(STOP_RETRY_SECONDS)
+
+    def solve(
+        self,
+        solver: cp_model.CpSolver,
+        model: cp_model.CpModel,
+        solution_callback: cp_model.CpSolverSolutionCallback | None = None,
+    ) -> int:
+        with self.lock:
+            if self.cancelled:
+                return cp_model.UNKNOWN
+            self.active_solvers.append(solver)
+        try:
+            return solver.Solve(model, solution_callback)
+        finally:
+            with self.lock:
+                self.active_solvers.remove(solver)
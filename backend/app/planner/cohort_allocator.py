@@ -0,0 +1,382 @@
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+from ortools.sat.python import cp_model
+
+from app.core.config import settings
+from app.planner.cancellation import SolveCancellation
+from app.planner.solver_stats import log_slow_solve
+from app.planner.timing import PhaseTimings
+from app.planner.timetable_planner import (
+    SectionConflictIndex,
+    TimetableSectionInput,
+    compute_timetable,
+)
+from app.schemas.planning import (
+    CohortAllocationRequest,
+    CohortAllocationResponse,
+    CohortStudentAllocation,
+    ScheduledSection,
+    TimetableOption,
+    TimetablePreferences,
+    TimetableRequest,
+)
+
+
+@dataclass
+class CohortDemandGroup:
+    course_codes: list[str]
+    preferences: TimetablePreferences
+    student_indices: list[int]
+    patterns: list[TimetableOption]
+    pattern_keys: set[tuple[str, ...]]
+    patterns_timed_out: bool = False
+
+
+@dataclass
+class CohortAllocationSolution:
+    status: int
+    pattern_counts: list[list[int]]
+    unassigned_counts: list[int]
+    class_loads: dict[str, int]
+
+
+def group_cohort_demand(request: CohortAllocationRequest) -> list[CohortDemandGroup]:
+    groups_by_key: dict[tuple, CohortDemandGroup] = {}
+    for student_index, student in enumerate(request.students):
+        course_codes = sorted(set(student.course_codes))
+        preferences = student.preferences
+        key = (
+            tuple(course_codes),
+            preferences.earliest_time_minutes,
+            preferences.latest_time_minutes,
+            preferences.avoid_friday,
+        )
+        if key not in groups_by_key:
+            groups_by_key[key] = CohortDemandGroup(
+                course_codes=course_codes,
+                preferences=preferences,
+                student_indices=[],
+                patterns=[],
+                pattern_keys=set(),
+            )
+        groups_by_key[key].student_indices.append(student_index)
+    return list(groups_by_key.values())
+
+
+def add_group_patterns(
+    term_id: str,
+    group: CohortDemandGroup,
+    sections_by_course: dict[str, list[TimetableSectionInput]],
+    conflict_index: SectionConflictIndex | None,
+    excluded_section_ids: set[str],
+    max_patterns: int,
+    time_budget_seconds: float,
+    timings: PhaseTimings,
+    cancellation: SolveCancellation,
+) -> int:
+    if time_budget_seconds <= 0:
+        group.patterns_timed_out = True
+        return 0
+
+    group_sections: list[TimetableSectionInput] = []
+    for course_code in group.course_codes:
+        for section in sections_by_course.get(course_code, []):
+            if section.section_id not in excluded_section_ids:
+                group_sections.append(section)
+    group_conflict_index = None
+    if conflict_index is not None:
+        group_conflict_index = conflict_index.restricted_to(group_sections)
+    pattern_response = compute_timetable(
+        TimetableRequest(
+            term_id=term_id,
+            course_codes=group.course_codes,
+            preferences=group.preferences,
+            max_solutions=max_patterns,
+            time_budget_seconds=time_budget_seconds,
+        ),
+        group_sections,
+        group_conflict_index,
+        timings,
+        cancellation,
+    )
+    group.patterns_timed_out = pattern_response.status == "PARTIAL"
+
+    added_count = 0
+    for option in pattern_response.options:
+        if not option.sections or option.objective.total_penalty is None:
+            continue
+        pattern_key = tuple(sorted(scheduled.section_id for scheduled in option.sections))
+        if pattern_key in group.pattern_keys:
+            continue
+        group.pattern_keys.add(pattern_key)
+        group.patterns.append(option)
+        added_count += 1
+    return added_count
+
+
+def solve_allocation_model(
+    request: CohortAllocationRequest,
+    groups: Sequence[CohortDemandGroup],
+    class_capacity: dict[str, int | None],
+    previous_solution: CohortAllocationSolution | None,
+    time_limit_seconds: float,
+    timings: PhaseTimings,
+    cancellation: SolveCancellation,
+) -> CohortAllocationSolution:
+    build_started_at = time.perf_counter()
+    max_pattern_penalty = 0
+    for group in groups:
+        for option in group.patterns:
+            max_pattern_penalty = max(max_pattern_penalty, int(option.objective.total_penalty))
+    unassigned_weight = max_pattern_penalty + 1
+
+    model = cp_model.CpModel()
+    pattern_count_vars: list[list[cp_model.IntVar]] = []
+    unassigned_vars: list[cp_model.IntVar] = []
+    load_by_class: dict[str, list[cp_model.IntVar]] = {}
+    objective_terms = []
+    for group_index, group in enumerate(groups):
+        student_count = len(group.student_indices)
+        counts = []
+        for pattern_index, option in enumerate(group.patterns):
+            count = model.NewIntVar(0, student_count, f"pattern_{group_index}_{pattern_index}")
+            counts.append(count)
+            objective_terms.append(int(option.objective.total_penalty) * count)
+            for scheduled in option.sections:
+                if scheduled.section_id not in load_by_class:
+                    load_by_class[scheduled.section_id] = []
+                load_by_class[scheduled.section_id].append(count)
+        unassigned = model.NewIntVar(0, student_count, f"unassigned_{group_index}")
+        model.Add(sum(counts) + unassigned == student_count)
+        pattern_count_vars.append(counts)
+        unassigned_vars.append(unassigned)
+
+        if previous_solution is not None:
+            previous_counts = previous_solution.pattern_counts[group_index]
+            for pattern_index, count in enumerate(counts):
+                if pattern_index < len(previous_counts):
+                    model.AddHint(count, previous_counts[pattern_index])
+                else:
+                    model.AddHint(count, 0)
+            model.AddHint(unassigned, previous_solution.unassigned_counts[group_index])
+
+    for class_id, loads in load_by_class.items():
+        capacity = class_capacity[class_id]
+        if capacity is not None:
+            model.Add(sum(loads) <= capacity)
+
+    model.Minimize(sum(objective_terms) + unassigned_weight * sum(unassigned_vars))
+    timings.add("build", time.perf_counter() - build_started_at)
+
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = max(time_limit_seconds, 0.1)
+    if previous_solution is not None:
+        solver.parameters.repair_hint = True
+    solve_started_at = time.perf_counter()
+    status = cancellation.solve(solver, model)
+    timings.add("solve", time.perf_counter() - solve_started_at)
+    log_slow_solve("cohort", model, solver, request)
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return CohortAllocationSolution(
+            status=status,
+            pattern_counts=[],
+            unassigned_counts=[],
+            class_loads={},
+        )
+
+    class_loads: dict[str, int] = {}
+    for class_id, loads in load_by_class.items():
+        class_loads[class_id] = sum(solver.Value(load) for load in loads)
+    return CohortAllocationSolution(
+        status=status,
+        pattern_counts=[[solver.Value(count) for count in counts] for counts in pattern_count_vars],
+        unassigned_counts=[solver.Value(unassigned) for unassigned in unassigned_vars],
+        class_loads=class_loads,
+    )
+
+
+def allocate_cohort(
+    request: CohortAllocationRequest,
+    sections: Sequence[TimetableSectionInput],
+    conflict_index: SectionConflictIndex | None = None,
+    timings: PhaseTimings | None = None,
+    cancellation: SolveCancellation | None = None,
+) -> CohortAllocationResponse:
+    deadline = time.monotonic() + settings.cohort_max_time_seconds
+    pattern_deadline = deadline - settings.cohort_max_time_seconds / (settings.cohort_pattern_rounds + 1)
+    if timings is None:
+        timings = PhaseTimings()
+    if cancellation is None:
+        cancellation = SolveCancellation()
+    max_patterns = request.max_patterns_per_group or 25
+    max_patterns = max(1, min(max_patterns, 100))
+    warnings: list[str] = []
+
+    sections_by_course: dict[str, list[TimetableSectionInput]] = {}
+    for section in sections:
+        if section.course_code not in sections_by_course:
+            sections_by_course[section.course_code] = []
+        sections_by_course[section.course_code].append(section)
+    section_by_id = {section.section_id: section for section in sections}
+
+    groups = group_cohort_demand(request)
+    for group in groups:
+        add_group_patterns(
+            request.term_id,
+            group,
+            sections_by_course,
+            conflict_index,
+            set(),
+            max_patterns,
+            pattern_deadline - time.monotonic(),
+            timings,
+            cancellation,
+        )
+        if not group.patterns and not group.patterns_timed_out:
+            warnings.append(
+                f"No conflict-free timetable exists for {len(group.student_indices)} student(s) "
+                f"taking {', '.join(group.course_codes)}."
+            )
+    timed_out_student_count = sum(
+        len(group.student_indices) for group in groups if not group.patterns and group.patterns_timed_out
+    )
+    if timed_out_student_count:
+        warnings.append(
+            f"Ran out of time generating timetables for {timed_out_student_count} student(s); "
+            "raise the cohort time limit to place them."
+        )
+
+    class_capacity: dict[str, int | None] = {}
+    class_members: dict[str, list[str]] = {}
+    solution = None
+    for round_index in range(settings.cohort_pattern_rounds):
+        for group in groups:
+            for option in group.patterns:
+                for scheduled in option.sections:
+                    if scheduled.section_id in class_members:
+                        continue
+                    member_ids = [scheduled.section_id] + scheduled.alternative_section_ids
+                    class_members[scheduled.section_id] = member_ids
+                    capacity = 0
+                    for member_id in member_ids:
+                        member_capacity = section_by_id[member_id].capacity
+                        if member_capacity is None:
+                            capacity = None
+                            break
+                        capacity += member_capacity
+                    class_capacity[scheduled.section_id] = capacity
+
+        rounds_remaining = settings.cohort_pattern_rounds - round_index
+        round_time_limit = (deadline - time.monotonic()) / rounds_remaining
+        round_solution = solve_allocation_model(
+            request,
+            groups,
+            class_capacity,
+            solution,
+            round_time_limit,
+            timings,
+            cancellation,
+        )
+        if round_solution.status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            break
+        if solution is not None and sum(round_solution.unassigned_counts) > sum(solution.unassigned_counts):
+            break
+        solution = round_solution
+        if sum(solution.unassigned_counts) == 0 or time.monotonic() >= deadline:
+            break
+
+        saturated_section_ids: set[str] = set()
+        for class_id, load in solution.class_loads.items():
+            capacity = class_capacity[class_id]
+            if capacity is not None and load >= capacity:
+                saturated_section_ids.update(class_members[class_id])
+
+        added_count = 0
+        for group_index, group in enumerate(groups):
+            if solution.unassigned_counts[group_index] == 0 or not group.patterns:
+                continue
+            added_count += add_group_patterns(
+                request.term_id,
+                group,
+                sections_by_course,
+                conflict_index,
+                saturated_section_ids,
+                max_patterns,
+                pattern_deadline - time.monotonic(),
+                timings,
+                cancellation,
+            )
+        if added_count == 0:
+            break
+
+    if solution is None:
+        return CohortAllocationResponse(
+            status="UNKNOWN",
+            allocations=[
+                CohortStudentAllocation(student_id=student.student_id, status="UNASSIGNED")
+                for student in request.students
+            ],
+            unassigned_count=len(request.students),
+            warnings=warnings + ["The cohort allocation model could not be solved in the time budget."],
+        )
+
+    if solution.status == cp_model.FEASIBLE:
+        warnings.append("Allocation stopped at the time budget; it is feasible but may not be optimal.")
+
+    extract_started_at = time.perf_counter()
+    remaining_capacity = {section.section_id: section.capacity for section in sections}
+    allocations: list[CohortStudentAllocation | None] = [None] * len(request.students)
+    unassigned_count = 0
+    for group_index, group in enumerate(groups):
+        next_student = 0
+        for option, assigned in zip(group.patterns, solution.pattern_counts[group_index]):
+            for student_index in group.student_indices[next_student : next_student + assigned]:
+                allocated_sections = []
+                for scheduled in option.sections:
+                    section_id = scheduled.section_id
+                    for member_id in class_members[scheduled.section_id]:
+                        member_capacity = remaining_capacity[member_id]
+                        if member_capacity is None:
+                            section_id = member_id
+                            break
+                        if member_capacity > 0:
+                            remaining_capacity[member_id] = member_capacity - 1
+                            section_id = member_id
+                            break
+                    section = section_by_id[section_id]
+                    allocated_sections.append(
+                        ScheduledSection(
+                            section_id=section.section_id,
+                            course_code=section.course_code,
+                            kind=section.kind,
+                            day_of_week=section.day_of_week,
+                            start_time_minutes=section.start_time_minutes,
+                            end_time_minutes=section.end_time_minutes,
+                        )
+                    )
+                allocations[student_index] = CohortStudentAllocation(
+                    student_id=request.students[student_index].student_id,
+                    status="ASSIGNED",
+                    sections=allocated_sections,
+                    total_penalty=option.objective.total_penalty,
+                )
+            next_student += assigned
+        for student_index in group.student_indices[next_student:]:
+            unassigned_count += 1
+            allocations[student_index] = CohortStudentAllocation(
+                student_id=request.students[student_index].student_id,
+                status="UNASSIGNED",
+            )
+
+    if unassigned_count:
+        warnings.append(f"{unassigned_count} student(s) could not be placed within section capacities.")
+
+    timings.add("extract", time.perf_counter() - extract_started_at)
+    return CohortAllocationResponse(
+        status="OPTIMAL" if solution.status == cp_model.OPTIMAL else "FEASIBLE",
+        allocations=allocations,
+        unassigned_count=unassigned_count,
+        warnings=warnings,
+    )
@@ -1,9 +1,19 @@
+import time
 from dataclasses import dataclass
-from typing import Mapping
+from typing import Iterator, Mapping
 
 from ortools.sat.python import cp_model
 
-from app.schemas.planning import DegreePlanRequest, DegreePlanResponse, DegreePlanTerm, DegreePlanObjective
+from app.planner.cancellation import SolveCancellation
+from app.planner.solver_stats import collect_solver_stats, log_slow_solve
+from app.planner.timing import PhaseTimings
+from app.schemas.planning import (
+    DegreePlanRequest,
+    DegreePlanResponse,
+    DegreePlanTerm,
+    DegreePlanObjective,
+    DegreePlanChanges,
+)
 
 
 @dataclass
@@ -26,7 +36,147 @@ class CatalogSnapshot:
     completed_courses: set[str]
 
 
-def compute_degree_plan(request: DegreePlanRequest, catalog: CatalogSnapshot) -> DegreePlanResponse:
+@dataclass
+class CourseTermDomains:
+    feasible_term_indices_by_course: dict[int, list[int]]
+    cycle_course_codes: list[str]
+
+
+def find_prerequisite_cycles(
+    course_indices: list[int],
+    prerequisite_indices: Mapping[int, set[int]],
+) -> list[list[int]]:
+    candidates = set(course_indices)
+    discovery_index: dict[int, int] = {}
+    low_link: dict[int, int] = {}
+    stack: list[int] = []
+    on_stack: set[int] = set()
+    cycles: list[list[int]] = []
+
+    for root_index in course_indices:
+        if root_index in discovery_index:
+            continue
+        discovery_index[root_index] = low_link[root_index] = len(discovery_index)
+        stack.append(root_index)
+        on_stack.add(root_index)
+        work: list[tuple[int, Iterator[int]]] = [(root_index, iter(prerequisite_indices[root_index]))]
+        while work:
+            course_index, neighbours = work[-1]
+            advanced = False
+            for neighbour_index in neighbours:
+                if neighbour_index not in candidates:
+                    continue
+                if neighbour_index not in discovery_index:
+                    discovery_index[neighbour_index] = low_link[neighbour_index] = len(discovery_index)
+                    stack.append(neighbour_index)
+                    on_stack.add(neighbour_index)
+                    work.append((neighbour_index, iter(prerequisite_indices[neighbour_index])))
+                    advanced = True
+                    break
+                if neighbour_index in on_stack:
+                    low_link[course_index] = min(low_link[course_index], discovery_index[neighbour_index])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent_index = work[-1][0]
+                low_link[parent_index] = min(low_link[parent_index], low_link[course_index])
+            if low_link[course_index] != discovery_index[course_index]:
+                continue
+
+            component: list[int] = []
+            while True:
+                member_index = stack.pop()
+                on_stack.remove(member_index)
+                component.append(member_index)
+                if member_index == course_index:
+                    break
+            if len(component) > 1 or course_index in prerequisite_indices[course_index]:
+                cycles.append(component)
+    return cycles
+
+
+def tighten_course_term_domains(catalog: CatalogSnapshot, term_count: int) -> CourseTermDomains:
+    course_indices = list(range(len(catalog.required_courses)))
+    code_to_index = {course.code: course_index for course_index, course in enumerate(catalog.required_courses)}
+
+    prerequisite_indices: dict[int, set[int]] = {course_index: set() for course_index in course_indices}
+    dependent_indices: dict[int, set[int]] = {course_index: set() for course_index in course_indices}
+    for relation in catalog.prerequisites:
+        if relation.course_code not in code_to_index:
+            continue
+        if relation.prerequisite_code in catalog.completed_courses:
+            continue
+        if relation.prerequisite_code not in code_to_index:
+            continue
+        course_index = code_to_index[relation.course_code]
+        prerequisite_index = code_to_index[relation.prerequisite_code]
+        prerequisite_indices[course_index].add(prerequisite_index)
+        dependent_indices[prerequisite_index].add(course_index)
+
+    remaining_prerequisites = {course_index: len(prerequisite_indices[course_index]) for course_index in course_indices}
+    ready = [course_index for course_index in course_indices if remaining_prerequisites[course_index] == 0]
+    topological_order: list[int] = []
+    while ready:
+        course_index = ready.pop()
+        topological_order.append(course_index)
+        for dependent_index in dependent_indices[course_index]:
+            remaining_prerequisites[dependent_index] -= 1
+            if remaining_prerequisites[dependent_index] == 0:
+                ready.append(dependent_index)
+
+    if len(topological_order) < len(course_indices):
+        ordered = set(topological_order)
+        unordered_indices = [course_index for course_index in course_indices if course_index not in ordered]
+        cycle_course_codes = sorted(
+            catalog.required_courses[course_index].code
+            for cycle in find_prerequisite_cycles(unordered_indices, prerequisite_indices)
+            for course_index in cycle
+        )
+        return CourseTermDomains(feasible_term_indices_by_course={}, cycle_course_codes=cycle_course_codes)
+
+    all_term_indices = set(range(term_count))
+    offered_term_indices: dict[int, list[int]] = {}
+    for course_index in course_indices:
+        course = catalog.required_courses[course_index]
+        offered = catalog.offered_term_indices_by_course.get(course.code, all_term_indices)
+        offered_term_indices[course_index] = sorted(offered & all_term_indices)
+
+    earliest_term_index: dict[int, int] = {}
+    for course_index in topological_order:
+        lower_bound = max((earliest_term_index[index] + 1 for index in prerequisite_indices[course_index]), default=0)
+        candidates = [term_index for term_index in offered_term_indices[course_index] if term_index >= lower_bound]
+        earliest_term_index[course_index] = candidates[0] if candidates else term_count
+
+    latest_term_index: dict[int, int] = {}
+    for course_index in reversed(topological_order):
+        upper_bound = min((latest_term_index[index] - 1 for index in dependent_indices[course_index]), default=term_count - 1)
+        candidates = [term_index for term_index in offered_term_indices[course_index] if term_index <= upper_bound]
+        latest_term_index[course_index] = candidates[-1] if candidates else -1
+
+    feasible_term_indices_by_course: dict[int, list[int]] = {}
+    for course_index in course_indices:
+        feasible_term_indices_by_course[course_index] = [
+            term_index
+            for term_index in offered_term_indices[course_index]
+            if earliest_term_index[course_index] <= term_index <= latest_term_index[course_index]
+        ]
+
+    return CourseTermDomains(feasible_term_indices_by_course=feasible_term_indices_by_course, cycle_course_codes=[])
+
+
+def compute_degree_plan(
+    request: DegreePlanRequest,
+    catalog: CatalogSnapshot,
+    timings: PhaseTimings | None = None,
+    cancellation: SolveCancellation | None = None,
+) -> DegreePlanResponse:
+    build_started_at = time.perf_counter()
+    if timings is None:
+        timings = PhaseTimings()
+    if cancellation is None:
+        cancellation = SolveCancellation()
     allowed_terms = list(request.allowed_terms)
     if request.max_terms is not None and request.max_terms < len(allowed_terms):
         allowed_terms = allowed_terms[: request.max_terms]
@@ -37,27 +187,42 @@ def compute_degree_plan(request: DegreePlanRequest, catalog: CatalogSnapshot) ->
         warnings: list[str] = []
         return DegreePlanResponse(terms=terms, objective=objective, warnings=warnings)
 
-    model = cp_model.CpModel()
-
     term_indices = list(range(len(allowed_terms)))
     course_indices = list(range(len(catalog.required_courses)))
 
+    domains = tighten_course_term_domains(catalog, len(term_indices))
+    if domains.cycle_course_codes:
+        terms = []
+        objective = DegreePlanObjective(status="PREREQUISITE_CYCLE", max_term_used_index=None)
+        warnings = ["Prerequisite cycle detected between courses: " + ", ".join(domains.cycle_course_codes)]
+        return DegreePlanResponse(terms=terms, objective=objective, warnings=warnings)
+
+    feasible_term_indices_by_course = domains.feasible_term_indices_by_course
+    unschedulable_course_codes = [
+        catalog.required_courses[course_index].code
+        for course_index in course_indices
+        if not feasible_term_indices_by_course[course_index]
+    ]
+    if unschedulable_course_codes:
+        terms = []
+        objective = DegreePlanObjective(status="INFEASIBLE", max_term_used_index=None)
+        warnings = [
+            "No feasible plan found with current constraints.",
+            "No allowed term fits the prerequisite chain and offerings for: " + ", ".join(unschedulable_course_codes),
+        ]
+        return DegreePlanResponse(terms=terms, objective=objective, warnings=warnings)
+
+    model = cp_model.CpModel()
+
     x: dict[tuple[int, int], cp_model.IntVar] = {}
     for course_index in course_indices:
-        for term_index in term_indices:
+        for term_index in feasible_term_indices_by_course[course_index]:
             x[(course_index, term_index)] = model.NewBoolVar(f"x_{course_index}_{term_index}")
 
     for course_index in course_indices:
-        model.Add(sum(x[(course_index, term_index)] for term_index in term_indices) == 1)
-
-    for course_index in course_indices:
-        course = catalog.required_courses[course_index]
-        allowed_term_indices_for_course = catalog.offered_term_indices_by_course.get(
-            course.code, set(term_indices)
+        model.Add(
+            sum(x[(course_index, term_index)] for term_index in feasible_term_indices_by_course[course_index]) == 1
         )
-        for term_index in term_indices:
-            if term_index not in allowed_term_indices_for_course:
-                model.Add(x[(course_index, term_index)] == 0)
 
     total_credits = sum(course.credits for course in catalog.required_courses)
     scaled_total_credits = int(total_credits * 10)
@@ -73,6 +238,8 @@ def compute_degree_plan(request: DegreePlanRequest, catalog: CatalogSnapshot) ->
         term_used[term_index] = model.NewBoolVar(f"term_used_{term_index}")
         load_expression_terms: list[cp_model.LinearExpr] = []
         for course_index in course_indices:
+            if (course_index, term_index) not in x:
+                continue
             course = catalog.required_courses[course_index]
             load_expression_terms.append(int(course.credits * 10) * x[(course_index, term_index)])
             model.Add(x[(course_index, term_index)] <= term_used[term_index])
@@ -90,10 +257,13 @@ def compute_degree_plan(request: DegreePlanRequest, catalog: CatalogSnapshot) ->
 
     course_term_indices: dict[int, cp_model.IntVar] = {}
     for course_index in course_indices:
-        course_term_indices[course_index] = model.NewIntVar(0, len(term_indices) - 1, f"term_for_course_{course_index}")
+        feasible_term_indices = feasible_term_indices_by_course[course_index]
+        course_term_indices[course_index] = model.NewIntVar(
+            feasible_term_indices[0], feasible_term_indices[-1], f"term_for_course_{course_index}"
+        )
         model.Add(
             course_term_indices[course_index]
-            == sum(term_index * x[(course_index, term_index)] for term_index in term_indices)
+            == sum(term_index * x[(course_index, term_index)] for term_index in feasible_term_indices)
         )
 
     code_to_index: dict[str, int] = {}
@@ -124,16 +294,54 @@ def compute_degree_plan(request: DegreePlanRequest, catalog: CatalogSnapshot) ->
         model.Add(lateness >= max_term_used - target_term_index)
         model.Add(lateness >= 0)
         large_weight = len(term_indices) + 1
-        model.Minimize(large_weight * lateness + max_term_used)
+        primary_objective = large_weight * lateness + max_term_used
+    else:
+        primary_objective = max_term_used
+
+    previous_term_index_by_course: dict[int, int] = {}
+    if request.previous_plan is not None:
+        term_index_by_id = {term_id: term_index for term_index, term_id in enumerate(allowed_terms)}
+        for previous_term in request.previous_plan.terms:
+            previous_term_index = term_index_by_id.get(previous_term.term_id)
+            if previous_term_index is None:
+                continue
+            for course_code in previous_term.course_codes:
+                course_index = code_to_index.get(course_code)
+                if course_index is not None and (course_index, previous_term_index) in x:
+                    previous_term_index_by_course[course_index] = previous_term_index
+
+    if previous_term_index_by_course:
+        for course_index, previous_term_index in previous_term_index_by_course.items():
+            for term_index in feasible_term_indices_by_course[course_index]:
+                model.AddHint(x[(course_index, term_index)], 1 if term_index == previous_term_index else 0)
+            model.AddHint(course_term_indices[course_index], previous_term_index)
+        kept_courses = sum(
+            x[(course_index, previous_term_index)]
+            for course_index, previous_term_index in previous_term_index_by_course.items()
+        )
+        stability_weight = len(previous_term_index_by_course) + 1
+        model.Minimize(stability_weight * primary_objective - kept_courses)
     else:
-        model.Minimize(max_term_used)
+        model.Minimize(primary_objective)
+
+    timings.add("build", time.perf_counter() - build_started_at)
 
     solver = cp_model.CpSolver()
-    solver_status = solver.Solve(model)
+    solve_started_at = time.perf_counter()
+    solver_status = cancellation.solve(solver, model)
+    timings.add("solve", time.perf_counter() - solve_started_at)
+    if cancellation.cancelled:
+        terms = []
+        objective = DegreePlanObjective(status="CANCELLED", max_term_used_index=None)
+        warnings = ["Planning was cancelled before the search finished."]
+        return DegreePlanResponse(terms=terms, objective=objective, warnings=warnings)
+    log_slow_solve("degree_plan", model, solver, request)
+    extract_started_at = time.perf_counter()
+    solver_stats = collect_solver_stats(model, solver) if request.include_solver_stats else None
 
     if solver_status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
         terms = []
-        objective = DegreePlanObjective(status="INFEASIBLE", max_term_used_index=None)
+        objective = DegreePlanObjective(status="INFEASIBLE", max_term_used_index=None, solver_stats=solver_stats)
         warnings = ["No feasible plan found with current constraints."]
         return DegreePlanResponse(terms=terms, objective=objective, warnings=warnings)
 
@@ -178,6 +386,41 @@ def compute_degree_plan(request: DegreePlanRequest, catalog: CatalogSnapshot) ->
     objective = DegreePlanObjective(
         status="OPTIMAL" if solver_status == cp_model.OPTIMAL else "FEASIBLE",
         max_term_used_index=computed_max_term_used_index,
+        solver_stats=solver_stats,
+    )
+
+    changes_from_previous: DegreePlanChanges | None = None
+    if request.previous_plan is not None:
+        changes_from_previous = compare_degree_plans(request.previous_plan.terms, terms)
+
+    timings.add("extract", time.perf_counter() - extract_started_at)
+    return DegreePlanResponse(
+        terms=terms,
+        objective=objective,
+        warnings=warnings,
+        changes_from_previous=changes_from_previous,
     )
 
-    return DegreePlanResponse(terms=terms, objective=objective, warnings=warnings)
+
+def compare_degree_plans(
+    previous_terms: list[DegreePlanTerm],
+    current_terms: list[DegreePlanTerm],
+) -> DegreePlanChanges:
+    previous_term_by_course = {
+        course_code: term.term_id for term in previous_terms for course_code in term.course_codes
+    }
+    current_term_by_course = {
+        course_code: term.term_id for term in current_terms for course_code in term.course_codes
+    }
+    moved_course_codes = sorted(
+        course_code
+        for course_code, term_id in current_term_by_course.items()
+        if course_code in previous_term_by_course and previous_term_by_course[course_code] != term_id
+    )
+    added_course_codes = sorted(set(current_term_by_course) - set(previous_term_by_course))
+    removed_course_codes = sorted(set(previous_term_by_course) - set(current_term_by_course))
+    return DegreePlanChanges(
+        moved_course_codes=moved_course_codes,
+        added_course_codes=added_course_codes,
+        removed_course_codes=removed_course_codes,
+    )
@@ -0,0 +1,113 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Generic, TypeVar
+
+from app.core.config import settings
+from app.schemas.planning import DegreePlanRequest, DegreePlanResponse, TimetableRequest, TimetableResponse
+
+
+CachedValue = TypeVar("CachedValue")
+
+
+class PlanningResultCache(Generic[CachedValue]):
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.lock = Lock()
+        self.entries: OrderedDict[Hashable, tuple[float, CachedValue]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> CachedValue | None:
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self.entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: CachedValue) -> None:
+        if self.max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self.lock:
+            self.entries[key] = (expires_at, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def timetable_cache_key(request: TimetableRequest, catalog_version: int) -> Hashable:
+    preferences = request.preferences
+    max_solutions = request.max_solutions if request.max_solutions is not None else 25
+    return (
+        "timetable",
+        catalog_version,
+        request.term_id,
+        tuple(sorted(set(request.course_codes))),
+        preferences.earliest_time_minutes,
+        preferences.latest_time_minutes,
+        preferences.avoid_friday is True,
+        min(max(max_solutions, 1), 100),
+        request.include_solver_stats,
+    )
+
+
+def degree_plan_cache_key(request: DegreePlanRequest, catalog_version: int) -> Hashable:
+    allowed_terms = list(request.allowed_terms)
+    if request.max_terms is not None and request.max_terms < len(allowed_terms):
+        allowed_terms = allowed_terms[: request.max_terms]
+    target_grad_term = request.target_grad_term if request.target_grad_term in allowed_terms else None
+    previous_plan_key: tuple[tuple[str, tuple[str, ...]], ...] | None = None
+    if request.previous_plan is not None:
+        previous_plan_key = tuple(
+            (term.term_id, tuple(sorted(term.course_codes))) for term in request.previous_plan.terms
+        )
+    return (
+        "degree",
+        catalog_version,
+        request.program_id,
+        tuple(sorted(set(request.completed_courses))),
+        tuple(allowed_terms),
+        target_grad_term,
+        request.min_credits_per_term,
+        request.max_credits_per_term,
+        previous_plan_key,
+        request.include_solver_stats,
+    )
+
+
+timetable_result_cache: PlanningResultCache[TimetableResponse] = PlanningResultCache(
+    settings.planning_cache_max_entries,
+    settings.planning_cache_ttl_seconds,
+)
+degree_plan_result_cache: PlanningResultCache[DegreePlanResponse] = PlanningResultCache(
+    settings.planning_cache_max_entries,
+    settings.planning_cache_ttl_seconds,
+)
@@ -0,0 +1,37 @@
+from threading import Lock
+from typing import Callable, Sequence
+
+from app.planner.timetable_planner import (
+    SectionConflictIndex,
+    TimetableSectionInput,
+    build_section_conflict_index,
+)
+
+
+class SectionConflictIndexCache:
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.indices_by_term: dict[str, SectionConflictIndex] = {}
+
+    def get_or_build(
+        self,
+        term_id: str,
+        fingerprint: tuple[int, int],
+        load_sections: Callable[[], Sequence[TimetableSectionInput]],
+    ) -> SectionConflictIndex:
+        with self.lock:
+            index = self.indices_by_term.get(term_id)
+        if index is not None and index.fingerprint == fingerprint:
+            return index
+
+        index = build_section_conflict_index(term_id, fingerprint, load_sections())
+        with self.lock:
+            self.indices_by_term[term_id] = index
+        return index
+
+    def clear(self) -> None:
+        with self.lock:
+            self.indices_by_term.clear()
+
+
+section_conflict_index_cache = SectionConflictIndexCache()
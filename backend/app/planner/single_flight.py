@@ -0,0 +1,48 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import TypeVar
+
+
+SharedResult = TypeVar("SharedResult")
+
+
+@dataclass
+class SharedCall:
+    task: asyncio.Future
+    waiters: int = 0
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self.calls: dict[Hashable, SharedCall] = {}
+        self.coalesced = 0
+
+    @property
+    def waiters(self) -> int:
+        return sum(call.waiters for call in self.calls.values())
+
+    def forget(self, key: Hashable, call: SharedCall) -> None:
+        if self.calls.get(key) is call:
+            del self.calls[key]
+
+    async def run(self, key: Hashable, start: Callable[[], Awaitable[SharedResult]]) -> SharedResult:
+        call = self.calls.get(key)
+        if call is None:
+            call = SharedCall(task=asyncio.ensure_future(start()))
+            self.calls[key] = call
+            call.task.add_done_callback(lambda finished_task: self.forget(key, call))
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                self.forget(key, call)
+                call.task.cancel()
+
+
+planning_single_flight = SingleFlight()
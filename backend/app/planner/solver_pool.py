@@ -0,0 +1,164 @@
+import asyncio
+import ctypes
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Generic, TypeVar
+
+from app.core.config import settings
+from app.planner.cancellation import SolveCancellation
+from app.planner.timing import PhaseTimings
+
+
+SolverResult = TypeVar("SolverResult")
+
+CANCEL_POLL_SECONDS = 0.05
+
+worker_cancel_flags: ctypes.Array[ctypes.c_byte] | None = None
+
+
+class SolverPoolFullError(Exception):
+    pass
+
+
+class SolveCancelledError(Exception):
+    pass
+
+
+@dataclass
+class SolverRun(Generic[SolverResult]):
+    value: SolverResult
+    queue_seconds: float
+    run_seconds: float
+    timings: PhaseTimings
+
+
+class SolverSlot:
+    def __init__(self, pool: "SolverPool", index: int) -> None:
+        self.pool = pool
+        self.index = index
+        self.released = False
+
+    def release(self) -> None:
+        with self.pool.lock:
+            if self.released:
+                return
+            self.released = True
+            self.pool.in_flight -= 1
+            self.pool.free_slot_indices.append(self.index)
+
+
+def initialize_worker(cancel_flags: ctypes.Array[ctypes.c_byte]) -> None:
+    global worker_cancel_flags
+    worker_cancel_flags = cancel_flags
+
+
+def watch_cancel_flag(slot_index: int, cancellation: SolveCancellation, finished: Event) -> None:
+    while True:
+        if worker_cancel_flags is not None and worker_cancel_flags[slot_index]:
+            cancellation.cancel()
+            return
+        if finished.wait(CANCEL_POLL_SECONDS):
+            return
+
+
+def run_timed(
+    slot_index: int,
+    function: Callable[..., SolverResult],
+    *args: Any,
+) -> tuple[float, float, SolverResult, PhaseTimings]:
+    if worker_cancel_flags is not None and worker_cancel_flags[slot_index]:
+        raise SolveCancelledError()
+    timings = PhaseTimings()
+    cancellation = SolveCancellation()
+    finished = Event()
+    Thread(target=watch_cancel_flag, args=(slot_index, cancellation, finished), daemon=True).start()
+    started_at = time.time()
+    try:
+        value = function(*args, timings=timings, cancellation=cancellation)
+    finally:
+        finished.set()
+    return started_at, time.time(), value, timings
+
+
+class SolverPool:
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.lock = Lock()
+        self.in_flight = 0
+        self.free_slot_indices = list(range(self.capacity))
+        self.cancel_flags = multiprocessing.get_context("spawn").RawArray(ctypes.c_byte, self.capacity)
+        self.executor: ProcessPoolExecutor | None = None
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    @property
+    def saturated(self) -> bool:
+        return self.in_flight >= self.max_workers
+
+    def acquire(self) -> SolverSlot:
+        with self.lock:
+            if self.in_flight >= self.capacity:
+                raise SolverPoolFullError()
+            self.in_flight += 1
+            slot_index = self.free_slot_indices.pop()
+        return SolverSlot(self, slot_index)
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=initialize_worker,
+                    initargs=(self.cancel_flags,),
+                )
+            return self.executor
+
+    async def run(self, function: Callable[..., SolverResult], *args: Any) -> SolverRun[SolverResult]:
+        slot = self.acquire()
+        try:
+            executor = self.get_executor()
+            self.cancel_flags[slot.index] = 0
+            submitted_at = time.time()
+            future: Future = executor.submit(run_timed, slot.index, function, *args)
+        except BaseException:
+            slot.release()
+            raise
+        future.add_done_callback(lambda completed_future: slot.release())
+
+        try:
+            started_at, finished_at, value, timings = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            self.cancel_flags[slot.index] = 1
+            future.cancel()
+            raise
+        return SolverRun(
+            value=value,
+            queue_seconds=max(0.0, started_at - submitted_at),
+            run_seconds=finished_at - started_at,
+            timings=timings,
+        )
+
+    def shutdown(self) -> None:
+        with self.lock:
+            executor = self.executor
+            self.executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+solver_pool = SolverPool(
+    max_workers=settings.solver_pool_workers or os.cpu_count() or 1,
+    max_queue=settings.solver_pool_max_queue,
+)
+cheap_solver_pool = SolverPool(
+    max_workers=settings.cheap_solver_pool_workers,
+    max_queue=settings.cheap_solver_pool_max_queue,
+)
@@ -0,0 +1,103 @@
+import json
+import logging
+import time
+import uuid
+from pathlib import Path
+
+from ortools.sat import cp_model_pb2
+from ortools.sat.python import cp_model
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.schemas.planning import SolverStats
+
+
+logger = logging.getLogger(__name__)
+
+
+def collect_solver_stats(model: cp_model.CpModel, solver: cp_model.CpSolver) -> SolverStats:
+    return build_solver_stats(model, solver.ResponseProto())
+
+
+def collect_solution_stats(model: cp_model.CpModel, callback: cp_model.CpSolverSolutionCallback) -> SolverStats:
+    return build_solver_stats(model, callback.response_proto)
+
+
+def build_solver_stats(model: cp_model.CpModel, response_proto: cp_model_pb2.CpSolverResponse) -> SolverStats:
+    model_proto = model.Proto()
+    return SolverStats(
+        wall_time_seconds=response_proto.wall_time,
+        branches=response_proto.num_branches,
+        conflicts=response_proto.num_conflicts,
+        variables=len(model_proto.variables),
+        constraints=len(model_proto.constraints),
+        presolved_booleans=response_proto.num_booleans,
+        presolved_integers=response_proto.num_integers,
+    )
+
+
+def accumulate_solver_stats(previous: SolverStats | None, latest: SolverStats) -> SolverStats:
+    if previous is None:
+        return latest
+    return latest.model_copy(
+        update={
+            "solves": previous.solves + latest.solves,
+            "wall_time_seconds": previous.wall_time_seconds + latest.wall_time_seconds,
+            "branches": previous.branches + latest.branches,
+            "conflicts": previous.conflicts + latest.conflicts,
+        }
+    )
+
+
+def combine_solver_stats(first: SolverStats | None, second: SolverStats | None) -> SolverStats | None:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return SolverStats(
+        solves=first.solves + second.solves,
+        wall_time_seconds=first.wall_time_seconds + second.wall_time_seconds,
+        branches=first.branches + second.branches,
+        conflicts=first.conflicts + second.conflicts,
+        variables=first.variables + second.variables,
+        constraints=first.constraints + second.constraints,
+        presolved_booleans=first.presolved_booleans + second.presolved_booleans,
+        presolved_integers=first.presolved_integers + second.presolved_integers,
+    )
+
+
+def log_slow_solve(
+    planner: str,
+    model: cp_model.CpModel,
+    solver: cp_model.CpSolver,
+    request: BaseModel | None,
+) -> Path | None:
+    threshold_seconds = settings.slow_solve_threshold_seconds
+    wall_time_seconds = solver.WallTime()
+    if threshold_seconds is None or wall_time_seconds < threshold_seconds:
+        return None
+
+    directory = Path(settings.slow_solve_log_directory)
+    stem = f"{time.strftime('%Y%m%dT%H%M%S')}-{planner}-{uuid.uuid4().hex[:8]}"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        model.ExportToFile(str(directory / f"{stem}.pb"))
+        record = {
+            "planner": planner,
+            "status": solver.StatusName(),
+            "stats": collect_solver_stats(model, solver).model_dump(),
+            "parameters": str(solver.parameters),
+            "request": request.model_dump(mode="json") if request is not None else None,
+        }
+        (directory / f"{stem}.json").write_text(json.dumps(record, indent=2) + "\n")
+    except OSError:
+        logger.exception("Could not save slow %s solve to %s", planner, directory)
+        return None
+
+    logger.warning(
+        "Slow %s solve took %.2fs; saved model and request as %s",
+        planner,
+        wall_time_seconds,
+        directory / stem,
+    )
+    return directory / stem
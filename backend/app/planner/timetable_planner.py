@@ -1,15 +1,34 @@
-from dataclasses import dataclass
-from typing import Sequence
+import heapq
+import math
+import queue
+import time
+from dataclasses import dataclass, field
+from threading import Thread
+from typing import Iterator, Mapping, Sequence
 
 from ortools.sat.python import cp_model
 
+from app.core.config import settings
+from app.planner.cancellation import STOP_RETRY_SECONDS, SolveCancellation
+from app.planner.solver_stats import (
+    accumulate_solver_stats,
+    collect_solution_stats,
+    collect_solver_stats,
+    combine_solver_stats,
+    log_slow_solve,
+)
+from app.planner.timing import PhaseTimings
 from app.schemas.planning import (
     TimetableRequest,
     TimetablePreferences,
     ScheduledSection,
+    SolverStats,
     TimetableResponse,
     TimetableObjective,
     TimetableOption,
+    TimetableStreamEvent,
+    TimetableStreamOption,
+    TimetableStreamSummary,
 )
 
 
@@ -21,28 +40,271 @@ class TimetableSectionInput:
     day_of_week: str
     start_time_minutes: int
     end_time_minutes: int
+    capacity: int | None = None
+
+
+@dataclass
+class EnumeratedTimetable:
+    selected_indices: list[int]
+    total_penalty: int
+    is_optimal: bool
+    solver_stats: SolverStats | None = None
+
+
+@dataclass
+class TimetableSearchProgress:
+    is_partial: bool = False
+    timings: PhaseTimings = field(default_factory=PhaseTimings)
+    request: TimetableRequest | None = None
+    cancellation: SolveCancellation = field(default_factory=SolveCancellation)
+
+
+@dataclass
+class CourseComponent:
+    course_codes: list[str]
+    overlapping_pairs: list[tuple[int, int]]
+
+
+class LazyTimetables:
+    def __init__(self, source: Iterator[EnumeratedTimetable]) -> None:
+        self.source = source
+        self.timetables: list[EnumeratedTimetable] = []
+
+    def has(self, position: int) -> bool:
+        while len(self.timetables) <= position:
+            timetable = next(self.source, None)
+            if timetable is None:
+                return False
+            self.timetables.append(timetable)
+        return True
+
+    def __getitem__(self, position: int) -> EnumeratedTimetable:
+        return self.timetables[position]
+
+
+class TimetableSolutionCollector(cp_model.CpSolverSolutionCallback):
+    def __init__(
+        self,
+        selection_variables: Mapping[int, cp_model.IntVar],
+        solution_limit: int,
+        stats_model: cp_model.CpModel | None = None,
+        previous_stats: SolverStats | None = None,
+    ) -> None:
+        super().__init__()
+        self.selection_variables = selection_variables
+        self.solution_limit = solution_limit
+        self.stats_model = stats_model
+        self.previous_stats = previous_stats
+        self.solution_count = 0
+        self.solutions: queue.Queue[tuple[list[int], SolverStats | None] | None] = queue.Queue()
+        self.abandoned = False
+        self.status = cp_model.UNKNOWN
+        self.solve_seconds = 0.0
+
+    def on_solution_callback(self) -> None:
+        if self.abandoned:
+            self.StopSearch()
+            return
+        selected_indices = [index for index, variable in self.selection_variables.items() if self.Value(variable) == 1]
+        solver_stats = None
+        if self.stats_model is not None:
+            solver_stats = accumulate_solver_stats(self.previous_stats, collect_solution_stats(self.stats_model, self))
+        self.solution_count += 1
+        self.solutions.put((selected_indices, solver_stats))
+        if self.solution_count >= self.solution_limit:
+            self.StopSearch()
+
+
+def start_collecting_solutions(
+    solver: cp_model.CpSolver,
+    model: cp_model.CpModel,
+    collector: TimetableSolutionCollector,
+    cancellation: SolveCancellation,
+) -> Thread:
+    def solve() -> None:
+        solve_started_at = time.perf_counter()
+        try:
+            collector.status = cancellation.solve(solver, model, collector)
+        finally:
+            collector.solve_seconds = time.perf_counter() - solve_started_at
+            collector.solutions.put(None)
+
+    solve_thread = Thread(target=solve, daemon=True)
+    solve_thread.start()
+    return solve_thread
+
+
+def stop_collecting_solutions(
+    solver: cp_model.CpSolver,
+    collector: TimetableSolutionCollector,
+    solve_thread: Thread,
+) -> None:
+    collector.abandoned = True
+    while solve_thread.is_alive():
+        solver.StopSearch()
+        solve_thread.join(STOP_RETRY_SECONDS)
+
+
+def group_equivalent_sections(sections: Sequence[TimetableSectionInput]) -> dict[int, list[int]]:
+    representative_by_slot: dict[tuple[str, str, str, int, int], int] = {}
+    equivalent_indices_by_representative: dict[int, list[int]] = {}
+    for index, section in enumerate(sections):
+        slot = (
+            section.course_code,
+            section.kind,
+            section.day_of_week,
+            section.start_time_minutes,
+            section.end_time_minutes,
+        )
+        representative_index = representative_by_slot.get(slot)
+        if representative_index is None:
+            representative_by_slot[slot] = index
+            equivalent_indices_by_representative[index] = [index]
+        else:
+            equivalent_indices_by_representative[representative_index].append(index)
+    return equivalent_indices_by_representative
+
+
+def find_overlapping_pairs(sections: Sequence[TimetableSectionInput]) -> list[tuple[int, int]]:
+    indices_by_day: dict[str, list[int]] = {}
+    for index, section in enumerate(sections):
+        if section.end_time_minutes <= section.start_time_minutes:
+            continue
+        if section.day_of_week not in indices_by_day:
+            indices_by_day[section.day_of_week] = []
+        indices_by_day[section.day_of_week].append(index)
+
+    overlapping_pairs: list[tuple[int, int]] = []
+    for day_indices in indices_by_day.values():
+        day_indices.sort(key=lambda index: sections[index].start_time_minutes)
+        active_indices: list[int] = []
+        for index in day_indices:
+            start_time = sections[index].start_time_minutes
+            active_indices = [other for other in active_indices if sections[other].end_time_minutes > start_time]
+            for other in active_indices:
+                overlapping_pairs.append((min(index, other), max(index, other)))
+            active_indices.append(index)
 
+    overlapping_pairs.sort()
+    return overlapping_pairs
 
-def sections_overlap(section_a: TimetableSectionInput, section_b: TimetableSectionInput) -> bool:
-    if section_a.day_of_week != section_b.day_of_week:
-        return False
-    latest_start = max(section_a.start_time_minutes, section_b.start_time_minutes)
-    earliest_end = min(section_a.end_time_minutes, section_b.end_time_minutes)
-    return latest_start < earliest_end
+
+@dataclass
+class SectionConflictIndex:
+    term_id: str
+    fingerprint: tuple[int, int]
+    sections: list[TimetableSectionInput]
+    conflicting_section_ids: dict[str, set[str]]
+
+    def sections_for_courses(self, course_codes: Sequence[str]) -> list[TimetableSectionInput]:
+        requested_codes = set(course_codes)
+        return [section for section in self.sections if section.course_code in requested_codes]
+
+    def overlapping_pairs(self, sections: Sequence[TimetableSectionInput]) -> list[tuple[int, int]]:
+        index_by_section_id = {section.section_id: index for index, section in enumerate(sections)}
+        overlapping_pairs: list[tuple[int, int]] = []
+        for index, section in enumerate(sections):
+            for other_section_id in self.conflicting_section_ids.get(section.section_id, ()):
+                other_index = index_by_section_id.get(other_section_id)
+                if other_index is not None and other_index > index:
+                    overlapping_pairs.append((index, other_index))
+        overlapping_pairs.sort()
+        return overlapping_pairs
+
+    def restricted_to(self, sections: Sequence[TimetableSectionInput]) -> "SectionConflictIndex":
+        section_ids = {section.section_id for section in sections}
+        return SectionConflictIndex(
+            term_id=self.term_id,
+            fingerprint=self.fingerprint,
+            sections=list(sections),
+            conflicting_section_ids={
+                section_id: conflicting_ids & section_ids
+                for section_id, conflicting_ids in self.conflicting_section_ids.items()
+                if section_id in section_ids
+            },
+        )
+
+
+def build_section_conflict_index(
+    term_id: str,
+    fingerprint: tuple[int, int],
+    sections: Sequence[TimetableSectionInput],
+) -> SectionConflictIndex:
+    conflicting_section_ids: dict[str, set[str]] = {}
+    for i, j in find_overlapping_pairs(sections):
+        section_id_a = sections[i].section_id
+        section_id_b = sections[j].section_id
+        if section_id_a not in conflicting_section_ids:
+            conflicting_section_ids[section_id_a] = set()
+        if section_id_b not in conflicting_section_ids:
+            conflicting_section_ids[section_id_b] = set()
+        conflicting_section_ids[section_id_a].add(section_id_b)
+        conflicting_section_ids[section_id_b].add(section_id_a)
+
+    return SectionConflictIndex(
+        term_id=term_id,
+        fingerprint=fingerprint,
+        sections=list(sections),
+        conflicting_section_ids=conflicting_section_ids,
+    )
+
+
+def resolve_time_budget_seconds(request: TimetableRequest) -> float:
+    requested_budget = (
+        request.time_budget_seconds
+        if request.time_budget_seconds is not None
+        else settings.timetable_default_time_budget_seconds
+    )
+    if requested_budget <= 0:
+        return settings.timetable_default_time_budget_seconds
+    if requested_budget > settings.timetable_max_time_budget_seconds:
+        return settings.timetable_max_time_budget_seconds
+    return requested_budget
 
 
 def compute_timetable(
     request: TimetableRequest,
     sections: Sequence[TimetableSectionInput],
+    conflict_index: SectionConflictIndex | None = None,
+    timings: PhaseTimings | None = None,
+    cancellation: SolveCancellation | None = None,
 ) -> TimetableResponse:
+    options: list[TimetableOption] = []
+    summary = TimetableStreamSummary()
+    for event in stream_timetable(request, sections, conflict_index, timings, cancellation):
+        if isinstance(event, TimetableStreamOption):
+            options.append(event.option)
+        else:
+            summary = event
+    return TimetableResponse(options=options, warnings=summary.warnings, status=summary.status)
+
+
+def stream_timetable(
+    request: TimetableRequest,
+    sections: Sequence[TimetableSectionInput],
+    conflict_index: SectionConflictIndex | None = None,
+    timings: PhaseTimings | None = None,
+    cancellation: SolveCancellation | None = None,
+) -> Iterator[TimetableStreamEvent]:
+    started_at = time.monotonic()
+    build_started_at = time.perf_counter()
+    if timings is None:
+        timings = PhaseTimings()
+    if cancellation is None:
+        cancellation = SolveCancellation()
+
     if not request.course_codes:
-        return TimetableResponse(
-            options=[TimetableOption(sections=[], objective=TimetableObjective(status="NO_COURSES", total_penalty=0.0))],
-            warnings=[],
+        yield TimetableStreamOption(
+            option=TimetableOption(sections=[], objective=TimetableObjective(status="NO_COURSES", total_penalty=0.0))
         )
+        yield TimetableStreamSummary(warnings=[])
+        return
+
+    equivalent_indices_by_representative = group_equivalent_sections(sections)
 
     sections_for_course: dict[str, list[int]] = {}
-    for index, section in enumerate(sections):
+    for index in equivalent_indices_by_representative:
+        section = sections[index]
         if section.course_code not in sections_for_course:
             sections_for_course[section.course_code] = []
         sections_for_course[section.course_code].append(index)
@@ -50,10 +312,8 @@ def compute_timetable(
     missing_courses = [code for code in request.course_codes if code not in sections_for_course]
     if missing_courses:
         warning_text = "No sections found for courses: " + ", ".join(sorted(missing_courses))
-        return TimetableResponse(
-            options=[],
-            warnings=[warning_text],
-        )
+        yield TimetableStreamSummary(warnings=[warning_text])
+        return
 
     preferences: TimetablePreferences = request.preferences
     earliest_time = preferences.earliest_time_minutes
@@ -63,13 +323,15 @@ def compute_timetable(
     num_sections = len(sections)
     section_indices = list(range(num_sections))
 
-    overlapping_pairs: list[tuple[int, int]] = []
-    for i in section_indices:
-        for j in section_indices:
-            if j <= i:
-                continue
-            if sections_overlap(sections[i], sections[j]):
-                overlapping_pairs.append((i, j))
+    if conflict_index is not None:
+        overlapping_pairs = conflict_index.overlapping_pairs(sections)
+    else:
+        overlapping_pairs = find_overlapping_pairs(sections)
+    overlapping_pairs = [
+        (i, j)
+        for i, j in overlapping_pairs
+        if i in equivalent_indices_by_representative and j in equivalent_indices_by_representative
+    ]
 
     penalty_coefficients: dict[int, int] = {}
     for index in section_indices:
@@ -91,31 +353,11 @@ def compute_timetable(
     else:
         max_solutions = requested_max
 
-    model = cp_model.CpModel()
-
-    y: dict[int, cp_model.IntVar] = {}
-    for index in section_indices:
-        y[index] = model.NewBoolVar(f"y_{index}")
+    time_budget_seconds = resolve_time_budget_seconds(request)
 
-    for course_code in request.course_codes:
-        indices = sections_for_course.get(course_code, [])
-        model.Add(sum(y[index] for index in indices) == 1)
-
-    for i, j in overlapping_pairs:
-        model.Add(y[i] + y[j] <= 1)
+    course_codes = list(dict.fromkeys(request.course_codes))
+    components = find_course_components(course_codes, sections, overlapping_pairs)
 
-    total_penalty_expr_terms: list[cp_model.LinearExpr] = []
-    for index in section_indices:
-        coefficient = penalty_coefficients[index]
-        if coefficient > 0:
-            total_penalty_expr_terms.append(coefficient * y[index])
-
-    if total_penalty_expr_terms:
-        model.Minimize(sum(total_penalty_expr_terms))
-    else:
-        model.Minimize(0)
-
-    options: list[TimetableOption] = []
     warnings: list[str] = []
 
     if overlapping_pairs:
@@ -125,25 +367,28 @@ def compute_timetable(
     if avoid_friday:
         warnings.append("Friday sections are penalized in the objective when alternatives exist.")
 
-    while len(options) < max_solutions:
-        solver = cp_model.CpSolver()
-        solver.parameters.max_time_in_seconds = 5.0
-        solver_status = solver.Solve(model)
-
-        if solver_status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-            break
-
-        selected_indices: list[int] = []
-        for index in section_indices:
-            if solver.Value(y[index]) == 1:
-                selected_indices.append(index)
-
-        if not selected_indices:
-            break
+    deadline = started_at + time_budget_seconds
+    progress = TimetableSearchProgress(timings=timings, request=request, cancellation=cancellation)
+    component_timetables: list[Iterator[EnumeratedTimetable]] = []
+    for component in components:
+        component_timetables.append(
+            enumerate_component_timetables(
+                component.course_codes,
+                sections_for_course,
+                component.overlapping_pairs,
+                penalty_coefficients,
+                max_solutions,
+                deadline,
+                progress,
+            )
+        )
+    timings.add("build", time.perf_counter() - build_started_at)
 
+    option_count = 0
+    for enumerated in merge_component_timetables(component_timetables, max_solutions):
+        extract_started_at = time.perf_counter()
         selected_sections: list[ScheduledSection] = []
-        total_penalty_value = 0
-        for index in selected_indices:
+        for index in enumerated.selected_indices:
             section = sections[index]
             selected_sections.append(
                 ScheduledSection(
@@ -153,26 +398,292 @@ def compute_timetable(
                     day_of_week=section.day_of_week,
                     start_time_minutes=section.start_time_minutes,
                     end_time_minutes=section.end_time_minutes,
+                    alternative_section_ids=[
+                        sections[equivalent_index].section_id
+                        for equivalent_index in equivalent_indices_by_representative[index]
+                        if equivalent_index != index
+                    ],
                 )
             )
-            total_penalty_value += penalty_coefficients[index]
 
-        objective_status = "OPTIMAL" if solver_status == cp_model.OPTIMAL else "FEASIBLE"
+        objective_status = "OPTIMAL" if enumerated.is_optimal else "FEASIBLE"
         option = TimetableOption(
             sections=selected_sections,
-            objective=TimetableObjective(status=objective_status, total_penalty=float(total_penalty_value)),
+            objective=TimetableObjective(
+                status=objective_status,
+                total_penalty=float(enumerated.total_penalty),
+                solver_stats=enumerated.solver_stats,
+            ),
         )
-        options.append(option)
+        option_count += 1
+        timings.add("extract", time.perf_counter() - extract_started_at)
+        yield TimetableStreamOption(option=option)
+
+    response_status = "PARTIAL" if progress.is_partial else "COMPLETE"
+
+    if option_count == 0:
+        if progress.is_partial:
+            warning_text = "No feasible timetable found within the time budget."
+        else:
+            warning_text = "No feasible timetable found for the requested courses and constraints."
+        yield TimetableStreamSummary(status=response_status, warnings=[warning_text])
+        return
+
+    if progress.is_partial:
+        warnings.append("The time budget ran out before the search finished. Returned timetable options are partial.")
+    elif option_count == max_solutions:
+        warnings.append("Returned timetable options are capped. Increase max_solutions to search for more.")
+
+    yield TimetableStreamSummary(status=response_status, warnings=warnings)
+
+
+def find_course_components(
+    course_codes: Sequence[str],
+    sections: Sequence[TimetableSectionInput],
+    overlapping_pairs: Sequence[tuple[int, int]],
+) -> list[CourseComponent]:
+    linked_courses: dict[str, set[str]] = {course_code: set() for course_code in course_codes}
+    cross_course_pairs: list[tuple[int, int]] = []
+    for i, j in overlapping_pairs:
+        course_code_a = sections[i].course_code
+        course_code_b = sections[j].course_code
+        if course_code_a == course_code_b:
+            continue
+        if course_code_a not in linked_courses or course_code_b not in linked_courses:
+            continue
+        linked_courses[course_code_a].add(course_code_b)
+        linked_courses[course_code_b].add(course_code_a)
+        cross_course_pairs.append((i, j))
+
+    component_index_by_course: dict[str, int] = {}
+    components: list[CourseComponent] = []
+    for course_code in course_codes:
+        if course_code in component_index_by_course:
+            continue
+        component_index = len(components)
+        component = CourseComponent(course_codes=[], overlapping_pairs=[])
+        pending = [course_code]
+        component_index_by_course[course_code] = component_index
+        while pending:
+            current = pending.pop()
+            component.course_codes.append(current)
+            for neighbour in linked_courses[current]:
+                if neighbour not in component_index_by_course:
+                    component_index_by_course[neighbour] = component_index
+                    pending.append(neighbour)
+        components.append(component)
+
+    for i, j in cross_course_pairs:
+        component_index = component_index_by_course[sections[i].course_code]
+        components[component_index].overlapping_pairs.append((i, j))
+
+    return components
+
+
+def enumerate_component_timetables(
+    course_codes: Sequence[str],
+    sections_for_course: Mapping[str, list[int]],
+    overlapping_pairs: Sequence[tuple[int, int]],
+    penalty_coefficients: Mapping[int, int],
+    max_solutions: int,
+    deadline: float,
+    progress: TimetableSearchProgress,
+) -> Iterator[EnumeratedTimetable]:
+    if len(course_codes) == 1:
+        indices = sorted(sections_for_course[course_codes[0]], key=lambda index: (penalty_coefficients[index], index))
+        for index in indices[:max_solutions]:
+            yield EnumeratedTimetable(selected_indices=[index], total_penalty=penalty_coefficients[index], is_optimal=True)
+        return
+
+    if time.monotonic() >= deadline:
+        progress.is_partial = True
+        return
+
+    build_started_at = time.perf_counter()
+    model = cp_model.CpModel()
+
+    y: dict[int, cp_model.IntVar] = {}
+    for course_code in course_codes:
+        for index in sections_for_course[course_code]:
+            y[index] = model.NewBoolVar(f"y_{index}")
 
-        model.Add(sum(y[index] for index in selected_indices) <= len(selected_indices) - 1)
+    for course_code in course_codes:
+        indices = sections_for_course[course_code]
+        model.Add(sum(y[index] for index in indices) == 1)
+
+    for i, j in overlapping_pairs:
+        model.AddAtMostOne([y[i], y[j]])
 
-    if not options:
-        return TimetableResponse(
-            options=[],
-            warnings=["No feasible timetable found for the requested courses and constraints."],
+    total_penalty_expr_terms: list[cp_model.LinearExpr] = []
+    for index, variable in y.items():
+        coefficient = penalty_coefficients[index]
+        if coefficient > 0:
+            total_penalty_expr_terms.append(coefficient * variable)
+
+    penalty_upper_bound = 0
+    for course_code in course_codes:
+        indices = sections_for_course[course_code]
+        penalty_upper_bound += max(penalty_coefficients[index] for index in indices)
+
+    total_penalty = model.NewIntVar(0, penalty_upper_bound, "total_penalty")
+    model.Add(total_penalty == sum(total_penalty_expr_terms))
+    model.Minimize(total_penalty)
+    progress.timings.add("build", time.perf_counter() - build_started_at)
+
+    yield from enumerate_timetables(model, y, total_penalty, penalty_upper_bound, max_solutions, deadline, progress)
+
+
+def merge_k_best_timetables(
+    left: LazyTimetables,
+    right: LazyTimetables,
+    max_solutions: int,
+) -> Iterator[EnumeratedTimetable]:
+    if not left.has(0) or not right.has(0):
+        return
+
+    frontier: list[tuple[int, int, int]] = [(left[0].total_penalty + right[0].total_penalty, 0, 0)]
+    visited: set[tuple[int, int]] = {(0, 0)}
+    merged_count = 0
+    while frontier and merged_count < max_solutions:
+        total_penalty, left_position, right_position = heapq.heappop(frontier)
+        left_timetable = left[left_position]
+        right_timetable = right[right_position]
+        merged_count += 1
+        yield EnumeratedTimetable(
+            selected_indices=sorted(left_timetable.selected_indices + right_timetable.selected_indices),
+            total_penalty=total_penalty,
+            is_optimal=left_timetable.is_optimal and right_timetable.is_optimal,
+            solver_stats=combine_solver_stats(left_timetable.solver_stats, right_timetable.solver_stats),
         )
+        for next_left, next_right in ((left_position + 1, right_position), (left_position, right_position + 1)):
+            if (next_left, next_right) in visited:
+                continue
+            if not left.has(next_left) or not right.has(next_right):
+                continue
+            visited.add((next_left, next_right))
+            heapq.heappush(
+                frontier,
+                (left[next_left].total_penalty + right[next_right].total_penalty, next_left, next_right),
+            )
 
-    if len(options) == max_solutions:
-        warnings.append("Returned timetable options are capped. Increase max_solutions to search for more.")
 
-    return TimetableResponse(options=options, warnings=warnings)
+def merge_component_timetables(
+    component_timetables: Sequence[Iterator[EnumeratedTimetable]],
+    max_solutions: int,
+) -> Iterator[EnumeratedTimetable]:
+    merged = component_timetables[0]
+    for timetables in component_timetables[1:]:
+        merged = merge_k_best_timetables(LazyTimetables(merged), LazyTimetables(timetables), max_solutions)
+    return merged
+
+
+def enumerate_timetables(
+    model: cp_model.CpModel,
+    y: Mapping[int, cp_model.IntVar],
+    total_penalty: cp_model.IntVar,
+    penalty_upper_bound: int,
+    max_solutions: int,
+    deadline: float,
+    progress: TimetableSearchProgress,
+) -> Iterator[EnumeratedTimetable]:
+    remaining_seconds = deadline - time.monotonic()
+    if remaining_seconds <= 0:
+        progress.is_partial = True
+        return
+
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = remaining_seconds
+    solve_started_at = time.perf_counter()
+    solver_status = progress.cancellation.solve(solver, model)
+    progress.timings.add("solve", time.perf_counter() - solve_started_at)
+    log_slow_solve("timetable", model, solver, progress.request)
+    include_solver_stats = progress.request is not None and progress.request.include_solver_stats
+    solver_stats = collect_solver_stats(model, solver) if include_solver_stats else None
+
+    if solver_status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        if solver_status == cp_model.UNKNOWN:
+            progress.is_partial = True
+        return
+
+    lowest_penalty = solver.Value(total_penalty)
+    if solver_status == cp_model.OPTIMAL:
+        first_level = lowest_penalty
+        levels_exhausted = True
+    else:
+        first_level = max(0, math.ceil(solver.BestObjectiveBound()))
+        levels_exhausted = False
+        progress.is_partial = True
+
+    incumbent = EnumeratedTimetable(
+        selected_indices=[index for index, variable in y.items() if solver.Value(variable) == 1],
+        total_penalty=lowest_penalty,
+        is_optimal=levels_exhausted,
+        solver_stats=solver_stats,
+    )
+    incumbent_pending = True
+    enumerated_count = 0
+
+    model.ClearObjective()
+    solver.parameters.enumerate_all_solutions = True
+
+    for level in range(first_level, penalty_upper_bound + 1):
+        remaining_solutions = max_solutions - enumerated_count
+        if remaining_solutions <= 0:
+            break
+        if level == lowest_penalty:
+            incumbent_pending = False
+            enumerated_count += 1
+            yield incumbent
+            remaining_solutions -= 1
+            if remaining_solutions <= 0:
+                break
+        remaining_seconds = deadline - time.monotonic()
+        if remaining_seconds <= 0:
+            progress.is_partial = True
+            break
+
+        level_literal = model.NewBoolVar(f"penalty_level_{level}")
+        model.Add(total_penalty == level).OnlyEnforceIf(level_literal)
+        model.ClearAssumptions()
+        model.AddAssumption(level_literal)
+
+        skipped_indices = incumbent.selected_indices if level == lowest_penalty else None
+        solution_limit = remaining_solutions if skipped_indices is None else remaining_solutions + 1
+        collector = TimetableSolutionCollector(
+            y,
+            solution_limit,
+            stats_model=model if include_solver_stats else None,
+            previous_stats=solver_stats,
+        )
+        solver.parameters.max_time_in_seconds = remaining_seconds
+        solve_thread = start_collecting_solutions(solver, model, collector, progress.cancellation)
+        try:
+            while True:
+                collected = collector.solutions.get()
+                if collected is None:
+                    break
+                selected_indices, solution_stats = collected
+                if selected_indices == skipped_indices or enumerated_count >= max_solutions:
+                    continue
+                enumerated_count += 1
+                yield EnumeratedTimetable(
+                    selected_indices=selected_indices,
+                    total_penalty=level,
+                    is_optimal=levels_exhausted,
+                    solver_stats=solution_stats,
+                )
+        finally:
+            stop_collecting_solutions(solver, collector, solve_thread)
+        progress.timings.add("solve", collector.solve_seconds)
+        log_slow_solve("timetable", model, solver, progress.request)
+        if include_solver_stats:
+            solver_stats = accumulate_solver_stats(solver_stats, collect_solver_stats(model, solver))
+
+        level_status = collector.status
+        if level_status not in (cp_model.OPTIMAL, cp_model.INFEASIBLE):
+            if collector.solution_count < solution_limit:
+                progress.is_partial = True
+            break
+
+    if incumbent_pending and enumerated_count < max_solutions:
+        yield incumbent
@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class PhaseTimings:
+    seconds_by_phase: dict[str, float] = field(default_factory=dict)
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.seconds_by_phase[phase] = self.seconds_by_phase.get(phase, 0.0) + seconds
+
+    def merge(self, other: "PhaseTimings") -> None:
+        for phase, seconds in other.seconds_by_phase.items():
+            self.add(phase, seconds)
@@ -8,3 +8,19 @@ class CourseRead(BaseModel):
     description: str | None = None
 
     model_config = {"from_attributes": True}
+
+
+class CourseListItem(BaseModel):
+    code: str
+    name: str | None = None
+    credits: float | None = None
+    description: str | None = None
+
+
+class CourseSearchResult(BaseModel):
+    code: str
+    name: str
+    credits: float
+    score: float
+
+    model_config = {"from_attributes": True}
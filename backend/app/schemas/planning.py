@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
@@ -7,9 +9,34 @@ class DegreePlanTerm(BaseModel):
     total_credits: float
 
 
+class SolverStats(BaseModel):
+    solves: int = 1
+    wall_time_seconds: float
+    branches: int
+    conflicts: int
+    variables: int
+    constraints: int
+    presolved_booleans: int
+    presolved_integers: int
+
+
 class DegreePlanObjective(BaseModel):
     status: str
     max_term_used_index: int | None = None
+    solver_stats: SolverStats | None = None
+
+
+class DegreePlanChanges(BaseModel):
+    moved_course_codes: list[str] = []
+    added_course_codes: list[str] = []
+    removed_course_codes: list[str] = []
+
+
+class DegreePlanResponse(BaseModel):
+    terms: list[DegreePlanTerm]
+    objective: DegreePlanObjective
+    warnings: list[str] = []
+    changes_from_previous: DegreePlanChanges | None = None
 
 
 class DegreePlanRequest(BaseModel):
@@ -20,12 +47,19 @@ class DegreePlanRequest(BaseModel):
     min_credits_per_term: float
     max_credits_per_term: float
     max_terms: int | None = None
+    previous_plan: DegreePlanResponse | None = None
+    include_solver_stats: bool = False
 
 
-class DegreePlanResponse(BaseModel):
-    terms: list[DegreePlanTerm]
-    objective: DegreePlanObjective
-    warnings: list[str] = []
+class DegreePlanBatchRequest(BaseModel):
+    requests: list[DegreePlanRequest]
+
+
+class DegreePlanBatchItem(BaseModel):
+    index: int
+    status: str
+    response: DegreePlanResponse | None = None
+    detail: str | None = None
 
 
 class TimetablePreferences(BaseModel):
@@ -39,6 +73,8 @@ class TimetableRequest(BaseModel):
     course_codes: list[str]
     preferences: TimetablePreferences
     max_solutions: int | None = None
+    time_budget_seconds: float | None = None
+    include_solver_stats: bool = False
 
 
 class ScheduledSection(BaseModel):
@@ -48,11 +84,13 @@ class ScheduledSection(BaseModel):
     day_of_week: str
     start_time_minutes: int
     end_time_minutes: int
+    alternative_section_ids: list[str] = []
 
 
 class TimetableObjective(BaseModel):
     status: str
     total_penalty: float | None = None
+    solver_stats: SolverStats | None = None
 
 
 class TimetableOption(BaseModel):
@@ -63,3 +101,44 @@ class TimetableOption(BaseModel):
 class TimetableResponse(BaseModel):
     options: list[TimetableOption]
     warnings: list[str] = []
+    status: str = "COMPLETE"
+
+
+class TimetableStreamOption(BaseModel):
+    event: Literal["option"] = "option"
+    option: TimetableOption
+
+
+class TimetableStreamSummary(BaseModel):
+    event: Literal["summary"] = "summary"
+    status: str = "COMPLETE"
+    warnings: list[str] = []
+
+
+TimetableStreamEvent = TimetableStreamOption | TimetableStreamSummary
+
+
+class CohortStudentRequest(BaseModel):
+    student_id: str
+    course_codes: list[str]
+    preferences: TimetablePreferences = TimetablePreferences()
+
+
+class CohortAllocationRequest(BaseModel):
+    term_id: str
+    students: list[CohortStudentRequest]
+    max_patterns_per_group: int | None = None
+
+
+class CohortStudentAllocation(BaseModel):
+    student_id: str
+    status: str
+    sections: list[ScheduledSection] = []
+    total_penalty: float | None = None
+
+
+class CohortAllocationResponse(BaseModel):
+    status: str
+    allocations: list[CohortStudentAllocation]
+    unassigned_count: int = 0
+    warnings: list[str] = []
@@ -7,3 +7,9 @@ class ProgramRead(BaseModel):
     description: str | None = None
 
     model_config = {"from_attributes": True}
+
+
+class ProgramListItem(BaseModel):
+    id: str
+    name: str | None = None
+    description: str | None = None
@@ -0,0 +1,50 @@
+from dataclasses import replace
+
+import pytest
+
+from app.benchmarks.planners import BENCHMARK_CASES, PlannerBenchmarkCase, build_benchmark_inputs
+from app.benchmarks.synthetic_catalog import generate_synthetic_catalog
+from app.planner.degree_planner import compute_degree_plan
+from app.planner.timetable_planner import compute_timetable
+
+
+BENCHMARK_ROUNDS = 5
+
+
+@pytest.mark.parametrize("case", BENCHMARK_CASES, ids=lambda case: case.name)
+def test_degree_plan_benchmark(benchmark, case: PlannerBenchmarkCase) -> None:
+    inputs = build_benchmark_inputs(case, seed=0)
+    benchmark.group = "degree_plan"
+
+    response = benchmark.pedantic(
+        compute_degree_plan,
+        setup=lambda: ((inputs.degree_plan_request, inputs.catalog.catalog_snapshot()), {}),
+        rounds=BENCHMARK_ROUNDS,
+        warmup_rounds=1,
+    )
+
+    assert response.objective.status == "OPTIMAL"
+
+
+@pytest.mark.parametrize("case", BENCHMARK_CASES, ids=lambda case: case.name)
+def test_timetable_benchmark(benchmark, case: PlannerBenchmarkCase) -> None:
+    inputs = build_benchmark_inputs(case, seed=0)
+    benchmark.group = "timetable"
+
+    response = benchmark.pedantic(
+        compute_timetable,
+        args=(inputs.timetable_request, inputs.timetable_sections),
+        rounds=BENCHMARK_ROUNDS,
+        warmup_rounds=1,
+    )
+
+    assert response.status == "COMPLETE"
+    assert response.options
+
+
+def test_synthetic_catalog_is_deterministic() -> None:
+    shape = replace(BENCHMARK_CASES[1].shape, seed=7)
+
+    assert generate_synthetic_catalog(shape) == generate_synthetic_catalog(shape)
+    assert build_benchmark_inputs(BENCHMARK_CASES[1], seed=7) == build_benchmark_inputs(BENCHMARK_CASES[1], seed=7)
+    assert BENCHMARK_CASES[1].shape.seed == 0
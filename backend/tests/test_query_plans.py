@@ -0,0 +1,71 @@
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import Connection, Select, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+
+from app.benchmarks.query_plans import SEED_STATEMENTS, find_pending_migrations
+from app.db import engine
+from app.models import CourseOffering, Prerequisite, ProgramRequirement, Section
+
+
+COURSE_CODES = ["QP101", "QP202", "QP303", "QP404", "QP505"]
+
+KEYED_LOOKUPS = {
+    "sections": select(Section.id)
+    .where(Section.term_id == "QP-T2")
+    .where(Section.course_code.in_(COURSE_CODES)),
+    "program_requirements": select(ProgramRequirement.course_code)
+    .where(ProgramRequirement.program_id == "QP-P17")
+    .where(ProgramRequirement.requirement_type == "REQUIRED"),
+    "prerequisites": select(Prerequisite.prereq_code).where(Prerequisite.course_code.in_(COURSE_CODES)),
+    "course_offerings": select(CourseOffering.id)
+    .where(CourseOffering.course_code == "QP303")
+    .where(CourseOffering.term_id == "QP-T2"),
+}
+
+
+@pytest.fixture(scope="module")
+def seeded_connection() -> Iterator[Connection]:
+    try:
+        connection = engine.connect()
+    except OperationalError:
+        pytest.skip("No database is available.")
+    try:
+        if find_pending_migrations(connection):
+            connection.rollback()
+            pytest.skip("The database has pending migrations.")
+        connection.rollback()
+        transaction = connection.begin()
+        try:
+            for seed_statement in SEED_STATEMENTS:
+                connection.exec_driver_sql(seed_statement)
+            yield connection
+        finally:
+            transaction.rollback()
+    finally:
+        connection.close()
+
+
+def collect_scan_node_types(plan: dict, relation_name: str) -> list[str]:
+    node_types: list[str] = []
+    if plan.get("Relation Name") == relation_name:
+        node_types.append(plan["Node Type"])
+    for child_plan in plan.get("Plans", []):
+        node_types.extend(collect_scan_node_types(child_plan, relation_name))
+    return node_types
+
+
+def explain_scan_node_types(connection: Connection, statement: Select, relation_name: str) -> list[str]:
+    compiled_statement = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    explain_output = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled_statement}").scalar_one()
+    return collect_scan_node_types(explain_output[0]["Plan"], relation_name)
+
+
+@pytest.mark.parametrize("relation_name", list(KEYED_LOOKUPS))
+def test_keyed_lookup_uses_an_index(seeded_connection: Connection, relation_name: str) -> None:
+    scan_node_types = explain_scan_node_types(seeded_connection, KEYED_LOOKUPS[relation_name], relation_name)
+
+    assert scan_node_types
+    assert "Seq Scan" not in scan_node_types
@@ -0,0 +1,95 @@
+from ortools.sat.python import cp_model
+
+from app.planner.cancellation import SolveCancellation
+from app.planner.timetable_planner import TimetableSectionInput, compute_timetable
+from app.schemas.planning import TimetablePreferences, TimetableRequest
+
+
+class HintedFirstSolveCancellation(SolveCancellation):
+    def __init__(self, hinted_section_indices: set[int]) -> None:
+        super().__init__()
+        self.hinted_section_indices = hinted_section_indices
+        self.first_status: int | None = None
+
+    def solve(
+        self,
+        solver: cp_model.CpSolver,
+        model: cp_model.CpModel,
+        solution_callback: cp_model.CpSolverSolutionCallback | None = None,
+    ) -> int:
+        if self.first_status is not None:
+            return super().solve(solver, model, solution_callback)
+        model_proto = model.Proto()
+        for variable_index, variable in enumerate(model_proto.variables):
+            if variable.name.startswith("y_"):
+                model_proto.solution_hint.vars.append(variable_index)
+                model_proto.solution_hint.values.append(int(int(variable.name[2:]) in self.hinted_section_indices))
+        solver.parameters.stop_after_first_solution = True
+        solver.parameters.num_workers = 1
+        solver.parameters.cp_model_presolve = False
+        solver.parameters.linearization_level = 0
+        self.first_status = super().solve(solver, model, solution_callback)
+        solver.parameters.stop_after_first_solution = False
+        model.ClearHints()
+        return self.first_status
+
+
+SECTIONS = [
+    TimetableSectionInput("a0", "A", "LEC", "MON", 600, 680),
+    TimetableSectionInput("a1", "A", "LEC", "MON", 480, 560),
+    TimetableSectionInput("a2", "A", "LEC", "FRI", 480, 560),
+    TimetableSectionInput("b0", "B", "LEC", "MON", 640, 720),
+    TimetableSectionInput("b1", "B", "LEC", "TUE", 480, 560),
+    TimetableSectionInput("b2", "B", "LEC", "FRI", 1320, 1400),
+    TimetableSectionInput("b3", "B", "LEC", "WED", 600, 680),
+    TimetableSectionInput("c0", "C", "LEC", "THU", 600, 680),
+    TimetableSectionInput("c1", "C", "LEC", "THU", 480, 560),
+]
+PREFERENCES = TimetablePreferences(earliest_time_minutes=540, latest_time_minutes=1000, avoid_friday=True)
+
+
+def plan_with_worst_first_solution(course_codes: list[str]) -> tuple[int | None, list[float]]:
+    cancellation = HintedFirstSolveCancellation({2, 5})
+    response = compute_timetable(
+        TimetableRequest(term_id="T", course_codes=course_codes, preferences=PREFERENCES, max_solutions=20),
+        SECTIONS,
+        cancellation=cancellation,
+    )
+    return cancellation.first_status, [option.objective.total_penalty for option in response.options]
+
+
+def test_feasible_first_solve_keeps_options_in_penalty_order() -> None:
+    first_status, penalties = plan_with_worst_first_solution(["A", "B"])
+
+    assert first_status == cp_model.FEASIBLE
+    assert penalties == sorted(penalties)
+    assert penalties[0] == 0
+    assert penalties.count(4) == 1
+
+
+def test_feasible_first_solve_keeps_merged_components_in_penalty_order() -> None:
+    first_status, penalties = plan_with_worst_first_solution(["A", "B", "C"])
+
+    assert first_status == cp_model.FEASIBLE
+    assert penalties == sorted(penalties)
+    assert penalties[:2] == [0, 1]
+
+
+def test_option_solver_stats_include_the_solve_that_found_the_option() -> None:
+    response = compute_timetable(
+        TimetableRequest(
+            term_id="T",
+            course_codes=["A", "B"],
+            preferences=PREFERENCES,
+            max_solutions=20,
+            include_solver_stats=True,
+        ),
+        SECTIONS,
+    )
+
+    first_stats = response.options[0].objective.solver_stats
+    assert first_stats is not None and first_stats.solves == 1
+    for option in response.options[1:]:
+        solver_stats = option.objective.solver_stats
+        assert solver_stats is not None
+        assert solver_stats.solves == int(option.objective.total_penalty) + 2
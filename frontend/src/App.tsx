@@ -1,9 +1,9 @@
 import { useMemo, useState } from "react";
 import { NavLink, Route, Routes } from "react-router-dom";
 import { usePrograms } from "./api/programs";
-import { useCourses } from "./api/courses";
+import { Course, useCourseDetails, useCourseSearch } from "./api/courses";
 import { useDegreePlan } from "./api/degreePlans";
-import { useTimetablePlan } from "./api/timetables";
+import { useTimetablePlanStream } from "./api/timetables";
 import { usePlanningContext } from "./planning/PlanningContext";
 
 function NavigationBar() {
@@ -104,8 +104,23 @@ function HomePage() {
 }
 
 function CompletedCoursesPage() {
-  const { data: courses, isLoading, isError } = useCourses();
   const { state, setCompletedCourseCodes } = usePlanningContext();
+  const [searchQuery, setSearchQuery] = useState("");
+  const isSearching = searchQuery.trim().length > 0;
+  const courseSearch = useCourseSearch(searchQuery);
+  const completedCourses = useCourseDetails(state.completedCourseCodes);
+  const selectedCourses: Course[] = [];
+  for (const code of state.completedCourseCodes) {
+    const course = completedCourses.courseByCode[code];
+    if (course) {
+      selectedCourses.push(course);
+    }
+  }
+  const courses: Pick<Course, "code" | "name" | "credits">[] | undefined = isSearching
+    ? courseSearch.data
+    : selectedCourses;
+  const isLoading = isSearching ? courseSearch.isLoading : completedCourses.isLoading;
+  const isError = isSearching ? courseSearch.isError : completedCourses.isError;
 
   const handleToggleCourse = (courseCode: string) => {
     const current = state.completedCourseCodes;
@@ -125,10 +140,19 @@ function CompletedCoursesPage() {
         Select the courses you have already completed. The degree planner will treat these as finished and only schedule
         the remaining requirements.
       </p>
+      <input
+        type="search"
+        value={searchQuery}
+        onChange={(event) => setSearchQuery(event.target.value)}
+        placeholder="Search by course code or name"
+        className="mb-4 w-full rounded border px-3 py-2 text-sm"
+      />
       {isLoading && <div className="text-gray-600">Loading courses.</div>}
       {isError && <div className="text-red-600">Failed to load courses.</div>}
       {!isLoading && !isError && courses && courses.length === 0 && (
-        <div className="text-gray-600">No courses found.</div>
+        <div className="text-gray-600">
+          {isSearching ? "No courses found." : "Search for a course to mark it as completed."}
+        </div>
       )}
       {!isLoading && !isError && courses && courses.length > 0 && (
         <>
@@ -225,7 +249,8 @@ function ConstraintsPage() {
         allowed_terms: allowedTerms,
         min_credits_per_term: minCredits,
         max_credits_per_term: maxCredits,
-        max_terms: maxTerms
+        max_terms: maxTerms,
+        previous_plan: state.lastDegreePlan
       },
       {
         onSuccess: (plan) => {
@@ -367,7 +392,7 @@ function DegreePlanPage() {
   const { state } = usePlanningContext();
   const plan = state.lastDegreePlan;
 
-  const timetableMutation = useTimetablePlan();
+  const timetableStream = useTimetablePlanStream();
   const [selectedTermId, setSelectedTermId] = useState<string | null>(null);
   const [loadingTermId, setLoadingTermId] = useState<string | null>(null);
 
@@ -395,25 +420,13 @@ function DegreePlanPage() {
   const [latestTimeInput, setLatestTimeInput] = useState("18:00");
   const [timingError, setTimingError] = useState<string | null>(null);
 
-  const { data: allCourses } = useCourses();
-
-  const courseByCode: Record<
-    string,
-    {
-      code: string;
-      name: string;
-      credits: number;
-    }
-  > = {};
-  if (allCourses) {
-    for (const course of allCourses) {
-      courseByCode[course.code] = {
-        code: course.code,
-        name: course.name,
-        credits: course.credits
-      };
+  const plannedCourseCodes: string[] = [];
+  if (plan) {
+    for (const term of plan.terms) {
+      plannedCourseCodes.push(...term.course_codes);
     }
   }
+  const { courseByCode } = useCourseDetails(plannedCourseCodes);
 
   const fallbackEarliestMinutes = 540;
   const fallbackLatestMinutes = 1080;
@@ -470,22 +483,27 @@ function DegreePlanPage() {
     setTimetableOptions([]);
     setSelectedTimetableIndex(null);
 
-    timetableMutation.mutate(
+    timetableStream.mutate(
       {
-        term_id: termId,
-        course_codes: courseCodes,
-        preferences: {
-          earliest_time_minutes: earliest,
-          latest_time_minutes: latest,
-          avoid_friday: avoidFridays
+        request: {
+          term_id: termId,
+          course_codes: courseCodes,
+          preferences: {
+            earliest_time_minutes: earliest,
+            latest_time_minutes: latest,
+            avoid_friday: avoidFridays
+          },
+          max_solutions: 50
         },
-        max_solutions: 50
+        onOption: (option) => {
+          setLatestTimetableTermId(termId);
+          setTimetableOptions((current) => [...current, option]);
+          setSelectedTimetableIndex((current) => current ?? 0);
+        }
       },
       {
-        onSuccess: (timetable) => {
+        onSuccess: () => {
           setLatestTimetableTermId(termId);
-          setTimetableOptions(timetable.options);
-          setSelectedTimetableIndex(timetable.options.length > 0 ? 0 : null);
         },
         onSettled: () => {
           setLoadingTermId(null);
@@ -690,7 +708,7 @@ function DegreePlanPage() {
               </div>
             ))}
           </div>
-          {timetableMutation.isError && (
+          {timetableStream.isError && (
             <div className="rounded-lg border border-red-300 bg-red-50 p-4 text-sm text-red-800">
               Failed to build timetables. Check backend logs.
             </div>
@@ -4,3 +4,23 @@ export const apiClient = axios.create({
   baseURL: "http://localhost:8000",
   timeout: 10000
 });
+
+const latestRequestControllers = new Map<string, AbortController>();
+
+export function supersedeRequest(requestKey: string): AbortSignal {
+  latestRequestControllers.get(requestKey)?.abort();
+  const controller = new AbortController();
+  latestRequestControllers.set(requestKey, controller);
+  return controller.signal;
+}
+
+export type SolverStats = {
+  solves: number;
+  wall_time_seconds: number;
+  branches: number;
+  conflicts: number;
+  variables: number;
+  constraints: number;
+  presolved_booleans: number;
+  presolved_integers: number;
+};
@@ -1,4 +1,4 @@
-import { useQuery } from "@tanstack/react-query";
+import { keepPreviousData, useQueries, useQuery } from "@tanstack/react-query";
 import { apiClient } from "./client";
 
 export type Course = {
@@ -8,14 +8,56 @@ export type Course = {
   description: string | null;
 };
 
-async function fetchCourses(): Promise<Course[]> {
-  const response = await apiClient.get<Course[]>("/courses/");
+async function fetchCourse(courseCode: string, signal: AbortSignal): Promise<Course> {
+  const response = await apiClient.get<Course>(`/courses/${encodeURIComponent(courseCode)}`, { signal });
   return response.data;
 }
 
-export function useCourses() {
+export function useCourseDetails(courseCodes: string[]) {
+  return useQueries({
+    queries: courseCodes.map((courseCode) => ({
+      queryKey: ["course", courseCode],
+      queryFn: ({ signal }) => fetchCourse(courseCode, signal),
+      staleTime: Infinity
+    })),
+    combine: (results) => {
+      const courseByCode: Record<string, Course> = {};
+      for (const result of results) {
+        if (result.data) {
+          courseByCode[result.data.code] = result.data;
+        }
+      }
+      return {
+        courseByCode,
+        isLoading: results.some((result) => result.isLoading),
+        isError: results.some((result) => result.isError)
+      };
+    }
+  });
+}
+
+export type CourseSearchResult = {
+  code: string;
+  name: string;
+  credits: number;
+  score: number;
+};
+
+async function searchCourses(query: string, limit: number, signal: AbortSignal): Promise<CourseSearchResult[]> {
+  const response = await apiClient.get<CourseSearchResult[]>("/courses/search", {
+    params: { q: query, limit },
+    signal
+  });
+  return response.data;
+}
+
+export function useCourseSearch(query: string, limit = 20) {
+  const trimmedQuery = query.trim();
   return useQuery({
-    queryKey: ["courses"],
-    queryFn: fetchCourses
+    queryKey: ["courseSearch", trimmedQuery, limit],
+    queryFn: ({ signal }) => searchCourses(trimmedQuery, limit, signal),
+    enabled: trimmedQuery.length > 0,
+    placeholderData: keepPreviousData,
+    staleTime: 30_000
   });
 }
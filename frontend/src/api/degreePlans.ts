@@ -1,5 +1,5 @@
 import { useMutation } from "@tanstack/react-query";
-import { apiClient } from "./client";
+import { apiClient, SolverStats, supersedeRequest } from "./client";
 
 export type DegreePlanTerm = {
   term_id: string;
@@ -10,12 +10,20 @@ export type DegreePlanTerm = {
 export type DegreePlanObjective = {
   status: string;
   max_term_used_index: number | null;
+  solver_stats?: SolverStats | null;
+};
+
+export type DegreePlanChanges = {
+  moved_course_codes: string[];
+  added_course_codes: string[];
+  removed_course_codes: string[];
 };
 
 export type DegreePlanResponse = {
   terms: DegreePlanTerm[];
   objective: DegreePlanObjective;
   warnings: string[];
+  changes_from_previous: DegreePlanChanges | null;
 };
 
 export type DegreePlanRequest = {
@@ -26,10 +34,14 @@ export type DegreePlanRequest = {
   min_credits_per_term: number;
   max_credits_per_term: number;
   max_terms: number | null;
+  previous_plan?: DegreePlanResponse | null;
+  include_solver_stats?: boolean;
 };
 
 async function planDegree(request: DegreePlanRequest): Promise<DegreePlanResponse> {
-  const response = await apiClient.post<DegreePlanResponse>("/plan/degree/", request);
+  const response = await apiClient.post<DegreePlanResponse>("/plan/degree/", request, {
+    signal: supersedeRequest("degreePlan")
+  });
   return response.data;
 }
 
@@ -1,5 +1,5 @@
 import { useMutation } from "@tanstack/react-query";
-import { apiClient } from "./client";
+import { apiClient, SolverStats, supersedeRequest } from "./client";
 
 export type TimetableSection = {
   section_id: string;
@@ -8,11 +8,13 @@ export type TimetableSection = {
   day_of_week: string;
   start_time_minutes: number;
   end_time_minutes: number;
+  alternative_section_ids: string[];
 };
 
 export type TimetableObjective = {
   status: string;
   total_penalty: number | null;
+  solver_stats?: SolverStats | null;
 };
 
 export type TimetableOption = {
@@ -23,8 +25,20 @@ export type TimetableOption = {
 export type TimetableResponse = {
   options: TimetableOption[];
   warnings: string[];
+  status: "COMPLETE" | "PARTIAL";
 };
 
+export type TimetableStreamEvent =
+  | {
+      event: "option";
+      option: TimetableOption;
+    }
+  | {
+      event: "summary";
+      status: "COMPLETE" | "PARTIAL";
+      warnings: string[];
+    };
+
 export type TimetablePreferences = {
   earliest_time_minutes: number | null;
   latest_time_minutes: number | null;
@@ -36,11 +50,61 @@ export type TimetableRequest = {
   course_codes: string[];
   preferences: TimetablePreferences;
   max_solutions?: number | null;
+  time_budget_seconds?: number | null;
+  include_solver_stats?: boolean;
+};
+
+export type CompactTimetableResponse = {
+  format: "compact";
+  status: "COMPLETE" | "PARTIAL";
+  warnings: string[];
+  sections: {
+    section_id: string[];
+    course_code: string[];
+    kind: string[];
+    day_of_week: string[];
+    start_time_minutes: number[];
+    end_time_minutes: number[];
+    alternative_section_ids: string[][];
+  };
+  options: {
+    section_indices: number[][];
+    total_penalty: (number | null)[];
+    status: string[];
+    solver_stats?: (SolverStats | null)[];
+  };
 };
 
+export function decodeCompactTimetable(payload: CompactTimetableResponse): TimetableResponse {
+  const columns = payload.sections;
+  const sections: TimetableSection[] = columns.section_id.map((sectionId, index) => ({
+    section_id: sectionId,
+    course_code: columns.course_code[index],
+    kind: columns.kind[index],
+    day_of_week: columns.day_of_week[index],
+    start_time_minutes: columns.start_time_minutes[index],
+    end_time_minutes: columns.end_time_minutes[index],
+    alternative_section_ids: columns.alternative_section_ids[index]
+  }));
+
+  const options: TimetableOption[] = payload.options.section_indices.map((sectionIndices, optionIndex) => ({
+    sections: sectionIndices.map((sectionIndex) => sections[sectionIndex]),
+    objective: {
+      status: payload.options.status[optionIndex],
+      total_penalty: payload.options.total_penalty[optionIndex],
+      solver_stats: payload.options.solver_stats?.[optionIndex] ?? null
+    }
+  }));
+
+  return { options, warnings: payload.warnings, status: payload.status };
+}
+
 async function planTimetable(request: TimetableRequest): Promise<TimetableResponse> {
-  const response = await apiClient.post<TimetableResponse>("/plan/timetable/", request);
-  return response.data;
+  const response = await apiClient.post<CompactTimetableResponse>("/plan/timetable/", request, {
+    params: { format: "compact" },
+    signal: supersedeRequest("timetablePlan")
+  });
+  return decodeCompactTimetable(response.data);
 }
 
 export function useTimetablePlan() {
@@ -48,3 +112,66 @@ export function useTimetablePlan() {
     mutationFn: planTimetable
   });
 }
+
+export async function streamTimetable(
+  request: TimetableRequest,
+  onOption: (option: TimetableOption) => void
+): Promise<TimetableResponse> {
+  const signal = supersedeRequest("timetableStream");
+  const response = await fetch(`${apiClient.defaults.baseURL}/plan/timetable/stream`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(request),
+    signal
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`Timetable stream failed with status ${response.status}`);
+  }
+
+  const result: TimetableResponse = { options: [], warnings: [], status: "COMPLETE" };
+  const handleLine = (line: string) => {
+    if (signal.aborted || !line.trim()) {
+      return;
+    }
+    const event = JSON.parse(line) as TimetableStreamEvent;
+    if (event.event === "option") {
+      result.options.push(event.option);
+      onOption(event.option);
+    } else {
+      result.status = event.status;
+      result.warnings = event.warnings;
+    }
+  };
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffered = "";
+  while (true) {
+    if (signal.aborted) {
+      await reader.cancel();
+      throw new DOMException("Timetable stream was superseded.", "AbortError");
+    }
+    const { done, value } = await reader.read();
+    if (done) {
+      break;
+    }
+    buffered += decoder.decode(value, { stream: true });
+    const lines = buffered.split("\n");
+    buffered = lines.pop() ?? "";
+    lines.forEach(handleLine);
+  }
+  handleLine(buffered + decoder.decode());
+
+  return result;
+}
+
+type TimetableStreamVariables = {
+  request: TimetableRequest;
+  onOption: (option: TimetableOption) => void;
+};
+
+export function useTimetablePlanStream() {
+  return useMutation({
+    mutationFn: (variables: TimetableStreamVariables) => streamTimetable(variables.request, variables.onOption)
+  });
+}